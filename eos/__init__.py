@@ -20,15 +20,16 @@
 
 
 __all__ = [
-    'JsonCacheHandler', 'TypeFetchError',
-    'EffectMode', 'Restriction', 'State',
-    'JsonDataHandler', 'SQLiteDataHandler',
-    'Fit',
+    'BinaryCacheHandler', 'JsonCacheHandler', 'TypeFetchError',
+    'EffectMode', 'Restriction', 'RestrictionCost', 'State',
+    'JsonDataHandler', 'SQLiteDataHandler', 'StreamingJsonDataHandler',
+    'CharacterProfile', 'Fit',
     'Booster', 'Character', 'Charge', 'Drone', 'EffectBeacon', 'FighterSquad',
     'Implant', 'ModuleHigh', 'ModuleMid', 'ModuleLow', 'Rig', 'Ship', 'Skill',
     'Stance', 'Subsystem',
     'NoSuchAbilityError', 'NoSuchSideEffectError',
     'SlotTakenError',
+    'SpecFormatError',
     'ValidationError',
     'SolarSystem',
     'SourceManager',
@@ -37,14 +38,19 @@ __all__ = [
 __version__ = '0.0.0.dev10'
 
 
+from eos.cache_handler import BinaryCacheHandler
 from eos.cache_handler import JsonCacheHandler
 from eos.cache_handler import TypeFetchError
+from eos.character_profile import CharacterProfile
 from eos.const.eos import EffectMode
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eos import State
 from eos.data_handler import JsonDataHandler
 from eos.data_handler import SQLiteDataHandler
+from eos.data_handler import StreamingJsonDataHandler
 from eos.fit import Fit
+from eos.fit_spec import SpecFormatError
 from eos.item import Booster
 from eos.item import Character
 from eos.item import Charge
@@ -0,0 +1,181 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import get_context
+
+from eos.fit import Fit
+from eos.solar_system import SolarSystem
+from eos.source import Source
+from eos.source import SourceManager
+from eos.stats_container import ResourceStats
+from eos.util.default import DEFAULT
+from eos.util.repr import make_repr_str
+from .exception import UnknownStatError
+
+
+def _get_resource_stats(stat_name):
+    def get_stats(fit):
+        stats = getattr(fit.stats, stat_name)
+        return ResourceStats(used=stats.used, output=stats.output)
+    return get_stats
+
+
+# Functions which fetch stats from fit, keyed by stat name
+STAT_GETTERS = {
+    'dps': lambda fit: fit.stats.get_dps(),
+    'volley': lambda fit: fit.stats.get_volley(),
+    'hp': lambda fit: fit.stats.hp,
+    'ehp': lambda fit: fit.stats.get_ehp(),
+    'worst_case_ehp': lambda fit: fit.stats.worst_case_ehp,
+    'cpu': _get_resource_stats('cpu'),
+    'powergrid': _get_resource_stats('powergrid'),
+    'calibration': _get_resource_stats('calibration'),
+    'dronebay': _get_resource_stats('dronebay'),
+    'drone_bandwidth': _get_resource_stats('drone_bandwidth'),
+    'high_slots': lambda fit: fit.stats.high_slots,
+    'mid_slots': lambda fit: fit.stats.mid_slots,
+    'low_slots': lambda fit: fit.stats.low_slots,
+    'valid': lambda fit: fit.is_valid()}
+
+# Quantity of fit specifications sent to worker at once
+DEFAULT_CHUNK_SIZE = 50
+
+
+class BatchEvaluator:
+    """Evaluates stats of many fits, optionally in process pool.
+
+    Worker processes are forked when evaluation is requested for the first
+    time, and are reused by subsequent evaluations until evaluator is closed.
+    Being forked, workers share already loaded data of the source with parent
+    process, so the source should be added to source manager and warmed up
+    before that. Parallel evaluation is available only on platforms which
+    support fork start method.
+
+    Args:
+        stats: Iterable with names of stats to evaluate for every fit. Refer to
+            STAT_GETTERS for list of available stats.
+        source (optional): Source to use for fits. When not specified, source
+            which is set as default in source manager will be used.
+        workers (optional): If more than 1, fits are evaluated in process pool
+            with this quantity of worker processes. By default, they are
+            evaluated in current process.
+        chunk_size (optional): Quantity of fit specifications sent to worker
+            process at once.
+
+    Raises:
+        UnknownStatError: If unknown stat name is passed.
+    """
+
+    def __init__(
+            self, stats, source=DEFAULT, workers=None,
+            chunk_size=DEFAULT_CHUNK_SIZE):
+        stats = tuple(stats)
+        for stat_name in stats:
+            if stat_name not in STAT_GETTERS:
+                raise UnknownStatError(stat_name)
+        if source is DEFAULT:
+            source = SourceManager.default
+        elif not isinstance(source, Source) and source is not None:
+            source = SourceManager.get(source)
+        self.stats = stats
+        self.source = source
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.__executor = None
+
+    def evaluate(self, specs):
+        """Evaluate stats of fits.
+
+        Args:
+            specs: Iterable with fit specifications, made by Fit.to_spec().
+                Iterable is consumed lazily, as results are requested.
+
+        Yields:
+            Dictionaries in {stat name: stat value} format, in the same order
+            as fit specifications were passed.
+        """
+        if self.workers is None or self.workers <= 1:
+            for spec in specs:
+                yield _evaluate_fit(spec, self.source, self.stats)
+            return
+        executor = self.__get_executor()
+        specs = iter(specs)
+        # Keep limited quantity of chunks in flight, to avoid consuming whole
+        # iterable of specifications upfront
+        pending = deque()
+        while True:
+            while len(pending) < self.workers * 2:
+                chunk = list(islice(specs, self.chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_evaluate_chunk, chunk))
+            if not pending:
+                return
+            for result in pending.popleft().result():
+                yield result
+
+    def close(self):
+        """Shut worker processes down."""
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def __get_executor(self):
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=get_context('fork'),
+                initializer=_init_worker,
+                initargs=(self.source, self.stats))
+        return self.__executor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        spec = ['stats', 'workers', 'chunk_size']
+        return make_repr_str(self, spec)
+
+
+def _evaluate_fit(spec, source, stats):
+    fit = Fit.from_spec(spec, solar_system=SolarSystem(source=source))
+    return {s: STAT_GETTERS[s](fit) for s in stats}
+
+
+# Source and stat names used by process pool worker
+_worker_source = None
+_worker_stats = None
+
+
+def _init_worker(source, stats):
+    global _worker_source, _worker_stats
+    _worker_source = source
+    _worker_stats = stats
+
+
+def _evaluate_chunk(specs):
+    return [_evaluate_fit(s, _worker_source, _worker_stats) for s in specs]
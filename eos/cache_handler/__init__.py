@@ -19,6 +19,7 @@
 # ==============================================================================
 
 
+from .binary_cache_handler import BinaryCacheHandler
 from .exception import AttrFetchError
 from .exception import EffectFetchError
 from .exception import TypeFetchError
@@ -0,0 +1,484 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import mmap
+import os
+import struct
+from logging import getLogger
+
+from eos.eve_obj.attribute import AttrFactory
+from eos.eve_obj.effect import EffectFactory
+from eos.eve_obj.modifier import DogmaModifier
+from eos.eve_obj.type import AbilityData
+from eos.eve_obj.type import TypeFactory
+from eos.util.repr import make_repr_str
+from .base import BaseCacheHandler
+from .exception import AttrFetchError
+from .exception import EffectFetchError
+from .exception import TypeFetchError
+from .storage import ObjectStorage
+
+
+logger = getLogger(__name__)
+
+
+MAGIC = b'EOSBIN'
+FORMAT_VERSION = 1
+# Value used in place of None for integer fields
+NULL = -2 ** 31
+
+# Format: magic, format version, fingerprint length in bytes
+HEADER = struct.Struct('<6sHI')
+# Format: section offset, record count
+SECTION = struct.Struct('<QI')
+# Format: attribute ID, max attribute ID, default value, flags
+ATTR = struct.Struct('<iidB')
+# Format: effect ID, category ID, flags, duration attribute ID, discharge
+# attribute ID, range attribute ID, falloff attribute ID, tracking speed
+# attribute ID, fitting usage chance attribute ID, build status, modifier pool
+# start, modifier count
+EFFECT = struct.Struct('<iiBiiiiiiiII')
+# Format: target filter, target domain, target filter extra argument, target
+# attribute ID, operator, source attribute ID
+MODIFIER = struct.Struct('<iiiiii')
+# Format: type ID, group ID, category ID, default effect ID, attribute pool
+# start, attribute count, effect pool start, effect count, ability pool start,
+# ability count
+TYPE = struct.Struct('<iiiiIIIIII')
+# Format: attribute ID, attribute value
+TYPE_ATTR = struct.Struct('<id')
+# Format: effect ID
+TYPE_EFFECT = struct.Struct('<i')
+# Format: ability ID, cooldown time, charge quantity
+TYPE_ABILITY = struct.Struct('<idd')
+# Every record which can be looked up by ID has it as first field
+RECORD_ID = struct.Struct('<i')
+
+# Sections in the order they are stored in section table
+SECTIONS = (
+    ('attrs', ATTR),
+    ('effects', EFFECT),
+    ('modifiers', MODIFIER),
+    ('types', TYPE),
+    ('type_attrs', TYPE_ATTR),
+    ('type_effects', TYPE_EFFECT),
+    ('type_abilities', TYPE_ABILITY))
+
+ATTR_HIGH_IS_GOOD = 1 << 0
+ATTR_STACKABLE = 1 << 1
+ATTR_HAS_DEFAULT = 1 << 2
+EFFECT_OFFENSIVE = 1 << 0
+EFFECT_ASSISTANCE = 1 << 1
+
+
+class BinaryCacheHandler(BaseCacheHandler):
+    """Binary cache storage implementation.
+
+    This cache handler implements persistent cache store in the form of binary
+    file with fixed-width records, sorted by ID, and pools of variable-length
+    data referenced from records by offset. The file is memory-mapped read-only,
+    thus when process which opened it is forked, raw data is shared between
+    child processes. Eve objects are composed from raw data when they are
+    requested for the first time and stored in memory afterwards, which provides
+    fast initialization and low memory footprint, at the cost of a bit slower
+    first access.
+
+    Args:
+        cache_path: File path where persistent cache will be stored (.bin).
+        max_types (optional): Max quantity of item types kept in memory. Item
+            types which were not used for the longest time are dropped when
+            limit is exceeded. Not limited by default.
+    """
+
+    def __init__(self, cache_path, max_types=None):
+        self._cache_path = os.path.abspath(cache_path)
+        self.__mmap = None
+        # Format: {section name: (section offset, record count)}
+        self.__sections = {}
+        # Initialize storage for objects which have been composed already
+        self.__type_storage = ObjectStorage(self.__load_type, max_types)
+        self.__attr_storage = ObjectStorage(self.__load_attr)
+        self.__effect_storage = ObjectStorage(self.__load_effect)
+        self.__fingerprint = None
+        # Map persistent cache, if possible
+        self.__load_persistent_cache()
+
+    def get_type(self, type_id):
+        try:
+            type_id = int(type_id)
+        except TypeError as e:
+            raise TypeFetchError(type_id) from e
+        try:
+            item_type = self.__type_storage.get(type_id)
+        except KeyError as e:
+            raise TypeFetchError(type_id) from e
+        return item_type
+
+    def get_attr(self, attr_id):
+        try:
+            attr_id = int(attr_id)
+        except TypeError as e:
+            raise AttrFetchError(attr_id) from e
+        try:
+            attr = self.__attr_storage.get(attr_id)
+        except KeyError as e:
+            raise AttrFetchError(attr_id) from e
+        return attr
+
+    def get_effect(self, effect_id):
+        try:
+            effect_id = int(effect_id)
+        except TypeError as e:
+            raise EffectFetchError(effect_id) from e
+        try:
+            effect = self.__effect_storage.get(effect_id)
+        except KeyError as e:
+            raise EffectFetchError(effect_id) from e
+        return effect
+
+    def get_fingerprint(self):
+        return self.__fingerprint
+
+    def get_stats(self):
+        """Get access statistics of object storages.
+
+        Returns:
+            Dictionary in {object kind: storage stats} format, where kind is
+            one of 'types', 'attrs' and 'effects'.
+        """
+        return {
+            'types': self.__type_storage.stats,
+            'attrs': self.__attr_storage.stats,
+            'effects': self.__effect_storage.stats}
+
+    def __load_persistent_cache(self):
+        # If cache file doesn't exist, bail out - we have nothing to read
+        if not os.path.exists(self._cache_path):
+            return
+        try:
+            with open(self._cache_path, 'rb') as file:
+                cache_map = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ)
+            fingerprint, sections = self.__read_header(cache_map)
+        except KeyboardInterrupt:
+            raise
+        # If file is empty, its header is malformed, or anything else bad
+        # happens, leave cache empty
+        except:
+            msg = 'error during reading cache'
+            logger.error(msg)
+        else:
+            self.__update_memory_cache(cache_map, fingerprint, sections)
+
+    def update_cache(self, eve_objects, fingerprint):
+        types, attrs, effects = eve_objects
+        self.__update_persistent_cache(types, attrs, effects, fingerprint)
+        self.__load_persistent_cache()
+
+    def __update_persistent_cache(self, types, attrs, effects, fingerprint):
+        """Write passed data to persistent storage."""
+        # Format: {section name: [packed records]}
+        section_data = {name: [] for name, _ in SECTIONS}
+        for attr in sorted(attrs, key=lambda a: a.id):
+            section_data['attrs'].append(self.__attr_compress(attr))
+        for effect in sorted(effects, key=lambda e: e.id):
+            section_data['effects'].append(self.__effect_compress(
+                effect, section_data['modifiers']))
+        for item_type in sorted(types, key=lambda t: t.id):
+            section_data['types'].append(self.__type_compress(
+                item_type, section_data['type_attrs'],
+                section_data['type_effects'], section_data['type_abilities']))
+        fingerprint_bytes = fingerprint.encode('utf-8')
+        # Sections are stored right after header, fingerprint and section table
+        offset = (
+            HEADER.size + len(fingerprint_bytes) +
+            SECTION.size * len(SECTIONS))
+        section_table = []
+        for name, record_struct in SECTIONS:
+            records = section_data[name]
+            section_table.append(SECTION.pack(offset, len(records)))
+            offset += record_struct.size * len(records)
+        cache_folder = os.path.dirname(self._cache_path)
+        if os.path.isdir(cache_folder) is not True:
+            os.makedirs(cache_folder, mode=0o755)
+        # Write to temporary file and replace cache file with it, to make sure
+        # processes which have old file mapped are not affected
+        tmp_path = '{}.tmp'.format(self._cache_path)
+        with open(tmp_path, 'wb') as file:
+            file.write(HEADER.pack(
+                MAGIC, FORMAT_VERSION, len(fingerprint_bytes)))
+            file.write(fingerprint_bytes)
+            file.write(b''.join(section_table))
+            for name, _ in SECTIONS:
+                file.write(b''.join(section_data[name]))
+        os.replace(tmp_path, self._cache_path)
+
+    def __update_memory_cache(self, cache_map, fingerprint, sections):
+        """Replace existing memory cache data with passed data."""
+        # Clear storage to make sure objects composed from old data are gone
+        self.__type_storage.clear()
+        self.__attr_storage.clear()
+        self.__effect_storage.clear()
+        if self.__mmap is not None:
+            self.__mmap.close()
+        self.__mmap = cache_map
+        self.__sections = sections
+        self.__fingerprint = fingerprint
+
+    @staticmethod
+    def __read_header(cache_map):
+        """Read cache metadata from passed memory map.
+
+        Returns:
+            Tuple with fingerprint and section data in {section name: (section
+            offset, record count)} format.
+
+        Raises:
+            ValueError: If cache format is not supported.
+        """
+        magic, version, fingerprint_len = HEADER.unpack_from(cache_map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError('unsupported cache format')
+        offset = HEADER.size
+        fingerprint = cache_map[offset:offset + fingerprint_len].decode('utf-8')
+        offset += fingerprint_len
+        sections = {}
+        for name, record_struct in SECTIONS:
+            section_offset, count = SECTION.unpack_from(cache_map, offset)
+            offset += SECTION.size
+            if section_offset + count * record_struct.size > len(cache_map):
+                raise ValueError('section {} is truncated'.format(name))
+            sections[name] = (section_offset, count)
+        return fingerprint, sections
+
+    # Loaders which compose objects on demand; raise KeyError when object
+    # cannot be found
+    def __load_type(self, type_id):
+        return self.__type_decompress(
+            self.__find_record('types', TYPE, type_id))
+
+    def __load_attr(self, attr_id):
+        return self.__attr_decompress(
+            self.__find_record('attrs', ATTR, attr_id))
+
+    def __load_effect(self, effect_id):
+        return self.__effect_decompress(
+            self.__find_record('effects', EFFECT, effect_id))
+
+    def __find_record(self, section_name, record_struct, record_id):
+        """Find record by its ID via binary search.
+
+        Returns:
+            Unpacked record.
+
+        Raises:
+            KeyError: If record cannot be found.
+        """
+        section_offset, count = self.__sections[section_name]
+        cache_map = self.__mmap
+        size = record_struct.size
+        low = 0
+        high = count
+        while low < high:
+            mid = (low + high) // 2
+            mid_offset = section_offset + mid * size
+            mid_id = RECORD_ID.unpack_from(cache_map, mid_offset)[0]
+            if mid_id < record_id:
+                low = mid + 1
+            elif mid_id > record_id:
+                high = mid
+            else:
+                return record_struct.unpack_from(cache_map, mid_offset)
+        raise KeyError(record_id)
+
+    def __pool_iter(self, section_name, record_struct, start, count):
+        """Iterate over unpacked records of pool section."""
+        section_offset = self.__sections[section_name][0]
+        return record_struct.iter_unpack(self.__mmap[
+            section_offset + start * record_struct.size:
+            section_offset + (start + count) * record_struct.size])
+
+    # Entity compression/decompression methods
+    def __type_compress(self, item_type, attr_pool, effect_pool, ability_pool):
+        """Pack item type into binary record, filling passed pools."""
+        if item_type.default_effect is not None:
+            default_effect_id = item_type.default_effect.id
+        else:
+            default_effect_id = None
+        attr_start = len(attr_pool)
+        for attr_id, value in sorted(item_type.attrs.items()):
+            attr_pool.append(TYPE_ATTR.pack(attr_id, value))
+        effect_start = len(effect_pool)
+        for effect_id in sorted(item_type.effects):
+            effect_pool.append(TYPE_EFFECT.pack(effect_id))
+        ability_start = len(ability_pool)
+        for ability_id, ability_data in sorted(
+            item_type.abilities_data.items()
+        ):
+            ability_pool.append(TYPE_ABILITY.pack(
+                ability_id, ability_data.cooldown_time,
+                ability_data.charge_quantity))
+        return TYPE.pack(
+            item_type.id,
+            _null(item_type.group_id),
+            _null(item_type.category_id),
+            _null(default_effect_id),
+            attr_start, len(attr_pool) - attr_start,
+            effect_start, len(effect_pool) - effect_start,
+            ability_start, len(ability_pool) - ability_start)
+
+    def __type_decompress(self, type_data):
+        """Reconstruct item type from binary record."""
+        (
+            type_id, group_id, category_id, default_effect_id,
+            attr_start, attr_count, effect_start, effect_count,
+            ability_start, ability_count
+        ) = type_data
+        default_effect_id = _unnull(default_effect_id)
+        if default_effect_id is None:
+            default_effect = None
+        else:
+            default_effect = self.get_effect(default_effect_id)
+        item_type = TypeFactory.make(
+            type_id=type_id,
+            group_id=_unnull(group_id),
+            category_id=_unnull(category_id),
+            attrs={k: v for k, v in self.__pool_iter(
+                'type_attrs', TYPE_ATTR, attr_start, attr_count)},
+            effects=tuple(self.get_effect(eid) for eid, in self.__pool_iter(
+                'type_effects', TYPE_EFFECT, effect_start, effect_count)),
+            default_effect=default_effect,
+            abilities_data={
+                k: AbilityData(*v) for k, *v in self.__pool_iter(
+                    'type_abilities', TYPE_ABILITY,
+                    ability_start, ability_count)})
+        return item_type
+
+    def __attr_compress(self, attr):
+        """Pack attribute into binary record."""
+        flags = 0
+        if attr.high_is_good:
+            flags |= ATTR_HIGH_IS_GOOD
+        if attr.stackable:
+            flags |= ATTR_STACKABLE
+        if attr.default_value is not None:
+            flags |= ATTR_HAS_DEFAULT
+            default_value = attr.default_value
+        else:
+            default_value = 0
+        return ATTR.pack(
+            attr.id, _null(attr.max_attr_id), default_value, flags)
+
+    def __attr_decompress(self, attr_data):
+        """Reconstruct attribute from binary record."""
+        attr_id, max_attr_id, default_value, flags = attr_data
+        attr = AttrFactory.make(
+            attr_id=attr_id,
+            max_attr_id=_unnull(max_attr_id),
+            default_value=default_value if flags & ATTR_HAS_DEFAULT else None,
+            high_is_good=bool(flags & ATTR_HIGH_IS_GOOD),
+            stackable=bool(flags & ATTR_STACKABLE))
+        return attr
+
+    def __effect_compress(self, effect, modifier_pool):
+        """Pack effect into binary record, filling passed modifier pool."""
+        flags = 0
+        if effect.is_offensive:
+            flags |= EFFECT_OFFENSIVE
+        if effect.is_assistance:
+            flags |= EFFECT_ASSISTANCE
+        modifier_start = len(modifier_pool)
+        for modifier in effect.modifiers:
+            modifier_pool.append(self.__modifier_compress(modifier))
+        return EFFECT.pack(
+            effect.id,
+            _null(effect.category_id),
+            flags,
+            _null(effect.duration_attr_id),
+            _null(effect.discharge_attr_id),
+            _null(effect.range_attr_id),
+            _null(effect.falloff_attr_id),
+            _null(effect.tracking_speed_attr_id),
+            _null(effect.fitting_usage_chance_attr_id),
+            _null(effect.build_status),
+            modifier_start, len(modifier_pool) - modifier_start)
+
+    def __effect_decompress(self, effect_data):
+        """Reconstruct effect from binary record."""
+        (
+            effect_id, category_id, flags, duration_attr_id,
+            discharge_attr_id, range_attr_id, falloff_attr_id,
+            tracking_speed_attr_id, fitting_usage_chance_attr_id,
+            build_status, modifier_start, modifier_count
+        ) = effect_data
+        effect = EffectFactory.make(
+            effect_id=effect_id,
+            category_id=_unnull(category_id),
+            is_offensive=bool(flags & EFFECT_OFFENSIVE),
+            is_assistance=bool(flags & EFFECT_ASSISTANCE),
+            duration_attr_id=_unnull(duration_attr_id),
+            discharge_attr_id=_unnull(discharge_attr_id),
+            range_attr_id=_unnull(range_attr_id),
+            falloff_attr_id=_unnull(falloff_attr_id),
+            tracking_speed_attr_id=_unnull(tracking_speed_attr_id),
+            fitting_usage_chance_attr_id=_unnull(fitting_usage_chance_attr_id),
+            build_status=_unnull(build_status),
+            modifiers=tuple(
+                self.__modifier_decompress(md)
+                for md in self.__pool_iter(
+                    'modifiers', MODIFIER, modifier_start, modifier_count)))
+        return effect
+
+    def __modifier_compress(self, modifier):
+        """Pack dogma modifier into binary record."""
+        return MODIFIER.pack(
+            _null(modifier.tgt_filter),
+            _null(modifier.tgt_domain),
+            _null(modifier.tgt_filter_extra_arg),
+            _null(modifier.tgt_attr_id),
+            _null(modifier.operator),
+            _null(modifier.src_attr_id))
+
+    def __modifier_decompress(self, modifier_data):
+        """Reconstruct dogma modifier from binary record."""
+        modifier = DogmaModifier(
+            tgt_filter=_unnull(modifier_data[0]),
+            tgt_domain=_unnull(modifier_data[1]),
+            tgt_filter_extra_arg=_unnull(modifier_data[2]),
+            tgt_attr_id=_unnull(modifier_data[3]),
+            operator=_unnull(modifier_data[4]),
+            src_attr_id=_unnull(modifier_data[5]))
+        return modifier
+
+    # Auxiliary methods
+    def __repr__(self):
+        spec = [['cache_path', '_cache_path']]
+        return make_repr_str(self, spec)
+
+
+def _null(value):
+    """Convert optional integer into form which can be stored in record."""
+    return NULL if value is None else value
+
+
+def _unnull(value):
+    """Convert integer taken from record back into optional integer."""
+    return None if value == NULL else value
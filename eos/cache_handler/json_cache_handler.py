@@ -34,6 +34,7 @@ from .base import BaseCacheHandler
 from .exception import AttrFetchError
 from .exception import EffectFetchError
 from .exception import TypeFetchError
+from .storage import ObjectStorage
 
 
 logger = getLogger(__name__)
@@ -47,16 +48,32 @@ class JsonCacheHandler(BaseCacheHandler):
     it provides extremely fast access, but has subpar initialization time and
     memory consumption.
 
+    In lazy mode, only raw data is loaded into memory, and eve objects are
+    composed when they are requested for the first time. Item type storage can
+    be limited in this mode, in which case item types which were not used for
+    the longest time are dropped and composed again when requested.
+
     Args:
         cache_path: File path where persistent cache will be stored (.json.bz2).
+        lazy (optional): Compose eve objects on first access instead of doing
+            it when data is loaded. False by default.
+        max_types (optional): Max quantity of item types kept in memory in lazy
+            mode. Not limited by default.
     """
 
-    def __init__(self, cache_path):
+    def __init__(self, cache_path, lazy=False, max_types=None):
         self._cache_path = os.path.abspath(cache_path)
+        self._lazy = lazy
+        # Raw data, used only in lazy mode
+        # Format: {object ID: compressed object data}
+        self.__type_data = {}
+        self.__attr_data = {}
+        self.__effect_data = {}
         # Initialize storage for objects
-        self.__type_storage = {}
-        self.__attr_storage = {}
-        self.__effect_storage = {}
+        self.__type_storage = ObjectStorage(
+            self.__load_type, max_types if lazy else None)
+        self.__attr_storage = ObjectStorage(self.__load_attr)
+        self.__effect_storage = ObjectStorage(self.__load_effect)
         self.__fingerprint = None
         # Fill memory cache with data, if possible
         self.__load_persistent_cache()
@@ -67,7 +84,7 @@ class JsonCacheHandler(BaseCacheHandler):
         except TypeError as e:
             raise TypeFetchError(type_id) from e
         try:
-            item_type = self.__type_storage[type_id]
+            item_type = self.__type_storage.get(type_id)
         except KeyError as e:
             raise TypeFetchError(type_id) from e
         return item_type
@@ -78,7 +95,7 @@ class JsonCacheHandler(BaseCacheHandler):
         except TypeError as e:
             raise AttrFetchError(attr_id) from e
         try:
-            attr = self.__attr_storage[attr_id]
+            attr = self.__attr_storage.get(attr_id)
         except KeyError as e:
             raise AttrFetchError(attr_id) from e
         return attr
@@ -89,7 +106,7 @@ class JsonCacheHandler(BaseCacheHandler):
         except TypeError as e:
             raise EffectFetchError(effect_id) from e
         try:
-            effect = self.__effect_storage[effect_id]
+            effect = self.__effect_storage.get(effect_id)
         except KeyError as e:
             raise EffectFetchError(effect_id) from e
         return effect
@@ -97,6 +114,18 @@ class JsonCacheHandler(BaseCacheHandler):
     def get_fingerprint(self):
         return self.__fingerprint
 
+    def get_stats(self):
+        """Get access statistics of object storages.
+
+        Returns:
+            Dictionary in {object kind: storage stats} format, where kind is
+            one of 'types', 'attrs' and 'effects'.
+        """
+        return {
+            'types': self.__type_storage.stats,
+            'attrs': self.__attr_storage.stats,
+            'effects': self.__effect_storage.stats}
+
     def __load_persistent_cache(self):
         # If cache file doesn't exist, bail out - we have nothing to read
         if not os.path.exists(self._cache_path):
@@ -141,18 +170,43 @@ class JsonCacheHandler(BaseCacheHandler):
         self.__type_storage.clear()
         self.__attr_storage.clear()
         self.__effect_storage.clear()
-        # Process effects first, as item types rely on effects being available
-        for effect_data in cache_data['effects']:
-            effect = self.__effect_decompress(effect_data)
-            self.__effect_storage[effect.id] = effect
-        for type_data in cache_data['types']:
-            item_type = self.__type_decompress(type_data)
-            self.__type_storage[item_type.id] = item_type
-        for attr_data in cache_data['attrs']:
-            attr = self.__attr_decompress(attr_data)
-            self.__attr_storage[attr.id] = attr
+        self.__type_data.clear()
+        self.__attr_data.clear()
+        self.__effect_data.clear()
+        if self._lazy:
+            # Index raw data by ID, objects will be composed out of it on
+            # demand
+            for effect_data in cache_data['effects']:
+                self.__effect_data[effect_data[0]] = effect_data
+            for type_data in cache_data['types']:
+                self.__type_data[type_data[0]] = type_data
+            for attr_data in cache_data['attrs']:
+                self.__attr_data[attr_data[0]] = attr_data
+        else:
+            # Process effects first, as item types rely on effects being
+            # available
+            for effect_data in cache_data['effects']:
+                effect = self.__effect_decompress(effect_data)
+                self.__effect_storage.add(effect.id, effect)
+            for type_data in cache_data['types']:
+                item_type = self.__type_decompress(type_data)
+                self.__type_storage.add(item_type.id, item_type)
+            for attr_data in cache_data['attrs']:
+                attr = self.__attr_decompress(attr_data)
+                self.__attr_storage.add(attr.id, attr)
         self.__fingerprint = cache_data['fingerprint']
 
+    # Loaders which compose objects on demand; raise KeyError when object
+    # cannot be found
+    def __load_type(self, type_id):
+        return self.__type_decompress(self.__type_data[type_id])
+
+    def __load_attr(self, attr_id):
+        return self.__attr_decompress(self.__attr_data[attr_id])
+
+    def __load_effect(self, effect_id):
+        return self.__effect_decompress(self.__effect_data[effect_id])
+
     # Entity compression/decompression methods
     def __type_compress(self, item_type):
         """Compress item type into python primitives."""
@@ -269,5 +323,5 @@ class JsonCacheHandler(BaseCacheHandler):
 
     # Auxiliary methods
     def __repr__(self):
-        spec = [['cache_path', '_cache_path']]
+        spec = [['cache_path', '_cache_path'], ['lazy', '_lazy']]
         return make_repr_str(self, spec)
@@ -0,0 +1,56 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos.util.lru_storage import LruStorage
+
+
+class ObjectStorage(LruStorage):
+    """Keeps eve objects composed by cache handler.
+
+    Objects are requested from loader when they are accessed for the first time,
+    and are kept in storage afterwards. If storage size is limited, objects
+    which were not accessed for the longest time are dropped from it when limit
+    is exceeded.
+
+    Args:
+        loader: Callable which takes object ID and returns composed object, or
+            raises KeyError if there's no data for the object.
+        max_size (optional): Max quantity of objects kept in storage. If not
+            specified, storage size is not limited.
+    """
+
+    def __init__(self, loader, max_size=None):
+        LruStorage.__init__(self, max_size)
+        self.__loader = loader
+
+    def get(self, obj_id):
+        """Get object with passed ID.
+
+        Raises:
+            KeyError: If object cannot be found.
+        """
+        try:
+            return LruStorage.get(self, obj_id)
+        except KeyError:
+            pass
+        obj = self.__loader(obj_id)
+        self.add(obj_id, obj)
+        return obj
@@ -21,3 +21,4 @@
 
 from .map import MutableAttrMap
 from .service import CalculationService
+from .snapshot import AttrSnapshot
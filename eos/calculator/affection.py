@@ -73,22 +73,32 @@ class AffectionRegister:
         # Format: {affectee item: {affectors}}
         self.__affector_item_active = KeyedStorage()
 
+        # The same affectors as above, but additionally keyed by target
+        # attribute ID, to find affectors of specific attribute quickly
+        # Format: {(affectee item, target attribute ID): {affectors}}
+        self.__affector_item_active_attr = KeyedStorage()
+
+        # Storages below are keyed by target attribute ID in addition to
+        # affectee-related data, since affectors are always requested for
+        # specific attribute
+
         # Affectors influencing all items belonging to certain domain
-        # Format: {(fit, domain): {affectors}}
+        # Format: {(fit, domain, target attribute ID): {affectors}}
         self.__affector_domain = KeyedStorage()
 
         # Affectors influencing items belonging to certain domain and group
-        # Format: {(fit, domain, group ID): {affectors}}
+        # Format: {(fit, domain, group ID, target attribute ID): {affectors}}
         self.__affector_domain_group = KeyedStorage()
 
         # Affectors influencing items belonging to certain domain and having
         # certain skill requirement
-        # Format: {(fit, domain, skill type ID): {affectors}}
+        # Format: {(fit, domain, skill type ID, target attribute ID):
+        # {affectors}}
         self.__affector_domain_skillrq = KeyedStorage()
 
         # Affectors influencing owner-modifiable items which have certain skill
         # requirement
-        # Format: {(fit, skill type ID): {affectors}}
+        # Format: {(fit, skill type ID, target attribute ID): {affectors}}
         self.__affector_owner_skillrq = KeyedStorage()
 
     # Helpers for affectee getter - they find map and get data from it according
@@ -251,7 +261,7 @@ class AffectionRegister:
         if awaitable_to_activate:
             self.__affector_item_awaitable.rm_data_set(
                 affectee_fit, awaitable_to_activate)
-            self.__affector_item_active.add_data_set(
+            self.__activate_item_affectors(
                 affectee_item, awaitable_to_activate)
         # Other
         other_to_activate = set()
@@ -263,8 +273,7 @@ class AffectionRegister:
         # Just add affectors to active storage, 'other' affectors should never
         # be removed from 'other'-specific storage
         if other_to_activate:
-            self.__affector_item_active.add_data_set(
-                affectee_item, other_to_activate)
+            self.__activate_item_affectors(affectee_item, other_to_activate)
 
     def __deactivate_special_affectors(self, affectee_fit, affectee_item):
         """Deactivate special affectors which affect passed item."""
@@ -278,6 +287,9 @@ class AffectionRegister:
                 awaitable_to_deactivate.add(affector)
         # Remove all affectors influencing this item directly, including 'other'
         # affectors
+        for affector in self.__affector_item_active[affectee_item]:
+            self.__affector_item_active_attr.rm_data_entry(
+                (affectee_item, affector.modifier.tgt_attr_id), affector)
         del self.__affector_item_active[affectee_item]
         # And make sure awaitable affectors are moved to appropriate container
         # for future use
@@ -285,31 +297,38 @@ class AffectionRegister:
             self.__affector_item_awaitable.add_data_set(
                 affectee_fit, awaitable_to_deactivate)
 
+    def __activate_item_affectors(self, affectee_item, affectors):
+        """Put affectors into storages of affectors active on passed item."""
+        self.__affector_item_active.add_data_set(affectee_item, affectors)
+        for affector in affectors:
+            self.__affector_item_active_attr.add_data_entry(
+                (affectee_item, affector.modifier.tgt_attr_id), affector)
+
     # Affector processing
-    def get_affectors(self, affectee_fit, affectee_item):
-        """Get all affectors, which influence passed item."""
+    def get_affectors(self, affectee_fit, affectee_item, tgt_attr_id):
+        """Get affectors, which influence attribute of passed item."""
         affectors = set()
         # Item
-        affectors.update(self.__affector_item_active.get(
-            affectee_item, ()))
+        affectors.update(self.__affector_item_active_attr.get(
+            (affectee_item, tgt_attr_id), ()))
         domain = affectee_item._modifier_domain
         if domain is not None:
             # Domain
             affectors.update(self.__affector_domain.get(
-                (affectee_fit, domain), ()))
+                (affectee_fit, domain, tgt_attr_id), ()))
             # Domain and group
             group_id = affectee_item._type.group_id
             affectors.update(self.__affector_domain_group.get(
-                (affectee_fit, domain, group_id), ()))
+                (affectee_fit, domain, group_id, tgt_attr_id), ()))
             for skill_type_id in affectee_item._type.required_skills:
                 # Domain and skill requirement
                 affectors.update(self.__affector_domain_skillrq.get(
-                    (affectee_fit, domain, skill_type_id), ()))
+                    (affectee_fit, domain, skill_type_id, tgt_attr_id), ()))
         if affectee_item._owner_modifiable is True:
             for skill_type_id in affectee_item._type.required_skills:
                 # Owner-modifiable and skill requirement
                 affectors.update(self.__affector_owner_skillrq.get(
-                    (affectee_fit, skill_type_id), ()))
+                    (affectee_fit, skill_type_id, tgt_attr_id), ()))
         return affectors
 
     def register_affector(self, affector_fit, affector):
@@ -342,20 +361,28 @@ class AffectionRegister:
 
     # Helpers for affector registering/unregistering, they find affector maps
     # and keys to them
+    def __get_affector_storages_item_active(self, affectee_item, affector):
+        return (
+            (affectee_item, self.__affector_item_active),
+            ((affectee_item, affector.modifier.tgt_attr_id),
+             self.__affector_item_active_attr))
+
     def __get_affector_storages_item_self(self, _, affector):
-        return (affector.carrier_item, self.__affector_item_active),
+        return self.__get_affector_storages_item_active(
+            affector.carrier_item, affector)
 
-    def __get_affector_storages_item_character(self, affector_fit, _):
+    def __get_affector_storages_item_character(self, affector_fit, affector):
         character = affector_fit.character
         if character is not None and character._is_loaded:
-            return (character, self.__affector_item_active),
+            return self.__get_affector_storages_item_active(
+                character, affector)
         else:
             return (affector_fit, self.__affector_item_awaitable),
 
-    def __get_affector_storages_item_ship(self, affector_fit, _):
+    def __get_affector_storages_item_ship(self, affector_fit, affector):
         ship = affector_fit.ship
         if ship is not None and ship._is_loaded:
-            return (ship, self.__affector_item_active),
+            return self.__get_affector_storages_item_active(ship, affector)
         else:
             return (affector_fit, self.__affector_item_awaitable),
 
@@ -368,7 +395,8 @@ class AffectionRegister:
         for other_item in affector.carrier_item._others:
             if not other_item._is_loaded:
                 continue
-            storages.append((other_item, self.__affector_item_active))
+            storages.extend(self.__get_affector_storages_item_active(
+                other_item, affector))
         return storages
 
     __affector_storages_getters_item = {
@@ -388,14 +416,14 @@ class AffectionRegister:
 
     def __get_affector_storages_domain(self, affector_fit, affector):
         domain = self.__contextize_tgt_filter_domain(affector_fit, affector)
-        key = (affector_fit, domain)
+        key = (affector_fit, domain, affector.modifier.tgt_attr_id)
         storage = self.__affector_domain
         return (key, storage),
 
     def __get_affector_storages_domain_group(self, affector_fit, affector):
         domain = self.__contextize_tgt_filter_domain(affector_fit, affector)
         group_id = affector.modifier.tgt_filter_extra_arg
-        key = (affector_fit, domain, group_id)
+        key = (affector_fit, domain, group_id, affector.modifier.tgt_attr_id)
         storage = self.__affector_domain_group
         return (key, storage),
 
@@ -404,7 +432,8 @@ class AffectionRegister:
         skill_type_id = affector.modifier.tgt_filter_extra_arg
         if skill_type_id == EosTypeId.current_self:
             skill_type_id = affector.carrier_item._type_id
-        key = (affector_fit, domain, skill_type_id)
+        key = (
+            affector_fit, domain, skill_type_id, affector.modifier.tgt_attr_id)
         storage = self.__affector_domain_skillrq
         return (key, storage),
 
@@ -412,7 +441,7 @@ class AffectionRegister:
         skill_type_id = affector.modifier.tgt_filter_extra_arg
         if skill_type_id == EosTypeId.current_self:
             skill_type_id = affector.carrier_item._type_id
-        key = (affector_fit, skill_type_id)
+        key = (affector_fit, skill_type_id, affector.modifier.tgt_attr_id)
         storage = self.__affector_owner_skillrq
         return (key, storage),
 
@@ -28,6 +28,8 @@ from eos.cache_handler import AttrFetchError
 from eos.const.eos import ModOperator
 from eos.const.eve import AttrId
 from eos.const.eve import TypeCategoryId
+from eos.eve_obj.modifier import DogmaModifier
+from eos.eve_obj.modifier import ModificationCalculationError
 from eos.pubsub.message import AttrValueChanged
 from eos.pubsub.message import AttrValueChangedMasked
 from eos.util.keyed_storage import KeyedStorage
@@ -37,12 +39,23 @@ from .exception import BaseValueError
 
 OverrideData = namedtuple('OverrideData', ('value', 'persistent'))
 
+# Modification plan contains everything needed to calculate attribute value
+# which does not change until set of affectors influencing attribute changes.
+# Modification entries are tuples in (carrier item, modifier, normalization
+# function, penalize flag) format; if normalization function is None, operator
+# is known only after modification is fetched, and penalize flag tells only if
+# modification from carrier item can be penalized
+ModPlan = namedtuple('ModPlan', ('attr', 'base_value', 'mod_entries'))
+
 
 logger = getLogger(__name__)
 
 
 # Stacking penalty base constant, used in attribute calculations
 PENALTY_BASE = 1 / math.exp((1 / 2.67) ** 2)
+# Stacking penalty multipliers for modification positions. Only 11 strongest
+# modifications are taken into consideration
+PENALTY_MULTS = tuple(PENALTY_BASE ** (pos ** 2) for pos in range(11))
 
 # Items belonging to these categories never have their effects stacking
 # penalized
@@ -100,6 +113,89 @@ LIMITED_PRECISION_ATTR_IDS = (
 # List of exceptions calculate method may throw
 CALCULATE_RAISABLE_EXCEPTIONS = (AttrMetadataError, BaseValueError)
 
+# Shared map of calculated values for attribute maps which have not calculated
+# anything yet; it is never modified, maps replace it with own dictionary when
+# they store first value
+NO_MODIFIED_ATTRS = {}
+
+
+def penalize_values(mod_values):
+    """Calculate aggregated multiplier from list of multipliers.
+
+    Assuming all multipliers received should be stacking penalized, and that
+    they are normalized to multiplier form, calculate final multiplier.
+
+    Args:
+        mod_values: Iterable with multipliers.
+
+    Returns:
+        Final aggregated multiplier.
+    """
+    # Gather positive multipliers into one chain, negative into another
+    chain_positive = []
+    chain_negative = []
+    for mod_value in mod_values:
+        # Transform value into form of multiplier - 1 for ease of stacking
+        # chain calculation
+        mod_value -= 1
+        if mod_value >= 0:
+            chain_positive.append(mod_value)
+        else:
+            chain_negative.append(mod_value)
+    # Strongest modifications always go first
+    chain_positive.sort(reverse=True)
+    chain_negative.sort()
+    # Base final multiplier on 1
+    value = 1
+    for penalization_chain in (chain_positive, chain_negative):
+        # Same for intermediate per-chain value
+        chain_value = 1
+        # Apply stacking penalty based on modification position; modifications
+        # past penalty multipliers are non-significant and ignored
+        for mod_value, penalty_mult in zip(penalization_chain, PENALTY_MULTS):
+            chain_value *= 1 + mod_value * penalty_mult
+        value *= chain_value
+    return value
+
+
+def aggregate_mods(attr, base_value, normal_mods, penalized_mods):
+    """Apply modifications to base value of attribute.
+
+    Args:
+        attr: Attribute object, value of which is calculated.
+        base_value: Unmodified value of attribute.
+        normal_mods: Non-penalized normalized modifications in {operator:
+            [values]} format. Gets updated with aggregated penalized values.
+        penalized_mods: Penalized normalized modifications in {operator:
+            [values]} format.
+
+    Returns:
+        Modified value of attribute, without capping and rounding applied.
+    """
+    value = base_value
+    # When data gathering is complete, process penalized modifications. They
+    # are penalized on per-operator basis
+    for operator, mod_values in penalized_mods.items():
+        penalized_value = penalize_values(mod_values)
+        normal_mods.setdefault(operator, []).append(penalized_value)
+    # Calculate value of non-penalized modifications, according to operator
+    # order
+    for operator in sorted(normal_mods):
+        mod_values = normal_mods[operator]
+        # Pick best modification for assignments, based on high_is_good value
+        if operator in ASSIGNMENT_OPERATORS:
+            if attr.high_is_good:
+                value = max(mod_values)
+            else:
+                value = min(mod_values)
+        elif operator in ADDITION_OPERATORS:
+            for mod_val in mod_values:
+                value += mod_val
+        elif operator in MULTIPLICATION_OPERATORS:
+            for mod_val in mod_values:
+                value *= mod_val
+    return value
+
 
 class MutableAttrMap:
     """Map which contains modified attribute values.
@@ -108,11 +204,19 @@ class MutableAttrMap:
     access to modified attribute values.
     """
 
+    # Maps exist for every item, thus keep them compact
+    __slots__ = (
+        '__item', '__modified_attrs', '__mod_plans', '__override_callbacks',
+        '__cap_map')
+
     def __init__(self, item):
         self.__item = item
         # Actual container of calculated attributes.
         # Format: {attribute ID: value}
-        self.__modified_attrs = {}
+        self.__modified_attrs = NO_MODIFIED_ATTRS
+        # Modification plans of attributes which have been calculated.
+        # Format: {attribute ID: modification plan}
+        self.__mod_plans = None
         # Override and cap maps are initialized as None to save memory, as they
         # are not needed most of the time
         self.__override_callbacks = None
@@ -138,18 +242,23 @@ class MutableAttrMap:
             except CALCULATE_RAISABLE_EXCEPTIONS as e:
                 raise KeyError(attr_id) from e
             else:
-                self.__modified_attrs[attr_id] = value
+                self.__store_value(attr_id, value)
         return value
 
     def __len__(self):
         return len(self.keys())
 
     def __contains__(self, attr_id):
-        return attr_id in self.keys()
+        # Check containers one by one instead of composing union of their keys
+        return (
+            attr_id in self.__modified_attrs or
+            attr_id in self.__item._type_attrs or
+            (
+                self.__override_callbacks is not None and
+                attr_id in self.__override_callbacks))
 
     def __iter__(self):
-        for k in self.keys():
-            yield k
+        return iter(self.keys())
 
     def __delitem__(self, attr_id):
         # Clear the value in our calculated attributes dictionary
@@ -190,7 +299,58 @@ class MutableAttrMap:
             except CALCULATE_RAISABLE_EXCEPTIONS:
                 return default
             else:
-                self.__modified_attrs[attr_id] = value
+                self.__store_value(attr_id, value)
+        return value
+
+    def _get_many(self, attr_ids, default=None, failures=None):
+        """Get values of multiple attributes.
+
+        Does the same as get() for every passed attribute ID, but avoids
+        per-attribute call overhead.
+
+        Args:
+            attr_ids: Iterable with attribute IDs.
+            default (optional): Value to use for attributes which cannot be
+                calculated.
+            failures (optional): Set with (item type, attribute ID) tuples for
+                attributes which cannot be calculated. When passed, it is used
+                to skip calculation attempts known to fail, and is filled with
+                new failures. Calculation fails regardless of modifications when
+                base value is unavailable, thus set can be shared between maps.
+
+        Returns:
+            List with values, in order of passed attribute IDs.
+        """
+        overrides = self.__override_callbacks
+        if overrides is not None:
+            return [self.__get_one(a, default, failures) for a in attr_ids]
+        # Try to fetch everything from already calculated values in one pass,
+        # and go through attributes one by one only if it fails
+        modified_attrs = self.__modified_attrs
+        try:
+            return [modified_attrs[a] for a in attr_ids]
+        except KeyError:
+            return [self.__get_one(a, default, failures) for a in attr_ids]
+
+    def __get_one(self, attr_id, default, failures):
+        overrides = self.__override_callbacks
+        if overrides is not None and attr_id in overrides:
+            callback, args, kwargs = overrides[attr_id]
+            return callback(*args, **kwargs)
+        try:
+            return self.__modified_attrs[attr_id]
+        except KeyError:
+            pass
+        failure = (self.__item._type, attr_id)
+        if failures is not None and failure in failures:
+            return default
+        try:
+            value = self.__calculate(attr_id)
+        except CALCULATE_RAISABLE_EXCEPTIONS:
+            if failures is not None:
+                failures.add(failure)
+            return default
+        self.__store_value(attr_id, value)
         return value
 
     def keys(self):
@@ -206,8 +366,34 @@ class MutableAttrMap:
         """Reset map to its initial state"""
         for attr_id in set(self.__modified_attrs):
             del self[attr_id]
+        self.__mod_plans = None
         self.__cap_map = None
 
+    def _copy_values(self, other):
+        """Take calculated values from other map.
+
+        Values are taken only for attributes which have not been calculated in
+        this map, and it is responsibility of the caller to make sure that the
+        values are valid for item of this map.
+        """
+        for attr_id, value in other.__modified_attrs.items():
+            if attr_id not in self.__modified_attrs:
+                self.__store_value(attr_id, value)
+        for capping_attr_id, capped_attr_ids in other._cap_map.items():
+            for capped_attr_id in capped_attr_ids:
+                self._cap_set(capping_attr_id, capped_attr_id)
+
+    def _affectors_changed(self, attr_id):
+        """Notify map that set of affectors of the attribute has changed.
+
+        Removes modification plan along with calculated value of the attribute.
+        """
+        if self.__mod_plans is not None:
+            self.__mod_plans.pop(attr_id, None)
+            if not self.__mod_plans:
+                self.__mod_plans = None
+        del self[attr_id]
+
     def __calculate(self, attr_id):
         """Run calculations to find the actual value of attribute.
 
@@ -223,6 +409,127 @@ class MutableAttrMap:
             BaseValueError: If base value for attribute being calculated cannot
                 be found.
         """
+        plan = self.__get_mod_plan(attr_id)
+        attr = plan.attr
+        normal_mods, penalized_mods, _ = self.__collect_mods(plan)
+        value = aggregate_mods(
+            attr, plan.base_value, normal_mods, penalized_mods)
+        # If attribute has upper cap, do not let its value to grow above it
+        if attr.max_attr_id is not None:
+            try:
+                max_value = self[attr.max_attr_id]
+            # If max value isn't available, don't cap anything
+            except KeyError:
+                pass
+            else:
+                value = min(value, max_value)
+                # Let map know that capping attribute restricts current
+                # attribute
+                self._cap_set(attr.max_attr_id, attr_id)
+        # Some of attributes are rounded for whatever reason, deal with it after
+        # all the calculations
+        if attr_id in LIMITED_PRECISION_ATTR_IDS:
+            value = round(value, 2)
+        return value
+
+    def _get_mod_data(self, attr_id, is_variable):
+        """Get data needed to calculate attribute value outside of the map.
+
+        Meant for simulators which need to calculate value of attribute many
+        times, when only some of modifications change between calculations.
+
+        Args:
+            attr_id: ID of attribute.
+            is_variable: Callable which receives carrier item and modifier, and
+                returns True if their modification should not be fetched.
+
+        Returns:
+            Tuple in (attribute, base value, normal modifications, penalized
+            modifications, variable modifications) format. Normal and penalized
+            modifications are in {operator: [normalized values]} format,
+            variable modifications are tuples in (carrier item, modifier,
+            normalization function, penalize flag) format. Normalization
+            function is None if operator is not known in advance.
+
+        Raises:
+            AttrMetadataError: If metadata of attribute cannot be fetched.
+            BaseValueError: If base value for attribute cannot be found.
+        """
+        plan = self.__get_mod_plan(attr_id)
+        normal_mods, penalized_mods, variable_mods = self.__collect_mods(
+            plan, is_variable)
+        return (
+            plan.attr, plan.base_value, normal_mods, penalized_mods,
+            variable_mods)
+
+    def __get_mod_plan(self, attr_id):
+        """Get modification plan, composing it if needed."""
+        mod_plans = self.__mod_plans
+        if mod_plans is not None and attr_id in mod_plans:
+            return mod_plans[attr_id]
+        plan = self.__make_mod_plan(attr_id)
+        if mod_plans is None:
+            mod_plans = self.__mod_plans = {}
+        mod_plans[attr_id] = plan
+        return plan
+
+    def __collect_mods(self, plan, is_variable=None):
+        """Fetch and normalize modifications according to modification plan.
+
+        Returns:
+            Tuple with normal modifications, penalized modifications (both in
+            {operator: [values]} format) and list with plan entries of variable
+            modifications.
+        """
+        # Container for non-penalized modifications
+        # Format: {operator: [values]}
+        normal_mods = {}
+        # Container for penalized modifications
+        # Format: {operator: [values]}
+        penalized_mods = {}
+        variable_mods = []
+        # Now, go through all affectors affecting our item. Plan already has
+        # everything resolved, here we only need to fetch modification values
+        for mod_entry in plan.mod_entries:
+            carrier_item, modifier, normalization_func, penalize = mod_entry
+            if is_variable is not None and is_variable(carrier_item, modifier):
+                variable_mods.append(mod_entry)
+                continue
+            try:
+                operator, mod_value = modifier.get_modification(carrier_item)
+            # Do nothing here - errors should be logged in modification getter
+            # or even earlier
+            except ModificationCalculationError:
+                continue
+            if normalization_func is None:
+                # Normalize operations to just three types: assignments,
+                # additions, multiplications
+                try:
+                    normalization_func = NORMALIZATION_MAP[operator]
+                # Log error on any unknown operator types
+                except KeyError:
+                    msg = (
+                        'malformed modifier on item type {}: '
+                        'unknown operator {}'
+                    ).format(carrier_item._type_id, operator)
+                    logger.warning(msg)
+                    continue
+                penalize = penalize and operator in PENALIZABLE_OPERATORS
+            mod_value = normalization_func(mod_value)
+            if penalize:
+                mod_values = penalized_mods.setdefault(operator, [])
+            else:
+                mod_values = normal_mods.setdefault(operator, [])
+            mod_values.append(mod_value)
+        return normal_mods, penalized_mods, variable_mods
+
+    def __make_mod_plan(self, attr_id):
+        """Compose modification plan for the attribute.
+
+        Raises:
+            AttrMetadataError: If metadata of attribute cannot be fetched.
+            BaseValueError: If base value for attribute cannot be found.
+        """
         item = self.__item
         # Attribute object for attribute being calculated
         try:
@@ -237,131 +544,42 @@ class MutableAttrMap:
             raise AttrMetadataError(attr_id) from e
         # Base attribute value which we'll use for modification
         try:
-            value = item._type_attrs[attr_id]
+            base_value = item._type_attrs[attr_id]
         # If attribute isn't available on item type, base off its default value
         except KeyError:
-            value = attr.default_value
+            base_value = attr.default_value
             # If item type attribute is not specified and default value isn't
             # available, raise error - without valid base we can't keep going
-            if value is None:
+            if base_value is None:
                 msg = (
                     'unable to find base value for attribute {} on item type {}'
                 ).format(attr_id, item._type_id)
                 logger.info(msg)
                 raise BaseValueError(attr_id)
-        # Container for non-penalized modifications
-        # Format: {operator: [values]}
-        normal_mods = {}
-        # Container for penalized modifications
-        # Format: {operator: [values]}
-        penalized_mods = {}
-        # Now, go through all affectors affecting our item
-        for mod_data in item._fit.solar_system._calculator.get_modifications(
-            item, attr_id
+        mod_entries = []
+        for carrier_item, modifier in (
+            item._fit.solar_system._calculator.get_affectors(item, attr_id)
         ):
-            operator, mod_value, carrier_item = mod_data
-            # Normalize operations to just three types: assignments, additions,
-            # multiplications
-            try:
-                normalization_func = NORMALIZATION_MAP[operator]
-            # Log error on any unknown operator types
-            except KeyError:
-                msg = (
-                    'malformed modifier on item type {}: unknown operator {}'
-                ).format(carrier_item._type_id, operator)
-                logger.warning(msg)
-                continue
-            mod_value = normalization_func(mod_value)
-            # Decide if modification should be stacking penalized or not
+            # Decide if modification from this carrier can be stacking
+            # penalized
             penalize = (
                 not attr.stackable and
                 carrier_item._type.category_id not in
-                PENALTY_IMMUNE_CATEGORY_IDS and
-                operator in PENALIZABLE_OPERATORS)
-            if penalize:
-                mod_values = penalized_mods.setdefault(operator, [])
-            else:
-                mod_values = normal_mods.setdefault(operator, [])
-            mod_values.append(mod_value)
-        # When data gathering is complete, process penalized modifications. They
-        # are penalized on per-operator basis
-        for operator, mod_values in penalized_mods.items():
-            penalized_value = self.__penalize_values(mod_values)
-            normal_mods.setdefault(operator, []).append(penalized_value)
-        # Calculate value of non-penalized modifications, according to operator
-        # order
-        for operator in sorted(normal_mods):
-            mod_values = normal_mods[operator]
-            # Pick best modification for assignments, based on high_is_good
-            # value
-            if operator in ASSIGNMENT_OPERATORS:
-                if attr.high_is_good:
-                    value = max(mod_values)
-                else:
-                    value = min(mod_values)
-            elif operator in ADDITION_OPERATORS:
-                for mod_val in mod_values:
-                    value += mod_val
-            elif operator in MULTIPLICATION_OPERATORS:
-                for mod_val in mod_values:
-                    value *= mod_val
-        # If attribute has upper cap, do not let its value to grow above it
-        if attr.max_attr_id is not None:
-            try:
-                max_value = self[attr.max_attr_id]
-            # If max value isn't available, don't cap anything
-            except KeyError:
-                pass
-            else:
-                value = min(value, max_value)
-                # Let map know that capping attribute restricts current
-                # attribute
-                self._cap_set(attr.max_attr_id, attr_id)
-        # Some of attributes are rounded for whatever reason, deal with it after
-        # all the calculations
-        if attr_id in LIMITED_PRECISION_ATTR_IDS:
-            value = round(value, 2)
-        return value
-
-    def __penalize_values(self, mod_values):
-        """Calculate aggregated multiplier from list of multipliers.
-
-        Assuming all multipliers received should be stacking penalized, and that
-        they are normalized to multiplier form, calculate final multiplier.
-
-        Args:
-            mod_values: Iterable with multipliers.
-
-        Returns:
-            Final aggregated multiplier.
-        """
-        # Gather positive multipliers into one chain, negative into another
-        chain_positive = []
-        chain_negative = []
-        for mod_value in mod_values:
-            # Transform value into form of multiplier - 1 for ease of stacking
-            # chain calculation
-            mod_value -= 1
-            if mod_value >= 0:
-                chain_positive.append(mod_value)
+                PENALTY_IMMUNE_CATEGORY_IDS)
+            # Operator of dogma modifiers is static, thus we can resolve
+            # everything related to it right away
+            if (
+                isinstance(modifier, DogmaModifier) and
+                modifier.operator in NORMALIZATION_MAP
+            ):
+                mod_entries.append((
+                    carrier_item, modifier,
+                    NORMALIZATION_MAP[modifier.operator],
+                    penalize and modifier.operator in PENALIZABLE_OPERATORS))
             else:
-                chain_negative.append(mod_value)
-        # Strongest modifications always go first
-        chain_positive.sort(reverse=True)
-        chain_negative.sort()
-        # Base final multiplier on 1
-        value = 1
-        for penalization_chain in (chain_positive, chain_negative):
-            # Same for intermediate per-chain value
-            chain_value = 1
-            for pos, mod_value in enumerate(penalization_chain):
-                # Ignore 12th modification and further as non-significant
-                if pos > 10:
-                    break
-                # Apply stacking penalty based on modification position
-                chain_value *= 1 + mod_value * PENALTY_BASE ** (pos ** 2)
-            value *= chain_value
-        return value
+                mod_entries.append((carrier_item, modifier, None, penalize))
+        return ModPlan(
+            attr=attr, base_value=base_value, mod_entries=tuple(mod_entries))
 
     # Override-related methods
     def _set_override_callback(self, attr_id, callback):
@@ -406,7 +624,7 @@ class MutableAttrMap:
             except CALCULATE_RAISABLE_EXCEPTIONS:
                 return default
             else:
-                self.__modified_attrs[attr_id] = value
+                self.__store_value(attr_id, value)
         return value
 
     # Cap-related methods
@@ -431,9 +649,15 @@ class MutableAttrMap:
             self.__cap_map = None
 
     # Auxiliary methods
+    def __store_value(self, attr_id, value):
+        modified_attrs = self.__modified_attrs
+        if modified_attrs is NO_MODIFIED_ATTRS:
+            modified_attrs = self.__modified_attrs = {}
+        modified_attrs[attr_id] = value
+
     def __publish(self, msg):
         try:
-            publish_func = self.__item._fit._publish
+            publish_func = self.__item._fit._publish_attr_change
         except AttributeError:
             pass
         else:
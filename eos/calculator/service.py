@@ -22,12 +22,16 @@
 from eos.const.eos import ModDomain
 from eos.eve_obj.modifier import BasePythonModifier
 from eos.eve_obj.modifier import DogmaModifier
-from eos.eve_obj.modifier import ModificationCalculationError
 from eos.pubsub.message import AttrValueChanged
+from eos.pubsub.message import BatchFinished
+from eos.pubsub.message import BatchStarted
 from eos.pubsub.message import EffectsStarted
 from eos.pubsub.message import EffectsStopped
+from eos.pubsub.message import ItemAdded
 from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemRemoved
 from eos.pubsub.message import ItemUnloaded
+from eos.pubsub.message import ProfileAffectorsChanged
 from eos.pubsub.subscriber import BaseSubscriber
 from eos.util.keyed_storage import KeyedStorage
 from .affection import AffectionRegister
@@ -46,70 +50,103 @@ class CalculationService(BaseSubscriber):
     def __init__(self):
         self.__affections = AffectionRegister()
         self.__projections = ProjectionRegister()
+        # Affectors spawned by loaded items, generated once per item load
+        # Format: {item: {effect ID: (affectors)}}
+        self.__item_affectors = {}
+        # Affectors with dogma modifiers from running effects, keyed by item
+        # which carries them and by ID of attribute they use as source
+        # Format: {(carrier item, source attribute ID): {affectors}}
+        self.__src_attr_affectors = KeyedStorage()
+        # Affectors with python modifiers, keyed by attributes which they
+        # declare as dependencies. Attributes of ship and character are keyed
+        # by fit, everything else - by affector carrier item
+        # Format: {(fit or carrier item, domain, attribute ID): {affectors}}
+        self.__python_attr_affectors = KeyedStorage()
+        # Affectors with python modifiers which rely on charge of their
+        # carrier item
+        # Format: {carrier item: {affectors}}
+        self.__python_charge_affectors = KeyedStorage()
         # Container with affectors which will receive messages
         # Format: {message type: set(affectors)}
         self.__subscribed_affectors = KeyedStorage()
+        # Fits which have attribute invalidation deferred, with attributes
+        # which should be invalidated when deferral ends
+        # Format: {fit: {(affectee item, affectee attribute ID)}}
+        self.__deferred_invalidations = {}
 
-    def get_modifications(self, tgt_item, tgt_attr_id):
-        """Get modifications of target attribute on target item.
+    def get_affectors(self, tgt_item, tgt_attr_id):
+        """Get affectors which influence target attribute on target item.
 
         Args:
-            tgt_item: Item, for which we're getting modifications.
-            tgt_attr_id: Target attribute ID; only modifications which influence
+            tgt_item: Item, for which we're getting affectors.
+            tgt_attr_id: Target attribute ID; only affectors which influence
                 attribute with this ID will be returned.
 
         Returns:
-            Set with tuples in (operator, modification value, carrier item)
-            format.
+            Set with affectors.
         """
-        # Use list because we can have multiple tuples with the same values
-        # as valid configuration
-        modifications = []
-        for carrier_item, modifier in self.__affections.get_affectors(
-            tgt_item._fit, tgt_item
-        ):
-            if modifier.tgt_attr_id == tgt_attr_id:
-                try:
-                    mod_op, mod_value = modifier.get_modification(carrier_item)
-                # Do nothing here - errors should be logged in modification
-                # getter or even earlier
-                except ModificationCalculationError:
-                    continue
-                modifications.append((mod_op, mod_value, carrier_item))
-        return modifications
+        fit = tgt_item._fit
+        affectors = self.__affections.get_affectors(fit, tgt_item, tgt_attr_id)
+        profile = fit.character_profile
+        if profile is not None:
+            affectors.update(
+                profile._get_affectors(fit, tgt_item, tgt_attr_id))
+        return affectors
 
     def _handle_fit_added(self, fit):
         fit._subscribe(self, self._handler_map.keys())
 
     def _handle_fit_removed(self, fit):
         fit._unsubscribe(self, self._handler_map.keys())
+        self.__flush_deferred_invalidations(fit)
+
+    # Handle fit batch mode, during which attribute invalidation is deferred
+    def _handle_batch_started(self, msg):
+        self.__deferred_invalidations.setdefault(msg.fit, set())
+
+    def _handle_batch_finished(self, msg):
+        self.__flush_deferred_invalidations(msg.fit)
 
     # Handle item changes which are significant for calculator
     def _handle_item_loaded(self, msg):
+        self.__item_affectors[msg.item] = self.__generate_affectors(msg.item)
         self.__affections.register_affectee(msg.fit, msg.item)
+        self.__invalidate_profile_overrides(msg.fit, msg.item)
 
     def _handle_item_unloaded(self, msg):
         self.__affections.unregister_affectee(msg.fit, msg.item)
+        self.__invalidate_profile_overrides(msg.fit, msg.item)
+        del self.__item_affectors[msg.item]
+
+    def _handle_profile_affectors_changed(self, msg):
+        for affector in msg.affectors:
+            self.__invalidate_affectees(msg.fit, affector)
 
     def _handle_effects_started(self, msg):
         fit = msg.fit
-        affectors = self.__generate_affectors(msg.item, msg.effect_ids)
-        for affector in affectors:
-            if isinstance(affector.modifier, BasePythonModifier):
-                self.__subscribe_python_affector(fit, affector)
+        for affector in self.__get_affectors(msg.item, msg.effect_ids):
+            modifier = affector.modifier
+            if isinstance(modifier, DogmaModifier):
+                self.__src_attr_affectors.add_data_entry(
+                    (msg.item, modifier.src_attr_id), affector)
+            elif isinstance(modifier, BasePythonModifier):
+                self.__register_python_affector(fit, affector)
             self.__affections.register_affector(fit, affector)
-            for tgt_item in self.__affections.get_affectees(fit, affector):
-                del tgt_item.attrs[affector.modifier.tgt_attr_id]
+            self.__invalidate_affectees(fit, affector)
 
     def _handle_effects_stopped(self, msg):
         fit = msg.fit
-        affectors = self.__generate_affectors(msg.item, msg.effect_ids)
-        for affector in affectors:
-            for tgt_item in self.__affections.get_affectees(fit, affector):
-                del tgt_item.attrs[affector.modifier.tgt_attr_id]
+        for affector in self.__get_affectors(msg.item, msg.effect_ids):
+            # Unregister affector first, to make sure that attribute values
+            # recalculated upon change notification do not rely on it
             self.__affections.unregister_affector(fit, affector)
-            if isinstance(affector.modifier, BasePythonModifier):
-                self.__unsubscribe_python_affector(fit, affector)
+            self.__invalidate_affectees(fit, affector)
+            modifier = affector.modifier
+            if isinstance(modifier, DogmaModifier):
+                self.__src_attr_affectors.rm_data_entry(
+                    (msg.item, modifier.src_attr_id), affector)
+            elif isinstance(modifier, BasePythonModifier):
+                self.__unregister_python_affector(fit, affector)
 
     # Methods to clear calculated child nodes when parent nodes change
     def _revise_regular_attr_dependents(self, msg):
@@ -117,8 +154,9 @@ class CalculationService(BaseSubscriber):
 
         Removing them allows to recalculate updated value. Here we process all
         regular dependents, which include dependencies specified via capped
-        attribute map and via affectors with dogma modifiers. Affectors with
-        python modifiers are processed separately.
+        attribute map, via affectors with dogma modifiers and via attribute
+        dependencies declared by python modifiers. Message revision of python
+        modifiers is processed separately.
         """
         # Remove values of target attributes capped by changing attribute
         item = msg.item
@@ -126,19 +164,38 @@ class CalculationService(BaseSubscriber):
         for capped_attr_id in item.attrs._cap_map.get(attr_id, ()):
             del item.attrs[capped_attr_id]
         # Remove values of target attributes which are using changing attribute
-        # as modification source
-        for affector in self.__generate_affectors(
-                item, item._running_effect_ids):
-            modifier = affector.modifier
-            # Only dogma modifiers have source attribute specified, python
-            # modifiers are processed separately
-            if (
-                not isinstance(modifier, DogmaModifier) or
-                modifier.src_attr_id != attr_id
-            ):
-                continue
+        # as modification source. Only dogma modifiers have source attribute
+        # specified, python modifiers are processed separately
+        for affector in self.__src_attr_affectors.get((item, attr_id), ()):
+            tgt_attr_id = affector.modifier.tgt_attr_id
             for tgt_item in self.__affections.get_affectees(msg.fit, affector):
-                del tgt_item.attrs[modifier.tgt_attr_id]
+                del tgt_item.attrs[tgt_attr_id]
+        # Remove values of target attributes of python modifiers which declared
+        # changing attribute as dependency
+        python_affectors = self.__python_attr_affectors
+        if not python_affectors:
+            return
+        fit = msg.fit
+        keys = [(item, ModDomain.self, attr_id)]
+        keys.extend(
+            (other_item, ModDomain.other, attr_id)
+            for other_item in item._others)
+        if item is fit.ship:
+            keys.append((fit, ModDomain.ship, attr_id))
+        elif item is fit.character:
+            keys.append((fit, ModDomain.character, attr_id))
+        for key in keys:
+            for affector in python_affectors.get(key, ()):
+                self.__clear_affectee_values(fit, affector)
+
+    def _revise_python_charge_dependents(self, msg):
+        """Remove values which rely on charge of python modifier carrier."""
+        python_affectors = self.__python_charge_affectors
+        if not python_affectors:
+            return
+        for carrier_item in msg.item._others:
+            for affector in python_affectors.get(carrier_item, ()):
+                self.__clear_affectee_values(msg.fit, affector)
 
     def _revise_python_attr_dependents(self, msg):
         """Remove calculated attribute values when necessary.
@@ -159,16 +216,22 @@ class CalculationService(BaseSubscriber):
                 msg, affector.carrier_item
             ):
                 continue
-            for tgt_item in self.__affections.get_affectees(msg.fit, affector):
-                del tgt_item.attrs[affector.modifier.tgt_attr_id]
+            self.__clear_affectee_values(msg.fit, affector)
 
     # Message routing
     _handler_map = {
         ItemLoaded: _handle_item_loaded,
         ItemUnloaded: _handle_item_unloaded,
+        ItemAdded: _revise_python_charge_dependents,
+        ItemRemoved: _revise_python_charge_dependents,
         EffectsStarted: _handle_effects_started,
         EffectsStopped: _handle_effects_stopped,
-        AttrValueChanged: _revise_regular_attr_dependents}
+        AttrValueChanged: _revise_regular_attr_dependents,
+        ProfileAffectorsChanged: _handle_profile_affectors_changed,
+        BatchStarted: _handle_batch_started,
+        BatchFinished: _handle_batch_finished}
+
+    _attr_invalidator = True
 
     def _notify(self, msg):
         BaseSubscriber._notify(self, msg)
@@ -181,11 +244,31 @@ class CalculationService(BaseSubscriber):
         domain for domain in ModDomain if domain != ModDomain.target)
 
     # Affector generation and manipulation
-    def __generate_affectors(self, item, effect_ids):
-        """Get all affectors spawned by the item.
+    def __generate_affectors(self, item):
+        """Generate all affectors spawned by the item.
 
         Args:
             item: Item, for which affectors are generated.
+
+        Return value:
+            Map in {effect ID: (affectors)} format. Effects which have no
+            affectors are not included.
+        """
+        affectors = {}
+        for effect_id, effect in item._type_effects.items():
+            effect_affectors = tuple(
+                Affector(item, modifier)
+                for modifier in effect.modifiers
+                if modifier.tgt_domain in self._supported_domains)
+            if effect_affectors:
+                affectors[effect_id] = effect_affectors
+        return affectors
+
+    def __get_affectors(self, item, effect_ids):
+        """Get affectors spawned by the item.
+
+        Args:
+            item: Item, for which affectors are fetched.
             effect_ids: Iterable with effect IDs which should serve as filter
                 for affectors. If affector's modifier is not part of effect from
                 this iterable, it's filtered out.
@@ -193,18 +276,77 @@ class CalculationService(BaseSubscriber):
         Return value:
             Set with Affector objects.
         """
+        item_affectors = self.__item_affectors[item]
         affectors = set()
-        for effect_id, effect in item._type_effects.items():
-            if effect_id not in effect_ids:
-                continue
-            for modifier in effect.modifiers:
-                if modifier.tgt_domain not in self._supported_domains:
-                    continue
-                affector = Affector(item, modifier)
-                affectors.add(affector)
+        for effect_id in effect_ids:
+            affectors.update(item_affectors.get(effect_id, ()))
         return affectors
 
-    # Python affector subscription/unsubscription
+    def __invalidate_affectees(self, fit, affector):
+        """Invalidate attribute values influenced by changed affector."""
+        tgt_attr_id = affector.modifier.tgt_attr_id
+        deferred = self.__deferred_invalidations.get(fit)
+        for tgt_item in self.__affections.get_affectees(fit, affector):
+            if deferred is None:
+                tgt_item.attrs._affectors_changed(tgt_attr_id)
+            else:
+                deferred.add((tgt_item, tgt_attr_id))
+
+    def __clear_affectee_values(self, fit, affector):
+        """Remove calculated values of attributes affector influences."""
+        tgt_attr_id = affector.modifier.tgt_attr_id
+        for tgt_item in self.__affections.get_affectees(fit, affector):
+            del tgt_item.attrs[tgt_attr_id]
+
+    def __invalidate_profile_overrides(self, fit, item):
+        """Invalidate values influenced by profile items item overrides."""
+        profile = fit.character_profile
+        if profile is None:
+            return
+        for affector in profile._get_overridden_affectors(item):
+            self.__invalidate_affectees(fit, affector)
+
+    def __flush_deferred_invalidations(self, fit):
+        """Invalidate attribute values, invalidation of which was deferred."""
+        for tgt_item, tgt_attr_id in self.__deferred_invalidations.pop(
+            fit, ()
+        ):
+            tgt_item.attrs._affectors_changed(tgt_attr_id)
+
+    # Python affector registration/unregistration
+    def __register_python_affector(self, fit, affector):
+        """Index declared dependencies of python affector and subscribe it."""
+        modifier = affector.modifier
+        for domain, attr_id in modifier.attr_dependencies:
+            self.__python_attr_affectors.add_data_entry(
+                self.__get_python_dep_key(fit, affector, domain, attr_id),
+                affector)
+        if modifier.charge_dependency:
+            self.__python_charge_affectors.add_data_entry(
+                affector.carrier_item, affector)
+        self.__subscribe_python_affector(fit, affector)
+
+    def __unregister_python_affector(self, fit, affector):
+        """Remove indexed dependencies of python affector and unsubscribe it."""
+        modifier = affector.modifier
+        for domain, attr_id in modifier.attr_dependencies:
+            self.__python_attr_affectors.rm_data_entry(
+                self.__get_python_dep_key(fit, affector, domain, attr_id),
+                affector)
+        if modifier.charge_dependency:
+            self.__python_charge_affectors.rm_data_entry(
+                affector.carrier_item, affector)
+        self.__unsubscribe_python_affector(fit, affector)
+
+    @staticmethod
+    def __get_python_dep_key(fit, affector, domain, attr_id):
+        """Get key for python affector attribute dependency index."""
+        # Ship and character can be replaced, thus dependencies on them are
+        # bound to fit
+        if domain in (ModDomain.ship, ModDomain.character):
+            return fit, domain, attr_id
+        return affector.carrier_item, domain, attr_id
+
     def __subscribe_python_affector(self, fit, affector):
         """Subscribe python affector to message types it wants."""
         to_subscribe = set()
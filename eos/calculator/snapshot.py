@@ -0,0 +1,133 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import math
+from array import array
+
+from eos.util.repr import make_repr_str
+
+
+class AttrSnapshot:
+    """Table with attribute values of multiple items.
+
+    Rows of the table correspond to items, columns - to attributes.
+
+    Attributes:
+        items: Tuple with items, in order of table rows.
+        attr_ids: Tuple with attribute IDs, in order of table columns.
+        values: Array of floats with all values of the table, row after row.
+            Values of attributes which cannot be calculated are NaN.
+    """
+
+    def __init__(self, items, attr_ids, values):
+        self.items = items
+        self.attr_ids = attr_ids
+        self.values = values
+        self.__item_idxs = None
+        self.__attr_idxs = None
+
+    @classmethod
+    def _make(cls, items, attr_ids):
+        """Calculate attribute values and compose snapshot out of them.
+
+        Args:
+            items: Iterable with items to include into snapshot.
+            attr_ids: Iterable with IDs of attributes to include into snapshot.
+
+        Returns:
+            Attribute snapshot.
+        """
+        items = tuple(items)
+        attr_ids = tuple(attr_ids)
+        values = array('d')
+        # Attributes which cannot be calculated on items of some type, shared
+        # between items to avoid repeating failing calculations
+        failures = set()
+        for item in items:
+            row = item.attrs._get_many(attr_ids, math.nan, failures)
+            try:
+                values.fromlist(row)
+            # Override callbacks can return None
+            except TypeError:
+                values.fromlist([math.nan if v is None else v for v in row])
+        return cls(items, attr_ids, values)
+
+    def get(self, item, attr_id, default=None):
+        """Get value of attribute of item.
+
+        Args:
+            item: Item which is included into snapshot.
+            attr_id: ID of attribute which is included into snapshot.
+            default (optional): Value to return when attribute value cannot be
+                calculated.
+
+        Raises:
+            KeyError: If item or attribute is not included into snapshot.
+        """
+        value = self.values[self.__get_idx(item, attr_id)]
+        if math.isnan(value):
+            return default
+        return value
+
+    def row(self, item):
+        """Get values of all attributes of item.
+
+        Returns:
+            Map in {attribute ID: value} format. Attributes, values of which
+            cannot be calculated, are not included.
+        """
+        row_start = self.__get_item_idxs()[item] * len(self.attr_ids)
+        row = {}
+        for attr_idx, attr_id in enumerate(self.attr_ids):
+            value = self.values[row_start + attr_idx]
+            if not math.isnan(value):
+                row[attr_id] = value
+        return row
+
+    def column(self, attr_id):
+        """Get values of attribute for all items.
+
+        Returns:
+            List with values in order of items. Values which cannot be
+            calculated are NaN.
+        """
+        attr_idx = self.__get_attr_idxs()[attr_id]
+        return self.values[attr_idx::len(self.attr_ids)].tolist()
+
+    # Auxiliary methods
+    def __get_idx(self, item, attr_id):
+        item_idx = self.__get_item_idxs()[item]
+        attr_idx = self.__get_attr_idxs()[attr_id]
+        return item_idx * len(self.attr_ids) + attr_idx
+
+    def __get_item_idxs(self):
+        if self.__item_idxs is None:
+            self.__item_idxs = {i: idx for idx, i in enumerate(self.items)}
+        return self.__item_idxs
+
+    def __get_attr_idxs(self):
+        if self.__attr_idxs is None:
+            self.__attr_idxs = {a: idx for idx, a in enumerate(self.attr_ids)}
+        return self.__attr_idxs
+
+    def __repr__(self):
+        spec = ['items', 'attr_ids']
+        return make_repr_str(self, spec)
@@ -0,0 +1,233 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from weakref import WeakSet
+
+from eos.calculator.misc import Affector
+from eos.const.eos import EosTypeId
+from eos.const.eos import ModDomain
+from eos.const.eos import ModTgtFilter
+from eos.eve_obj.modifier import DogmaModifier
+from eos.fit import Fit
+from eos.item import Skill
+from eos.pubsub.message import AttrValueChanged
+from eos.pubsub.message import EffectsStarted
+from eos.pubsub.message import EffectsStopped
+from eos.pubsub.message import ProfileAffectorsChanged
+from eos.pubsub.subscriber import BaseSubscriber
+from eos.solar_system import SolarSystem
+from eos.util.default import DEFAULT
+from eos.util.keyed_storage import KeyedStorage
+from eos.util.repr import make_repr_str
+
+
+class CharacterProfile(BaseSubscriber):
+    """Set of character-related items which can be shared by multiple fits.
+
+    Profile items are loaded, and their attributes are calculated, only once,
+    within profile's own fit. Fits which refer the profile are influenced by
+    dogma modifiers of profile items as if these items were added to them.
+
+    Profile is isolated from fits which refer it: items of such fits cannot
+    influence profile items, and modifiers which target profile items
+    themselves or use python logic are not applied to fits. To override
+    profile skill, skill of the same type can be added to the fit, then
+    modifiers of profile skill are ignored for that fit.
+
+    Args:
+        source (optional): Source to use for profile items. When not specified,
+            source which is set as default in source manager will be used.
+
+    Attributes:
+        skills: Keyed set for skills.
+        implants: Set for implants.
+        boosters: Set for boosters.
+    """
+
+    def __init__(self, source=DEFAULT):
+        self.__fit = Fit(solar_system=SolarSystem(source=source))
+        self.skills = self.__fit.skills
+        self.implants = self.__fit.implants
+        self.boosters = self.__fit.boosters
+        # Fits which refer the profile
+        self.__fits = WeakSet()
+        # Affectors which can influence items of fits, keyed by their target
+        # filter and target filter-specific data
+        # Format: {key: {affectors}}
+        self.__affectors = KeyedStorage()
+        # The same affectors, keyed by item which carries them
+        # Format: {carrier item: {affectors}}
+        self.__carrier_affectors = KeyedStorage()
+        self.__fit._subscribe(self, self._handler_map.keys())
+
+    @property
+    def source(self):
+        """Access point for source used by profile items."""
+        return self.__fit.solar_system.source
+
+    @source.setter
+    def source(self, new_source):
+        self.__fit.solar_system.source = new_source
+
+    # Fit-facing methods
+    def _add_fit(self, fit):
+        self.__fits.add(fit)
+
+    def _remove_fit(self, fit):
+        self.__fits.discard(fit)
+
+    @property
+    def _affectors(self):
+        """Return all affectors which can influence items of fits."""
+        return set().union(*self.__carrier_affectors.values())
+
+    def _get_affectors(self, fit, tgt_item, tgt_attr_id):
+        """Get profile affectors which influence attribute of fit item."""
+        affectors = set()
+        affector_map = self.__affectors
+        if tgt_item is fit.ship:
+            affectors.update(affector_map.get(
+                (ModTgtFilter.item, ModDomain.ship, tgt_attr_id), ()))
+        elif tgt_item is fit.character:
+            affectors.update(affector_map.get(
+                (ModTgtFilter.item, ModDomain.character, tgt_attr_id), ()))
+        domain = tgt_item._modifier_domain
+        if domain is not None:
+            affectors.update(affector_map.get(
+                (ModTgtFilter.domain, domain, tgt_attr_id), ()))
+            affectors.update(affector_map.get((
+                ModTgtFilter.domain_group, domain, tgt_item._type.group_id,
+                tgt_attr_id), ()))
+            for skill_type_id in tgt_item._type.required_skills:
+                affectors.update(affector_map.get((
+                    ModTgtFilter.domain_skillrq, domain, skill_type_id,
+                    tgt_attr_id), ()))
+        if tgt_item._owner_modifiable is True:
+            for skill_type_id in tgt_item._type.required_skills:
+                affectors.update(affector_map.get((
+                    ModTgtFilter.owner_skillrq, skill_type_id, tgt_attr_id),
+                    ()))
+        return {
+            a for a in affectors
+            if not self.__is_overridden(fit, a.carrier_item)}
+
+    def _get_overridden_affectors(self, item):
+        """Get affectors of profile skill which can be overridden by item."""
+        if not isinstance(item, Skill):
+            return ()
+        try:
+            skill = self.skills[item._type_id]
+        except KeyError:
+            return ()
+        return self.__carrier_affectors.get(skill, ())
+
+    @staticmethod
+    def __is_overridden(fit, carrier_item):
+        if not isinstance(carrier_item, Skill):
+            return False
+        try:
+            fit_skill = fit.skills[carrier_item._type_id]
+        except KeyError:
+            return False
+        return fit_skill._is_loaded
+
+    # Message handling
+    def _handle_effects_started(self, msg):
+        affectors = self.__generate_affectors(msg.item, msg.effect_ids)
+        for key, affector in affectors:
+            self.__affectors.add_data_entry(key, affector)
+            self.__carrier_affectors.add_data_entry(msg.item, affector)
+        self.__notify_fits(affector for _, affector in affectors)
+
+    def _handle_effects_stopped(self, msg):
+        affectors = self.__generate_affectors(msg.item, msg.effect_ids)
+        for key, affector in affectors:
+            self.__affectors.rm_data_entry(key, affector)
+            self.__carrier_affectors.rm_data_entry(msg.item, affector)
+        self.__notify_fits(affector for _, affector in affectors)
+
+    def _handle_attr_value_changed(self, msg):
+        self.__notify_fits(
+            a for a in self.__carrier_affectors.get(msg.item, ())
+            if a.modifier.src_attr_id == msg.attr_id)
+
+    _handler_map = {
+        EffectsStarted: _handle_effects_started,
+        EffectsStopped: _handle_effects_stopped,
+        AttrValueChanged: _handle_attr_value_changed}
+
+    # Auxiliary methods
+    def __notify_fits(self, affectors):
+        affectors = set(affectors)
+        if not affectors:
+            return
+        for fit in self.__fits:
+            fit._publish(ProfileAffectorsChanged(affectors))
+
+    def __generate_affectors(self, item, effect_ids):
+        """Get affectors spawned by the item which can influence fit items.
+
+        Returns:
+            List with tuples in (key, affector) format.
+        """
+        affectors = []
+        for effect_id, effect in item._type_effects.items():
+            if effect_id not in effect_ids:
+                continue
+            for modifier in effect.modifiers:
+                if not isinstance(modifier, DogmaModifier):
+                    continue
+                key = self.__get_affector_key(item, modifier)
+                if key is None:
+                    continue
+                affectors.append((key, Affector(item, modifier)))
+        return affectors
+
+    @staticmethod
+    def __get_affector_key(carrier_item, modifier):
+        """Get key for affector storage, or None if modifier is not shared."""
+        tgt_filter = modifier.tgt_filter
+        tgt_domain = modifier.tgt_domain
+        tgt_attr_id = modifier.tgt_attr_id
+        skill_type_id = modifier.tgt_filter_extra_arg
+        if skill_type_id == EosTypeId.current_self:
+            skill_type_id = carrier_item._type_id
+        if tgt_filter == ModTgtFilter.owner_skillrq:
+            if tgt_domain == ModDomain.target:
+                return None
+            return tgt_filter, skill_type_id, tgt_attr_id
+        # Everything else is shared only when it targets fit's ship or
+        # character domains
+        if tgt_domain not in (ModDomain.ship, ModDomain.character):
+            return None
+        if tgt_filter in (ModTgtFilter.item, ModTgtFilter.domain):
+            return tgt_filter, tgt_domain, tgt_attr_id
+        if tgt_filter == ModTgtFilter.domain_group:
+            return (
+                tgt_filter, tgt_domain, modifier.tgt_filter_extra_arg,
+                tgt_attr_id)
+        if tgt_filter == ModTgtFilter.domain_skillrq:
+            return tgt_filter, tgt_domain, skill_type_id, tgt_attr_id
+        return None
+
+    def __repr__(self):
+        spec = ['source', 'skills', 'implants', 'boosters']
+        return make_repr_str(self, spec)
@@ -169,6 +169,20 @@ class Restriction(IntEnum):
     loaded_item = 35
 
 
+@unique
+class RestrictionCost(IntEnum):
+    """Contains relative costs of restriction checks.
+
+    Used to run cheap checks first during fit validity check.
+    """
+    # Checks of slot and hardpoint quantities
+    slot = 1
+    # Checks of item type data
+    item = 2
+    # Checks of skill levels and modified attribute values
+    attr = 3
+
+
 @unique
 class EosTypeId(IntEnum):
     """Contains Eos-specific item type IDs.
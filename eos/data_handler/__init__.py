@@ -21,3 +21,4 @@
 
 from .json_data_handler import JsonDataHandler
 from .sqlite_data_handler import SQLiteDataHandler
+from .streaming_json_data_handler import StreamingJsonDataHandler
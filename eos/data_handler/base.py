@@ -29,7 +29,8 @@ class BaseDataHandler(metaclass=ABCMeta):
     Data handlers fetch 'raw' data from external source. Its abstract methods
     are named against data structures (usually tables) they request, returning
     iterable with rows, each row being dictionary in {field name: field value}
-    format.
+    format. Iterables are allowed to be one-shot iterators, thus consumers
+    should iterate over each of them only once.
     """
 
     @abstractmethod
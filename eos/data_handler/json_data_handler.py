@@ -62,14 +62,8 @@ class JsonDataHandler(BaseDataHandler):
         return self.__fetch_file('dgmexpressions')
 
     def get_typefighterabils(self):
-        rows = []
         fighter_abils = self.__fetch_file('fighterabilitiesbytype')
-        for type_id, type_abilities in fighter_abils.items():
-            for ability_slot, ability_data in type_abilities.items():
-                ability_row = {'typeID': int(type_id)}
-                self.__collapse_dict(ability_data, ability_row)
-                rows.append(ability_row)
-        return rows
+        return list(iter_fighter_abil_rows(fighter_abils.items()))
 
     def __fetch_file(self, filename, values_only=False):
         filepath = os.path.join(self.basepath, '{}.json'.format(filename))
@@ -79,14 +73,6 @@ class JsonDataHandler(BaseDataHandler):
             data = list(data.values())
         return data
 
-    def __collapse_dict(self, src, tgt):
-        """Convert multi-level dictionary to single-level one."""
-        for k, v in src.items():
-            if isinstance(v, Mapping):
-                self.__collapse_dict(v, tgt)
-            elif k not in tgt:
-                tgt[k] = v
-
     def get_version(self):
         metadata = self.__fetch_file('phbmetadata')
         for row in metadata:
@@ -98,3 +84,28 @@ class JsonDataHandler(BaseDataHandler):
     def __repr__(self):
         spec = ['basepath']
         return make_repr_str(self, spec)
+
+
+def iter_fighter_abil_rows(fighter_abils):
+    """Convert fighter abilities data into flat rows.
+
+    Args:
+        fighter_abils: Iterable with (type ID, abilities by slot) pairs.
+
+    Yields:
+        Single-level dictionaries, one per fighter ability.
+    """
+    for type_id, type_abilities in fighter_abils:
+        for ability_slot, ability_data in type_abilities.items():
+            ability_row = {'typeID': int(type_id)}
+            _collapse_dict(ability_data, ability_row)
+            yield ability_row
+
+
+def _collapse_dict(src, tgt):
+    """Convert multi-level dictionary to single-level one."""
+    for k, v in src.items():
+        if isinstance(v, Mapping):
+            _collapse_dict(v, tgt)
+        elif k not in tgt:
+            tgt[k] = v
@@ -20,30 +20,70 @@
 
 import sqlite3
 
+from eos.const.eve import AttrId
+from eos.eve_obj_builder.cleaner import STRONG_CATEGORY_IDS
+from eos.eve_obj_builder.cleaner import STRONG_GROUP_IDS
 from eos.util.repr import make_repr_str
 from .base import BaseDataHandler
 
 
+# Columns eve object builder uses, other columns are not fetched
+# Format: {table name: (column names)}
+TABLE_COLUMNS = {
+    'evetypes': (
+        'typeID', 'groupID', 'radius', 'mass', 'volume', 'capacity'),
+    'evegroups': ('groupID', 'categoryID'),
+    'dgmattribs': (
+        'attributeID', 'maxAttributeID', 'defaultValue', 'highIsGood',
+        'stackable'),
+    'dgmtypeattribs': ('typeID', 'attributeID', 'value'),
+    'dgmeffects': (
+        'effectID', 'effectCategory', 'isOffensive', 'isAssistance',
+        'durationAttributeID', 'dischargeAttributeID', 'rangeAttributeID',
+        'falloffAttributeID', 'trackingSpeedAttributeID',
+        'fittingUsageChanceAttributeID', 'preExpression', 'postExpression',
+        'modifierInfo'),
+    'dgmtypeeffects': ('typeID', 'effectID', 'isDefault'),
+    'dgmexpressions': (
+        'expressionID', 'operandID', 'arg1', 'arg2', 'expressionValue',
+        'expressionTypeID', 'expressionGroupID', 'expressionAttributeID'),
+    'typefighterabils': (
+        'typeID', 'abilityID', 'cooldownSeconds', 'chargeCount')}
+
+
 class SQLiteDataHandler(BaseDataHandler):
     """
     SQLite data handler implementation.
 
     Handler for loading data from SQLite database. Data should be in Phobos-like
-    format, for details on it refer to JSON data handler doc string.
+    format, for details on it refer to JSON data handler doc string. Fighter
+    abilities are expected in flat typefighterabils table, with one row per
+    ability.
+
+    Only columns which are used by eve object builder are fetched, and rows are
+    streamed from the database, thus each getter result can be iterated over
+    only once.
 
     Args:
         db_path: Path to database file.
+        prefilter (optional): If True, rows of item types which would be
+            removed by eve object builder during cleanup (and rows of their
+            effects, attributes and fighter abilities) are not fetched at all.
+            Prefiltering relies on item types which are referenced only by
+            modifier info being skills, which are always kept anyway.
     """
 
-    def __init__(self, db_path):
+    def __init__(self, db_path, prefilter=False):
         # SQLite stores bools as 0 or 1, convert them to python bool
         sqlite3.register_converter('BOOLEAN', lambda v: int(v) == 1)
-        conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES)
-        conn.row_factory = sqlite3.Row
-        self.cursor = conn.cursor()
+        self.__conn = sqlite3.connect(
+            db_path, detect_types=sqlite3.PARSE_DECLTYPES)
+        self.__conn.row_factory = sqlite3.Row
+        self.prefilter = prefilter
+        self.__kept_types_ready = False
 
     def get_evetypes(self):
-        return self.__fetch_table('evetypes')
+        return self.__fetch_table('evetypes', type_filter_column='typeID')
 
     def get_evegroups(self):
         return self.__fetch_table('evegroups')
@@ -52,29 +92,105 @@ class SQLiteDataHandler(BaseDataHandler):
         return self.__fetch_table('dgmattribs')
 
     def get_dgmtypeattribs(self):
-        return self.__fetch_table('dgmtypeattribs')
+        return self.__fetch_table('dgmtypeattribs', type_filter_column='typeID')
 
     def get_dgmeffects(self):
-        return self.__fetch_table('dgmeffects')
+        condition = None
+        if self.prefilter:
+            self.__ensure_kept_types()
+            condition = (
+                'effectID IN (SELECT effectID FROM dgmtypeeffects '
+                'WHERE typeID IN (SELECT typeID FROM temp.eos_kept_types))')
+        return self.__fetch_table('dgmeffects', condition=condition)
 
     def get_dgmtypeeffects(self):
-        return self.__fetch_table('dgmtypeeffects')
+        return self.__fetch_table('dgmtypeeffects', type_filter_column='typeID')
 
     def get_dgmexpressions(self):
         return self.__fetch_table('dgmexpressions')
 
-    def __fetch_table(self, tablename):
-        self.cursor.execute('SELECT * FROM {}'.format(tablename))
-        return [dict(row) for row in self.cursor]
+    def get_typefighterabils(self):
+        # Older data does not have fighter abilities at all
+        if not self.__get_columns('typefighterabils'):
+            return iter(())
+        return self.__fetch_table(
+            'typefighterabils', type_filter_column='typeID')
+
+    def __fetch_table(
+            self, table_name, type_filter_column=None, condition=None):
+        """Start fetching rows from table.
+
+        Args:
+            table_name: Name of table to fetch rows from.
+            type_filter_column (optional): Name of column with item type ID. If
+                specified and prefiltering is enabled, only rows of item types
+                which survive cleanup are fetched.
+            condition (optional): SQL condition rows should satisfy.
+
+        Returns:
+            Iterator over rows.
+        """
+        columns = self.__get_columns(table_name)
+        query = 'SELECT {} FROM {}'.format(
+            ', '.join('"{}"'.format(c) for c in columns), table_name)
+        if type_filter_column is not None and self.prefilter:
+            self.__ensure_kept_types()
+            condition = (
+                '"{}" IN (SELECT typeID FROM temp.eos_kept_types)'
+            ).format(type_filter_column)
+        if condition is not None:
+            query = '{} WHERE {}'.format(query, condition)
+        cursor = self.__conn.execute(query)
+        return (dict(row) for row in cursor)
+
+    def __get_columns(self, table_name):
+        """Get names of columns builder needs which exist in table."""
+        existing_columns = {
+            row['name'] for row in self.__conn.execute(
+                'PRAGMA table_info({})'.format(table_name))}
+        return tuple(
+            c for c in TABLE_COLUMNS[table_name] if c in existing_columns)
+
+    def __ensure_kept_types(self):
+        """Fill temporary table with IDs of item types cleanup keeps.
+
+        Besides item types from strong categories and groups, the table has item
+        types referenced by expressions and, recursively, via attributes which
+        define loaded charges.
+        """
+        if self.__kept_types_ready:
+            return
+        strong_category_ids = ', '.join(str(i) for i in STRONG_CATEGORY_IDS)
+        strong_group_ids = ', '.join(str(i) for i in STRONG_GROUP_IDS)
+        charge_attr_ids = ', '.join(str(i) for i in (
+            AttrId.ammo_loaded, AttrId.fighter_ability_launch_bomb_type))
+        self.__conn.execute(
+            'CREATE TEMP TABLE IF NOT EXISTS eos_kept_types '
+            '(typeID INTEGER PRIMARY KEY)')
+        self.__conn.execute(
+            'INSERT OR IGNORE INTO temp.eos_kept_types '
+            'WITH RECURSIVE kept(typeID) AS ('
+            'SELECT typeID FROM evetypes WHERE groupID IN ('
+            'SELECT groupID FROM evegroups WHERE categoryID IN ({})) '
+            'OR groupID IN ({}) '
+            'UNION SELECT expressionTypeID FROM dgmexpressions '
+            'WHERE expressionTypeID IS NOT NULL '
+            'UNION SELECT CAST(dta.value AS INTEGER) FROM dgmtypeattribs dta '
+            'JOIN kept ON dta.typeID = kept.typeID '
+            'WHERE dta.attributeID IN ({})) '
+            'SELECT typeID FROM kept'.format(
+                strong_category_ids, strong_group_ids, charge_attr_ids))
+        self.__kept_types_ready = True
 
     def get_version(self):
-        self.cursor.execute(
+        cursor = self.__conn.execute(
             'SELECT field_value FROM phbmetadata '
             'WHERE field_name = "client_build"')
-        for row in self.cursor:
+        for row in cursor:
             return row[0]
         else:
             return None
 
     def __repr__(self):
-        return make_repr_str(self)
+        spec = ['prefilter']
+        return make_repr_str(self, spec)
@@ -0,0 +1,89 @@
+# ==============================================================================
+# Copyright (C) 2013-2017 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import os
+
+from eos.util.json_stream import iter_json_items
+from eos.util.repr import make_repr_str
+from .base import BaseDataHandler
+from .json_data_handler import iter_fighter_abil_rows
+
+
+class StreamingJsonDataHandler(BaseDataHandler):
+    """Streaming JSON data handler implementation.
+
+    Loads the same data as JSON data handler, but instead of loading whole files
+    into memory, parses them incrementally and yields rows one by one. Rows
+    can be iterated over only once.
+
+    Args:
+        basepath: Path to folder with JSON files.
+        chunk_size (optional): Quantity of characters to read from file at
+            once.
+    """
+
+    def __init__(self, basepath, chunk_size=65536):
+        self.basepath = os.path.abspath(basepath)
+        self.chunk_size = chunk_size
+
+    def get_evetypes(self):
+        return self.__iter_file('evetypes')
+
+    def get_evegroups(self):
+        return self.__iter_file('evegroups')
+
+    def get_dgmattribs(self):
+        return self.__iter_file('dgmattribs')
+
+    def get_dgmtypeattribs(self):
+        return self.__iter_file('dgmtypeattribs')
+
+    def get_dgmeffects(self):
+        return self.__iter_file('dgmeffects')
+
+    def get_dgmtypeeffects(self):
+        return self.__iter_file('dgmtypeeffects')
+
+    def get_dgmexpressions(self):
+        return self.__iter_file('dgmexpressions')
+
+    def get_typefighterabils(self):
+        fighter_abils = self.__iter_file('fighterabilitiesbytype', keys=True)
+        return iter_fighter_abil_rows(fighter_abils)
+
+    def __iter_file(self, filename, keys=False):
+        filepath = os.path.join(self.basepath, '{}.json'.format(filename))
+        with open(filepath, mode='r', encoding='utf8') as file:
+            for key, value in iter_json_items(file, self.chunk_size):
+                if keys:
+                    yield key, value
+                else:
+                    yield value
+
+    def get_version(self):
+        for row in self.__iter_file('phbmetadata'):
+            if row['field_name'] == 'client_build':
+                return row['field_value']
+        else:
+            return None
+
+    def __repr__(self):
+        spec = ['basepath']
+        return make_repr_str(self, spec)
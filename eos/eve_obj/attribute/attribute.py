@@ -37,6 +37,9 @@ class Attribute:
             penalized (False) or not (True).
     """
 
+    __slots__ = (
+        'id', 'max_attr_id', 'default_value', 'high_is_good', 'stackable')
+
     def __init__(
             self, attr_id, max_attr_id=None, default_value=None,
             high_is_good=True, stackable=True):
@@ -26,9 +26,6 @@ from eos.const.eve import AttrId
 from eos.const.eve import TypeId
 from eos.eve_obj.modifier import BasePythonModifier
 from eos.eve_obj.modifier import ModificationCalculationError
-from eos.pubsub.message import AttrValueChanged
-from eos.pubsub.message import ItemAdded
-from eos.pubsub.message import ItemRemoved
 
 
 class AncillaryRepAmountModifier(BasePythonModifier):
@@ -51,35 +48,10 @@ class AncillaryRepAmountModifier(BasePythonModifier):
             value = 1
         return ModOperator.post_mul_immune, value
 
-    def __revise_on_item_added_removed(self, msg, carrier_item):
-        # If added/removed item is charge of effect carrying item and charge is
-        # paste, then modification value changes
-        if (
-            getattr(carrier_item, 'charge', None) is msg.item and
-            msg.item._type_id == TypeId.nanite_repair_paste
-        ):
-            return True
-        return False
-
-    def __revise_on_attr_changed(self, msg, carrier_item):
-        # If armor rep multiplier changes, then result of modification also
-        # should change
-        if (
-            msg.item is carrier_item and
-            msg.attr_id == AttrId.charged_armor_dmg_mult
-        ):
-            return True
-        return False
-
-    __revision_map = {
-        ItemAdded: __revise_on_item_added_removed,
-        ItemRemoved: __revise_on_item_added_removed,
-        AttrValueChanged: __revise_on_attr_changed}
-
     @property
-    def revise_msg_types(self):
-        return set(self.__revision_map.keys())
+    def attr_dependencies(self):
+        return ((ModDomain.self, AttrId.charged_armor_dmg_mult),)
 
-    def revise_modification(self, msg, carrier_item):
-        revision_func = self.__revision_map[type(msg)]
-        return revision_func(self, msg, carrier_item)
+    @property
+    def charge_dependency(self):
+        return True
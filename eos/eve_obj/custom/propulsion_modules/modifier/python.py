@@ -27,7 +27,6 @@ from eos.const.eos import ModTgtFilter
 from eos.const.eve import AttrId
 from eos.eve_obj.modifier import BasePythonModifier
 from eos.eve_obj.modifier import ModificationCalculationError
-from eos.pubsub.message import AttrValueChanged
 
 
 logger = getLogger(__name__)
@@ -62,33 +61,9 @@ class PropulsionModuleVelocityBoostModifier(BasePythonModifier):
             mult = 1 + perc / 100
             return ModOperator.post_mul, mult
 
-    def __revise_on_attr_changed(self, msg, carrier_item):
-        """
-        If any of the attribute values this modifier relies on is changed, then
-        modification value can be changed as well.
-        """
-        ship = carrier_item._fit.ship
-        if msg.item is ship and msg.attr_id == AttrId.mass:
-            return True
-        if (
-            msg.item is carrier_item and
-            msg.attr_id == AttrId.speed_factor
-        ):
-            return True
-        if (
-            msg.item is carrier_item and
-            msg.attr_id == AttrId.speed_boost_factor
-        ):
-            return True
-        return False
-
-    __revision_map = {
-        AttrValueChanged: __revise_on_attr_changed}
-
     @property
-    def revise_msg_types(self):
-        return set(self.__revision_map)
-
-    def revise_modification(self, msg, carrier_item):
-        revision_func = self.__revision_map[type(msg)]
-        return revision_func(self, msg, carrier_item)
+    def attr_dependencies(self):
+        return (
+            (ModDomain.ship, AttrId.mass),
+            (ModDomain.self, AttrId.speed_factor),
+            (ModDomain.self, AttrId.speed_boost_factor))
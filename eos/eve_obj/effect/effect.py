@@ -63,6 +63,13 @@ class Effect:
             attribute calculation may be improper in several edge cases.
     """
 
+    __slots__ = (
+        'id', 'category_id', 'is_offensive', 'is_assistance',
+        'duration_attr_id', 'discharge_attr_id', 'range_attr_id',
+        'falloff_attr_id', 'tracking_speed_attr_id',
+        'fitting_usage_chance_attr_id', 'build_status', 'modifiers',
+        '_cached__state')
+
     def __init__(
             self, effect_id, category_id=None, is_offensive=False,
             is_assistance=False, duration_attr_id=None,
@@ -36,6 +36,8 @@ class DogmaModifier(BaseModifier):
     efficiently.
     """
 
+    __slots__ = ('operator', 'src_attr_id')
+
     def __init__(
             self, tgt_filter=None, tgt_domain=None, tgt_filter_extra_arg=None,
             tgt_attr_id=None, operator=None, src_attr_id=None):
@@ -20,7 +20,6 @@
 
 
 from abc import ABCMeta
-from abc import abstractmethod
 
 from eos.util.repr import make_repr_str
 from .base import BaseModifier
@@ -31,8 +30,16 @@ class BasePythonModifier(BaseModifier, metaclass=ABCMeta):
 
     Python modifiers offer more capabilities than dogma modifiers, but it comes
     at performance cost.
+
+    To let calculator know when modification value may change, modifier can
+    declare its dependencies via attribute dependencies and charge dependency.
+    Such dependencies are indexed, thus they are cheap to track. Anything which
+    cannot be expressed this way can be handled via message revision, which
+    delivers all messages of requested types to the modifier.
     """
 
+    __slots__ = ()
+
     def __init__(
             self, tgt_filter=None, tgt_domain=None, tgt_filter_extra_arg=None,
             tgt_attr_id=None):
@@ -41,7 +48,27 @@ class BasePythonModifier(BaseModifier, metaclass=ABCMeta):
             tgt_filter_extra_arg=tgt_filter_extra_arg, tgt_attr_id=tgt_attr_id)
 
     @property
-    @abstractmethod
+    def attr_dependencies(self):
+        """Get attributes which modification value relies on.
+
+        Returns:
+            Iterable with (domain, attribute ID) tuples. Domain specifies item
+            relatively to carrier item, and can be self, other, ship or
+            character.
+        """
+        return ()
+
+    @property
+    def charge_dependency(self):
+        """Tell if modification value relies on charge of carrier item.
+
+        Returns:
+            Boolean flag which tells if modification may change when charge is
+            added to or removed from carrier item.
+        """
+        return False
+
+    @property
     def revise_msg_types(self):
         """Get types of messages which this modifier cares about.
 
@@ -49,9 +76,8 @@ class BasePythonModifier(BaseModifier, metaclass=ABCMeta):
             Iterable with message types which potentially may change
             modification.
         """
-        ...
+        return ()
 
-    @abstractmethod
     def revise_modification(self, msg, carrier_item):
         """Decide if modification value may change.
 
@@ -65,7 +91,7 @@ class BasePythonModifier(BaseModifier, metaclass=ABCMeta):
             Boolean flag which tells if modification may change (True) or it
             cannot (False).
         """
-        ...
+        return False
 
     # Auxiliary methods
     def __repr__(self):
@@ -52,6 +52,11 @@ class Type:
             (cooldown time, charge quantity)} format.
     """
 
+    __slots__ = (
+        'id', 'group_id', 'category_id', 'attrs', 'effects', 'default_effect',
+        'abilities_data', '_cached_effects_data', '_cached_required_skills',
+        '_cached_max_state')
+
     def __init__(
             self, type_id, group_id=None, category_id=None, attrs=None,
             effects=(), default_effect=None, abilities_data=None):
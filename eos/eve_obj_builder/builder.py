@@ -19,31 +19,97 @@
 # ==============================================================================
 
 
+from logging import getLogger
+from sys import intern
+from time import perf_counter
+
 from eos.util.frozendict import frozendict
 from .cleaner import Cleaner
 from .converter import Converter
 from .normalizer import Normalizer
+from .state import BuildState
 from .validator_preclean import ValidatorPreClean
 from .validator_preconv import ValidatorPreConv
 
 
+logger = getLogger(__name__)
+
+
 class EveObjBuilder:
     """Builds Eos-specific eve objects from passed data."""
 
-    @staticmethod
-    def run(data_handler):
+    @classmethod
+    def run(cls, data_handler, workers=None):
         """Run eve object building process.
 
         Use data provided by passed cache handler to compose various objects
-        with the help of which eos will oeprate.
+        with the help of which eos will oeprate. Time taken by each stage is
+        logged.
 
         Args:
             data_handler: Data handler instance, which should provide access to
                 raw eve data.
+            workers (optional): If more than 1, stages which process data on
+                per-row basis use process pool with this quantity of worker
+                processes. By default, everything runs in current process.
 
         Returns:
             3 iterables, which contain types, attributes and effects.
         """
+        data = cls.__prepare_data(data_handler)
+        # Convert data into Eos-specific objects
+        started = perf_counter()
+        types, attrs, effects = Converter.run(data, workers=workers)
+        cls.__log_stage_time('conversion', started)
+        return types, attrs, effects
+
+    @classmethod
+    def run_incremental(cls, data_handler, prev_state=None, workers=None):
+        """Run eve object building process, reusing previous build results.
+
+        Cleaned data is compared against data used for previous build on
+        per-table basis, and only eve objects affected by changes are
+        converted again.
+
+        Args:
+            data_handler: Data handler instance, which should provide access to
+                raw eve data.
+            prev_state (optional): Build state returned by previous run. When
+                not specified, all objects are built from scratch.
+            workers (optional): Quantity of worker processes, see run().
+
+        Returns:
+            Tuple with 2 elements: 3 iterables, which contain types, attributes
+            and effects, and build state, which can be used for the next
+            incremental build.
+        """
+        data = cls.__prepare_data(data_handler)
+        started = perf_counter()
+        digests = BuildState.get_digests(data)
+        if prev_state is not None:
+            reusable = prev_state.get_reusable(data, digests)
+        else:
+            reusable = ({}, {}, {})
+        started = cls.__log_stage_time('diffing', started)
+        eve_objects = Converter.run(data, workers=workers, reusable=reusable)
+        cls.__log_stage_time('conversion', started)
+        for objects, reused, name in zip(eve_objects, reusable, (
+            'types', 'attributes', 'effects'
+        )):
+            msg = '{} of {} {} reused from previous build'.format(
+                len(reused.keys() & {o.id for o in objects}), len(objects),
+                name)
+            logger.info(msg)
+        return eve_objects, BuildState(digests, eve_objects)
+
+    @classmethod
+    def __prepare_data(cls, data_handler):
+        """Fetch data from data handler and prepare it for conversion.
+
+        Returns:
+            Dictionary in {table name: {table, rows}} format.
+        """
+        started = perf_counter()
         # Put all the data we need into single dictionary Format, as usual,
         # {table name: table}, where table is set of rows, which are
         # represented by frozendicts {fieldName: fieldValue}. Combination of
@@ -70,24 +136,42 @@ class EveObjBuilder:
                 # data, write position to each row
                 row['table_pos'] = table_pos
                 table_pos += 1
-                table.add(frozendict(row))
+                # Rows coming from streaming data handlers do not share field
+                # name strings, thus intern them to avoid keeping a copy per
+                # row
+                table.add(frozendict((intern(k), v) for k, v in row.items()))
             data[table_name] = table
+        started = cls.__log_stage_time('data loading', started)
 
         # Run pre-cleanup checks, as cleanup stage and further stages rely on
         # some assumptions about the data
         ValidatorPreClean.run(data)
+        started = cls.__log_stage_time('pre-cleanup validation', started)
 
         # Normalize the data to make data structure more consistent, making it
         # easier to clean properly
         Normalizer.run(data)
+        started = cls.__log_stage_time('normalization', started)
 
         # Remove unwanted data
         Cleaner().clean(data)
+        started = cls.__log_stage_time('cleanup', started)
 
         # Verify that our data is ready for conversion
         ValidatorPreConv.run(data)
+        cls.__log_stage_time('pre-conversion validation', started)
 
-        # Convert data into Eos-specific objects
-        types, attrs, effects = Converter.run(data)
+        return data
 
-        return types, attrs, effects
+    @staticmethod
+    def __log_stage_time(stage_name, started):
+        """Log time taken by builder stage.
+
+        Returns:
+            Time when stage was finished.
+        """
+        finished = perf_counter()
+        msg = 'stage "{}" finished in {:.3f} s'.format(
+            stage_name, finished - started)
+        logger.info(msg)
+        return finished
@@ -34,6 +34,20 @@ from eos.util.cached_property import cached_property
 logger = getLogger(__name__)
 
 
+# Category IDs of item types we want to keep
+STRONG_CATEGORY_IDS = (
+    TypeCategoryId.charge,
+    TypeCategoryId.drone,
+    TypeCategoryId.fighter,
+    TypeCategoryId.implant,
+    TypeCategoryId.module,
+    TypeCategoryId.ship,
+    TypeCategoryId.skill,
+    TypeCategoryId.subsystem)
+# Group IDs of item types we want to keep
+STRONG_GROUP_IDS = (TypeGroupId.character, TypeGroupId.effect_beacon)
+
+
 class Cleaner:
     """Removes unnecessary data."""
 
@@ -61,22 +75,11 @@ class Cleaner:
 
     def _pump_evetypes(self):
         """Mark some hardcoded item types as strong."""
-        # Tuple with category IDs of item types we want to keep
-        strong_category_ids = (
-            TypeCategoryId.charge,
-            TypeCategoryId.drone,
-            TypeCategoryId.fighter,
-            TypeCategoryId.implant,
-            TypeCategoryId.module,
-            TypeCategoryId.ship,
-            TypeCategoryId.skill,
-            TypeCategoryId.subsystem)
-        # Set with group IDs of item types we want to keep
-        strong_group_ids = {TypeGroupId.character, TypeGroupId.effect_beacon}
+        strong_group_ids = set(STRONG_GROUP_IDS)
         # Go through table data, filling valid groups set according to valid
         # categories
         for datarow in self.data['evegroups']:
-            if datarow.get('categoryID') in strong_category_ids:
+            if datarow.get('categoryID') in STRONG_CATEGORY_IDS:
                 strong_group_ids.add(datarow['groupID'])
         rows_to_pump = set()
         for datarow in self.data['evetypes']:
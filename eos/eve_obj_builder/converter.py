@@ -20,6 +20,7 @@
 
 
 import math
+from concurrent.futures import ProcessPoolExecutor
 
 from eos.eve_obj.attribute import Attribute
 from eos.eve_obj.effect import Effect
@@ -28,18 +29,32 @@ from eos.eve_obj.type import Type
 from .mod_builder import ModBuilder
 
 
+# Quantity of effect rows sent to process pool worker at once
+WORKER_CHUNK_SIZE = 250
+
+
 class Converter:
 
     @staticmethod
-    def run(data):
+    def run(data, workers=None, reusable=None):
         """Convert data into eve objects.
 
         Args:
             data: Dictionary in {table name: {table, rows}} format.
+            workers (optional): If more than 1, modifiers are built in process
+                pool with this quantity of worker processes. By default, they
+                are built in current process.
+            reusable (optional): Tuple with 3 dictionaries in {ID: object}
+                format, which contain types, attributes and effects which are
+                not affected by changes in data since they were built. Such
+                objects are taken as-is instead of being converted again.
 
         Returns:
             3 iterables, which contain types, attributes and effects.
         """
+        if reusable is None:
+            reusable = ({}, {}, {})
+        reusable_types, reusable_attrs, reusable_effects = reusable
         # Before actually instantiating anything, we need to collect some data
         # in convenient form
         # Format: {group ID: group row}
@@ -72,6 +87,10 @@ class Converter:
         # Convert attributes
         attrs = []
         for row in data['dgmattribs']:
+            attr = reusable_attrs.get(row['attributeID'])
+            if attr is not None:
+                attrs.append(attr)
+                continue
             attrs.append(Attribute(
                 attr_id=row['attributeID'],
                 max_attr_id=row.get('maxAttributeID'),
@@ -81,9 +100,21 @@ class Converter:
 
         # Convert effects
         effects = []
-        mod_builder = ModBuilder(data['dgmexpressions'])
-        for row in data['dgmeffects']:
-            modifiers, build_status = mod_builder.build(row)
+        # Process rows in the order they were in original data, so that
+        # results do not depend on how modifiers were built
+        effect_rows = sorted(data['dgmeffects'], key=lambda r: r['table_pos'])
+        effects.extend(
+            reusable_effects[r['effectID']] for r in effect_rows
+            if r['effectID'] in reusable_effects)
+        effect_rows = [
+            r for r in effect_rows if r['effectID'] not in reusable_effects]
+        if workers is not None and workers > 1:
+            mod_data = _build_mods_parallel(
+                data['dgmexpressions'], effect_rows, workers)
+        else:
+            mod_builder = ModBuilder(data['dgmexpressions'])
+            mod_data = (mod_builder.build(row) for row in effect_rows)
+        for row, (modifiers, build_status) in zip(effect_rows, mod_data):
             effects.append(Effect(
                 effect_id=row['effectID'],
                 category_id=row.get('effectCategory'),
@@ -104,6 +135,10 @@ class Converter:
         effect_map = {e.id: e for e in effects}
         for row in data['evetypes']:
             type_id = row['typeID']
+            item_type = reusable_types.get(type_id)
+            if item_type is not None:
+                types.append(item_type)
+                continue
             type_group = row.get('groupID')
             type_effect_ids = types_effects.get(type_id, set())
             type_effect_ids.intersection_update(effect_map)
@@ -117,3 +152,39 @@ class Converter:
                 abilities_data=types_abilities_data.get(type_id, {})))
 
         return types, attrs, effects
+
+
+def _build_mods_parallel(exp_rows, effect_rows, workers):
+    """Build modifiers for passed effect rows in process pool.
+
+    Returns:
+        List with results of modifier building, in the same order as effect rows
+        were passed.
+    """
+    # Frozendicts cannot be unpickled, thus pass data as regular dictionaries
+    chunks = []
+    for i in range(0, len(effect_rows), WORKER_CHUNK_SIZE):
+        chunks.append([
+            dict(row) for row in effect_rows[i:i + WORKER_CHUNK_SIZE]])
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=([dict(row) for row in exp_rows],)
+    ) as executor:
+        mod_data = []
+        for chunk_results in executor.map(_build_mods_chunk, chunks):
+            mod_data.extend(chunk_results)
+    return mod_data
+
+
+# Modifier builder of process pool worker
+_worker_mod_builder = None
+
+
+def _init_worker(exp_rows):
+    global _worker_mod_builder
+    _worker_mod_builder = ModBuilder(exp_rows)
+
+
+def _build_mods_chunk(effect_rows):
+    return [_worker_mod_builder.build(row) for row in effect_rows]
@@ -0,0 +1,179 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import bz2
+import hashlib
+import os
+import pickle
+from logging import getLogger
+from operator import itemgetter
+
+from eos import __version__ as eos_version
+from .validator_preclean import TABLE_PKS
+
+
+logger = getLogger(__name__)
+
+
+class BuildState:
+    """Results of eve object building process.
+
+    Besides eve objects themselves, contains digests of data they were built
+    from, which allows to find out which objects are affected by data changes.
+
+    Args:
+        digests: Dictionary in {table name: {primary key: row digest}} format.
+        eve_objects: Tuple with 3 iterables, which contain types, attributes
+            and effects.
+    """
+
+    def __init__(self, digests, eve_objects):
+        self.digests = digests
+        types, attrs, effects = eve_objects
+        self.types = {t.id: t for t in types}
+        self.attrs = {a.id: a for a in attrs}
+        self.effects = {e.id: e for e in effects}
+
+    @classmethod
+    def load(cls, path):
+        """Load build state from file.
+
+        Returns:
+            Build state, or None if file doesn't exist, is broken or was written
+            by different version of eos.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with bz2.BZ2File(path, 'r') as file:
+                version, state = pickle.load(file)
+        except KeyboardInterrupt:
+            raise
+        except:
+            msg = 'error during reading build state'
+            logger.error(msg)
+            return None
+        if version != eos_version:
+            msg = 'build state was made by eos {}, discarding it'.format(
+                version)
+            logger.info(msg)
+            return None
+        return state
+
+    def save(self, path):
+        """Write build state to file."""
+        state_folder = os.path.dirname(path)
+        if state_folder and os.path.isdir(state_folder) is not True:
+            os.makedirs(state_folder, mode=0o755)
+        with bz2.BZ2File(path, 'w') as file:
+            pickle.dump((eos_version, self), file)
+
+    @staticmethod
+    def get_digests(data):
+        """Calculate digests of passed data rows.
+
+        Args:
+            data: Dictionary in {table name: {table, rows}} format.
+
+        Returns:
+            Dictionary in {table name: {primary key: row digest}} format.
+        """
+        digests = {}
+        for table_name, pks in TABLE_PKS.items():
+            table_digests = digests[table_name] = {}
+            for row in data[table_name]:
+                # Position of row in original data doesn't influence results
+                # of conversion
+                content = sorted(
+                    ((k, v) for k, v in row.items() if k != 'table_pos'),
+                    key=itemgetter(0))
+                digest = hashlib.md5(repr(content).encode('utf-8')).digest()
+                table_digests[tuple(row[pk] for pk in pks)] = digest
+        return digests
+
+    def get_reusable(self, data, digests):
+        """Find eve objects which are not affected by data changes.
+
+        Args:
+            data: Dictionary in {table name: {table, rows}} format, with data
+                for the next build.
+            digests: Digests of data for the next build.
+
+        Returns:
+            3 dictionaries, which contain types, attributes and effects which
+            can be used as-is, keyed against their IDs.
+        """
+        changed = {}
+        for table_name in TABLE_PKS:
+            old_digests = self.digests.get(table_name, {})
+            new_digests = digests[table_name]
+            changed[table_name] = {
+                pk for pk in old_digests.keys() | new_digests.keys()
+                if old_digests.get(pk) != new_digests.get(pk)}
+        # Attributes do not depend on anything besides their rows
+        changed_attr_ids = {pk[0] for pk in changed['dgmattribs']}
+        # Expressions are organized in trees, and change of any expression
+        # taints all expressions which refer it
+        # Format: {expression ID: {parent expression IDs}}
+        exp_parents = {}
+        for row in data['dgmexpressions']:
+            for arg_name in ('arg1', 'arg2'):
+                exp_parents.setdefault(row.get(arg_name), set()).add(
+                    row['expressionID'])
+        tainted_exp_ids = set()
+        exp_ids_to_check = {pk[0] for pk in changed['dgmexpressions']}
+        while exp_ids_to_check:
+            exp_id = exp_ids_to_check.pop()
+            if exp_id in tainted_exp_ids:
+                continue
+            tainted_exp_ids.add(exp_id)
+            exp_ids_to_check.update(exp_parents.get(exp_id, ()))
+        changed_effect_ids = {pk[0] for pk in changed['dgmeffects']}
+        for row in data['dgmeffects']:
+            if (
+                row.get('preExpression') in tainted_exp_ids or
+                row.get('postExpression') in tainted_exp_ids
+            ):
+                changed_effect_ids.add(row['effectID'])
+        # Types contain effects, thus changed effects affect types they are
+        # assigned to
+        changed_type_ids = {pk[0] for pk in changed['evetypes']}
+        for table_name in (
+            'dgmtypeattribs', 'dgmtypeeffects', 'typefighterabils'
+        ):
+            changed_type_ids.update(pk[0] for pk in changed[table_name])
+        for row in data['dgmtypeeffects']:
+            if row['effectID'] in changed_effect_ids:
+                changed_type_ids.add(row['typeID'])
+        changed_group_ids = {pk[0] for pk in changed['evegroups']}
+        for row in data['evetypes']:
+            if row.get('groupID') in changed_group_ids:
+                changed_type_ids.add(row['typeID'])
+        types = {
+            type_id: item_type for type_id, item_type in self.types.items()
+            if type_id not in changed_type_ids}
+        attrs = {
+            attr_id: attr for attr_id, attr in self.attrs.items()
+            if attr_id not in changed_attr_ids}
+        effects = {
+            effect_id: effect for effect_id, effect in self.effects.items()
+            if effect_id not in changed_effect_ids}
+        return types, attrs, effects
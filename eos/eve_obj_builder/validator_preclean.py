@@ -26,6 +26,18 @@ from numbers import Integral
 logger = getLogger(__name__)
 
 
+# Format: {table name: (primary, keys)}
+TABLE_PKS = {
+    'dgmattribs': ('attributeID',),
+    'dgmeffects': ('effectID',),
+    'dgmexpressions': ('expressionID',),
+    'dgmtypeattribs': ('typeID', 'attributeID'),
+    'dgmtypeeffects': ('typeID', 'effectID'),
+    'evegroups': ('groupID',),
+    'evetypes': ('typeID',),
+    'typefighterabils': ('typeID', 'abilityID')}
+
+
 class ValidatorPreClean:
 
     @staticmethod
@@ -39,17 +51,7 @@ class ValidatorPreClean:
         Args:
             data: Dictionary in {table name: {table, rows}} format.
         """
-        # Format: {table name: (primary, keys)}
-        pk_spec = {
-            'dgmattribs': ('attributeID',),
-            'dgmeffects': ('effectID',),
-            'dgmexpressions': ('expressionID',),
-            'dgmtypeattribs': ('typeID', 'attributeID'),
-            'dgmtypeeffects': ('typeID', 'effectID'),
-            'evegroups': ('groupID',),
-            'evetypes': ('typeID',),
-            'typefighterabils': ('typeID', 'abilityID')}
-        for table_name, pks in pk_spec.items():
+        for table_name, pks in TABLE_PKS.items():
             ValidatorPreClean._table_pk(pks, data[table_name], table_name)
 
     @staticmethod
@@ -19,9 +19,14 @@
 # ==============================================================================
 
 
+from contextlib import contextmanager
 from itertools import chain
 
+from eos.calculator import AttrSnapshot
 from eos.const.eve import TypeId
+from eos.fit_spec import SpecFormatError
+from eos.fit_spec import fill_fit
+from eos.fit_spec import make_spec
 from eos.item import Booster
 from eos.item import Character
 from eos.item import Drone
@@ -42,7 +47,10 @@ from eos.item_container import ItemSet
 from eos.item_container import ModuleRacks
 from eos.item_container import TypeUniqueItemSet
 from eos.pubsub.broker import FitMsgBroker
+from eos.pubsub.message import BatchFinished
+from eos.pubsub.message import BatchStarted
 from eos.pubsub.message import DefaultIncomingDmgChanged
+from eos.pubsub.message import ProfileAffectorsChanged
 from eos.pubsub.message import RahIncomingDmgChanged
 from eos.restriction import RestrictionService
 from eos.sim import ReactiveArmorHardenerSimulator
@@ -76,6 +84,8 @@ class Fit(FitMsgBroker):
         skills: Keyed set for skills.
         implants: Set for implants.
         boosters: Set for boosters.
+        character_profile: Access point for character profile, whose items
+            influence the fit in addition to fit's own items.
         effect_beacon: Access point for effect beacons (e.g. wormhole effects).
         stats: All aggregated stats for fit are accessible via this access
             point.
@@ -83,8 +93,10 @@ class Fit(FitMsgBroker):
 
     def __init__(self, solar_system=None):
         FitMsgBroker.__init__(self)
+        self.__batch_depth = 0
         self.__incoming_dmg_default = None
         self.__incoming_dmg_rah = None
+        self.__character_profile = None
         # Character-related item containers
         self.skills = TypeUniqueItemSet(self, Skill)
         self.implants = ItemSet(self, Implant)
@@ -120,6 +132,156 @@ class Fit(FitMsgBroker):
     stance = ItemDescriptor('__stance', Stance)
     effect_beacon = ItemDescriptor('__effect_beacon', EffectBeacon)
 
+    @contextmanager
+    def batch(self):
+        """Context manager which allows to change fit in bulk efficiently.
+
+        Items added to the fit within the context are loaded only when it is
+        exited, and attribute values which are affected by changes made within
+        the context are invalidated once, also on exit. Because of that, values
+        of attributes and stats fetched within the context are not reliable.
+        Contexts can be nested, in which case all the work is done on exit from
+        outermost context.
+
+        Yields:
+            The fit itself.
+        """
+        if self.__batch_depth == 0:
+            self._publish(BatchStarted())
+        self.__batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0:
+                for item in self._item_iter(skip_autoitems=True):
+                    if not item._is_loaded:
+                        item._load()
+                self._publish(BatchFinished())
+
+    def copy(self, solar_system=None, copy_attrs=True):
+        """Make copy of the fit.
+
+        All items are copied along with the data set on them (states, charges,
+        skill levels, effect modes and so on).
+
+        Args:
+            solar_system (optional): Assign copy to this solar system. If not
+                specified, new solar system with the same source is created
+                (with no source, if the fit is not assigned to any solar
+                system).
+            copy_attrs (optional): If True (default), already calculated
+                attribute values are carried over to copied items, when both
+                fits use the same source.
+
+        Returns:
+            Fit copy.
+        """
+        source = getattr(self.solar_system, 'source', None)
+        if solar_system is None:
+            solar_system = SolarSystem(source=source)
+        fit = Fit(solar_system=solar_system)
+        # Format: [(original item, item copy)]
+        item_pairs = []
+
+        def clone(item):
+            item_clone = item._clone()
+            item_pairs.append((item, item_clone))
+            return item_clone
+
+        with fit.batch():
+            for descriptor_name in (
+                'character', 'ship', 'stance', 'effect_beacon'
+            ):
+                item = getattr(self, descriptor_name)
+                if item is not None:
+                    item = clone(item)
+                setattr(fit, descriptor_name, item)
+            for container_name in (
+                'skills', 'implants', 'boosters', 'subsystems', 'rigs',
+                'drones', 'fighters'
+            ):
+                container_clone = getattr(fit, container_name)
+                for item in getattr(self, container_name):
+                    container_clone.add(clone(item))
+            for rack_name in ('high', 'mid', 'low'):
+                rack_clone = getattr(fit.modules, rack_name)
+                for index, item in enumerate(getattr(self.modules, rack_name)):
+                    if item is not None:
+                        rack_clone.place(index, clone(item))
+            fit.default_incoming_dmg = self.default_incoming_dmg
+            fit.rah_incoming_dmg = self.rah_incoming_dmg
+            fit.character_profile = self.character_profile
+        if (
+            copy_attrs and
+            self.solar_system is not None and
+            solar_system.source is source
+        ):
+            for item, item_clone in item_pairs:
+                self.__copy_attrs(item, item_clone)
+        return fit
+
+    def to_spec(self):
+        """Make compact specification of the fit.
+
+        Specification contains only tuples, numbers and Nones, thus it is
+        hashable and can be stored as JSON. It carries all items along with
+        the data set on them (states, charges, skill levels, effect modes and
+        so on), and incoming damage profiles. Character profile and item
+        coordinates are not included.
+
+        Returns:
+            Fit specification.
+        """
+        return make_spec(self)
+
+    @classmethod
+    def from_spec(cls, spec, solar_system=None):
+        """Make fit out of specification.
+
+        Args:
+            spec: Fit specification, made by to_spec().
+            solar_system (optional): Assign fit to this solar system. If not
+                specified, new solar system is created.
+
+        Returns:
+            Fit instance.
+
+        Raises:
+            SpecFormatError: If specification has unknown version or is
+                malformed.
+        """
+        fit = cls(solar_system=solar_system)
+        try:
+            fill_fit(fit, spec)
+        except SpecFormatError:
+            fit.solar_system.fits.remove(fit)
+            raise
+        return fit
+
+    @classmethod
+    def __copy_attrs(cls, item, item_clone):
+        """Carry over attribute values to item copy and its child items."""
+        if not item._is_loaded or not item_clone._is_loaded:
+            return
+        item_clone.attrs._copy_values(item.attrs)
+        # Child items set by user are copied along with their parent, thus
+        # they go in the same order
+        for child_item, child_clone in zip(
+            item._child_item_iter(skip_autoitems=True),
+            item_clone._child_item_iter(skip_autoitems=True)
+        ):
+            cls.__copy_attrs(child_item, child_clone)
+        # Autocharges are generated on item load
+        for effect_id, autocharge in item.autocharges.items():
+            autocharge_clone = item_clone.autocharges.get(effect_id)
+            if autocharge_clone is not None:
+                cls.__copy_attrs(autocharge, autocharge_clone)
+
+    @property
+    def _in_batch(self):
+        return self.__batch_depth > 0
+
     def validate(self, skip_checks=()):
         """Run fit validation.
 
@@ -134,6 +296,36 @@ class Fit(FitMsgBroker):
         """
         self._restriction.validate(skip_checks)
 
+    def is_valid(self, skip_checks=()):
+        """Check if fit is valid.
+
+        Unlike validate(), does not collect any data about reasons of failure,
+        and thus is faster on invalid fits.
+
+        Args:
+            skip_checks (optional): Iterable with restriction types validation
+                should ignore. By default, nothing is ignored.
+
+        Returns:
+            True if fit passes validation, False otherwise.
+        """
+        return self._restriction.is_valid(skip_checks)
+
+    def attr_snapshot(self, attr_ids, items=None):
+        """Get values of multiple attributes of multiple items at once.
+
+        Args:
+            attr_ids: Iterable with IDs of attributes to include.
+            items (optional): Iterable with items to include. By default, all
+                loaded items of the fit are included.
+
+        Returns:
+            AttrSnapshot instance.
+        """
+        if items is None:
+            items = self._loaded_item_iter()
+        return AttrSnapshot._make(items, attr_ids)
+
     @property
     def default_incoming_dmg(self):
         """Access point for default incoming damage profile.
@@ -181,6 +373,32 @@ class Fit(FitMsgBroker):
         if new_profile != old_profile:
             self._publish(RahIncomingDmgChanged())
 
+    @property
+    def character_profile(self):
+        """Access point for character profile.
+
+        Items of character profile influence the fit as if they were fit's own
+        items, while being shared with other fits which refer the same profile.
+        Setter accepts CharacterProfile instances and None.
+        """
+        return self.__character_profile
+
+    @character_profile.setter
+    def character_profile(self, new_profile):
+        old_profile = self.__character_profile
+        if new_profile is old_profile:
+            return
+        affectors = set()
+        if old_profile is not None:
+            old_profile._remove_fit(self)
+            affectors.update(old_profile._affectors)
+        self.__character_profile = new_profile
+        if new_profile is not None:
+            new_profile._add_fit(self)
+            affectors.update(new_profile._affectors)
+        if affectors:
+            self._publish(ProfileAffectorsChanged(affectors))
+
     def _unload_items(self):
         for item in self._item_iter(skip_autoitems=True):
             item._unload()
@@ -0,0 +1,223 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import json
+from struct import Struct
+from struct import error as StructError
+
+from .exception import SpecFormatError
+from .spec import ITEM_SETS
+from .spec import MODULE_RACKS
+from .spec import SINGLE_ITEMS
+from .spec import SPEC_VERSION
+
+
+# Type ID, state, flags and quantity of effect modes
+_ITEM = Struct('<iBBH')
+# Effect ID and effect mode
+_EFFECT_MODE = Struct('<iB')
+_BYTE = Struct('<B')
+_COUNT = Struct('<H')
+_DMG = Struct('<4d')
+
+_FLAG_CHARGE = 1
+_FLAG_LEVEL = 2
+
+
+def pack_spec(spec):
+    """Pack fit specification into compact binary form.
+
+    Args:
+        spec: Fit specification.
+
+    Returns:
+        Bytes object.
+
+    Raises:
+        SpecFormatError: If specification cannot be packed.
+    """
+    # Collect format and values for the whole specification, to pack it in
+    # one go
+    fmt = ['<B']
+    values = [spec[0]]
+    try:
+        index = 1
+        for _ in SINGLE_ITEMS:
+            _add_optional_item(spec[index], fmt, values)
+            index += 1
+        for _ in ITEM_SETS:
+            entries = spec[index]
+            fmt.append('H')
+            values.append(len(entries))
+            for entry in entries:
+                _add_item(entry, fmt, values)
+            index += 1
+        for _ in MODULE_RACKS:
+            entries = spec[index]
+            fmt.append('H')
+            values.append(len(entries))
+            for entry in entries:
+                _add_optional_item(entry, fmt, values)
+            index += 1
+        fmt.append('4d')
+        values.extend(spec[index])
+        rah_dmg = spec[index + 1]
+        if rah_dmg is None:
+            fmt.append('B')
+            values.append(0)
+        else:
+            fmt.append('B4d')
+            values.append(1)
+            values.extend(rah_dmg)
+        return Struct(''.join(fmt)).pack(*values)
+    except (IndexError, TypeError, ValueError, StructError) as e:
+        raise SpecFormatError('malformed fit specification') from e
+
+
+def _add_optional_item(entry, fmt, values):
+    if entry is None:
+        fmt.append('B')
+        values.append(0)
+    else:
+        fmt.append('B')
+        values.append(1)
+        _add_item(entry, fmt, values)
+
+
+def _add_item(entry, fmt, values):
+    type_id, state, modes, charge, level = entry
+    flags = 0
+    if charge is not None:
+        flags |= _FLAG_CHARGE
+    if level is not None:
+        flags |= _FLAG_LEVEL
+    fmt.append('iBBH')
+    values.extend((type_id, state, flags, len(modes)))
+    if level is not None:
+        fmt.append('B')
+        values.append(level)
+    for effect_id, mode in modes:
+        fmt.append('iB')
+        values.append(effect_id)
+        values.append(mode)
+    if charge is not None:
+        _add_item(charge, fmt, values)
+
+
+def unpack_spec(data):
+    """Unpack fit specification from binary form.
+
+    Args:
+        data: Bytes-like object, made by pack_spec().
+
+    Returns:
+        Fit specification.
+
+    Raises:
+        SpecFormatError: If data has unknown version or is malformed.
+    """
+    try:
+        version, = _BYTE.unpack_from(data, 0)
+        if version != SPEC_VERSION:
+            raise SpecFormatError('unknown fit specification version')
+        offset = _BYTE.size
+        spec = [version]
+        for _ in SINGLE_ITEMS:
+            entry, offset = _unpack_optional_item(data, offset)
+            spec.append(entry)
+        for _ in ITEM_SETS:
+            count, = _COUNT.unpack_from(data, offset)
+            offset += _COUNT.size
+            entries = []
+            for _ in range(count):
+                entry, offset = _unpack_item(data, offset)
+                entries.append(entry)
+            spec.append(tuple(entries))
+        for _ in MODULE_RACKS:
+            count, = _COUNT.unpack_from(data, offset)
+            offset += _COUNT.size
+            entries = []
+            for _ in range(count):
+                entry, offset = _unpack_optional_item(data, offset)
+                entries.append(entry)
+            spec.append(tuple(entries))
+        spec.append(_DMG.unpack_from(data, offset))
+        offset += _DMG.size
+        has_rah_dmg, = _BYTE.unpack_from(data, offset)
+        offset += _BYTE.size
+        if has_rah_dmg:
+            spec.append(_DMG.unpack_from(data, offset))
+            offset += _DMG.size
+        else:
+            spec.append(None)
+    except StructError as e:
+        raise SpecFormatError('malformed fit specification') from e
+    if offset != len(data):
+        raise SpecFormatError('malformed fit specification')
+    return tuple(spec)
+
+
+def _unpack_optional_item(data, offset):
+    is_present, = _BYTE.unpack_from(data, offset)
+    offset += _BYTE.size
+    if not is_present:
+        return None, offset
+    return _unpack_item(data, offset)
+
+
+def _unpack_item(data, offset):
+    type_id, state, flags, mode_count = _ITEM.unpack_from(data, offset)
+    offset += _ITEM.size
+    level = None
+    if flags & _FLAG_LEVEL:
+        level, = _BYTE.unpack_from(data, offset)
+        offset += _BYTE.size
+    modes = []
+    for _ in range(mode_count):
+        modes.append(_EFFECT_MODE.unpack_from(data, offset))
+        offset += _EFFECT_MODE.size
+    charge = None
+    if flags & _FLAG_CHARGE:
+        charge, offset = _unpack_item(data, offset)
+    return (type_id, state, tuple(modes), charge, level), offset
+
+
+def spec_to_json(spec):
+    """Dump fit specification into JSON string."""
+    return json.dumps(spec, separators=(',', ':'))
+
+
+def spec_from_json(data):
+    """Load fit specification from JSON string.
+
+    Raises:
+        SpecFormatError: If data is not valid JSON.
+    """
+    try:
+        return _to_tuples(json.loads(data))
+    except ValueError as e:
+        raise SpecFormatError('malformed fit specification') from e
+
+
+def _to_tuples(value):
+    if isinstance(value, list):
+        return tuple(_to_tuples(v) for v in value)
+    return value
@@ -0,0 +1,199 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from operator import itemgetter
+
+from eos.const.eos import EffectMode
+from eos.const.eos import State
+from eos.item import Booster
+from eos.item import Character
+from eos.item import Charge
+from eos.item import Drone
+from eos.item import EffectBeacon
+from eos.item import FighterSquad
+from eos.item import Implant
+from eos.item import ModuleHigh
+from eos.item import ModuleLow
+from eos.item import ModuleMid
+from eos.item import Rig
+from eos.item import Ship
+from eos.item import Skill
+from eos.item import Stance
+from eos.item import Subsystem
+from eos.stats_container import DmgProfile
+from .exception import SpecFormatError
+
+
+SPEC_VERSION = 1
+
+# Fit attributes which hold single items, and classes of these items
+SINGLE_ITEMS = (
+    ('character', Character),
+    ('ship', Ship),
+    ('stance', Stance),
+    ('effect_beacon', EffectBeacon))
+
+# Fit attributes which hold unordered item containers, and item classes
+ITEM_SETS = (
+    ('skills', Skill),
+    ('implants', Implant),
+    ('boosters', Booster),
+    ('subsystems', Subsystem),
+    ('rigs', Rig),
+    ('drones', Drone),
+    ('fighters', FighterSquad))
+
+# Module racks and classes of modules which are put there
+MODULE_RACKS = (
+    ('high', ModuleHigh),
+    ('mid', ModuleMid),
+    ('low', ModuleLow))
+
+# Item classes whose state can be changed by user
+STATEFUL_CLASSES = (
+    ModuleHigh, ModuleMid, ModuleLow, Drone, FighterSquad)
+
+_entry_sort_key = itemgetter(0, 1, 2)
+
+
+def make_spec(fit):
+    """Make specification of the fit.
+
+    Specification is a tuple, which consists only of tuples, numbers and Nones:
+        version of specification format;
+        item entries or Nones for character, ship, stance and effect beacon;
+        tuples with item entries for skills, implants, boosters, subsystems,
+            rigs, drones and fighter squads, sorted to make specification of
+            the same fit always the same;
+        tuples with item entries or Nones for empty slots for high, medium and
+            low module racks;
+        default incoming damage profile;
+        RAH incoming damage profile or None.
+    Item entry is a tuple with item type ID, state, tuple with (effect ID,
+    effect mode) pairs for effects which are run in non-default mode, charge
+    entry or None, and skill level or None. Side-effect statuses of boosters and
+    ability statuses of fighter squads are stored as effect modes. Damage
+    profile is a tuple with em, thermal, kinetic and explosive damage.
+
+    Args:
+        fit: Fit to make specification of.
+
+    Returns:
+        Fit specification.
+    """
+    spec = [SPEC_VERSION]
+    for attr_name, _ in SINGLE_ITEMS:
+        item = getattr(fit, attr_name)
+        spec.append(None if item is None else _make_item_entry(item))
+    for attr_name, _ in ITEM_SETS:
+        entries = [_make_item_entry(i) for i in getattr(fit, attr_name)]
+        entries.sort(key=_entry_sort_key)
+        spec.append(tuple(entries))
+    for rack_name, _ in MODULE_RACKS:
+        spec.append(tuple(
+            None if i is None else _make_item_entry(i)
+            for i in getattr(fit.modules, rack_name)))
+    spec.append(_make_dmg_entry(fit.default_incoming_dmg))
+    spec.append(_make_dmg_entry(fit.rah_incoming_dmg))
+    return tuple(spec)
+
+
+def fill_fit(fit, spec):
+    """Put items described by specification onto the fit.
+
+    Args:
+        fit: Fit to fill, should be empty.
+        spec: Fit specification. Lists can be used in place of tuples, e.g.
+            when specification was loaded from JSON.
+
+    Raises:
+        SpecFormatError: If specification has unknown version or is malformed.
+    """
+    if not spec or spec[0] != SPEC_VERSION:
+        raise SpecFormatError('unknown fit specification version')
+    try:
+        with fit.batch():
+            _fill_fit_items(fit, spec)
+    except (IndexError, TypeError, ValueError) as e:
+        raise SpecFormatError('malformed fit specification') from e
+
+
+def _fill_fit_items(fit, spec):
+    index = 1
+    for attr_name, item_class in SINGLE_ITEMS:
+        entry = spec[index]
+        item = None if entry is None else _make_item(item_class, entry)
+        setattr(fit, attr_name, item)
+        index += 1
+    for attr_name, item_class in ITEM_SETS:
+        container = getattr(fit, attr_name)
+        for entry in spec[index]:
+            container.add(_make_item(item_class, entry))
+        index += 1
+    for rack_name, item_class in MODULE_RACKS:
+        rack = getattr(fit.modules, rack_name)
+        for position, entry in enumerate(spec[index]):
+            if entry is not None:
+                rack.place(position, _make_item(item_class, entry))
+        index += 1
+    fit.default_incoming_dmg = DmgProfile(*spec[index])
+    rah_dmg = spec[index + 1]
+    fit.rah_incoming_dmg = None if rah_dmg is None else DmgProfile(*rah_dmg)
+
+
+def _make_item_entry(item):
+    modes = tuple(sorted(
+        (effect_id, int(mode))
+        for effect_id, mode in item._get_effects_modes().items()))
+    charge = getattr(item, 'charge', None)
+    level = item.level if isinstance(item, Skill) else None
+    return (
+        item._type_id,
+        int(item.state),
+        modes,
+        None if charge is None else _make_item_entry(charge),
+        level)
+
+
+def _make_item(item_class, entry):
+    type_id, state, modes, charge, level = entry
+    if item_class is Skill:
+        item = Skill(type_id, level=level)
+    elif item_class in STATEFUL_CLASSES:
+        item = item_class(type_id, state=State(state))
+    else:
+        item = item_class(type_id)
+    if modes:
+        item._set_effects_modes({
+            effect_id: EffectMode(mode) for effect_id, mode in modes})
+    if charge is not None:
+        item.charge = _make_item(Charge, charge)
+    return item
+
+
+def _make_dmg_entry(dmg_profile):
+    if dmg_profile is None:
+        return None
+    return (
+        float(dmg_profile.em),
+        float(dmg_profile.thermal),
+        float(dmg_profile.kinetic),
+        float(dmg_profile.explosive))
@@ -50,6 +50,7 @@ class BaseItemMixin(metaclass=ABCMeta):
     Cooperative methods:
         __init__
         _child_item_iter
+        _fill_clone
     """
 
     def __init__(self, type_id, **kwargs):
@@ -83,6 +84,27 @@ class BaseItemMixin(metaclass=ABCMeta):
             for item in child_item_iter(skip_autoitems=skip_autoitems):
                 yield item
 
+    def _clone(self):
+        """Make copy of the item which is not attached to any container.
+
+        Copy carries all the data which was set on the item by user, but none of
+        source-specific data.
+        """
+        clone = type(self)(self._type_id)
+        self._fill_clone(clone)
+        return clone
+
+    def _fill_clone(self, clone, **kwargs):
+        if self.__effect_mode_overrides is not None:
+            clone._set_effects_modes(self.__effect_mode_overrides)
+        # Try next in MRO
+        try:
+            fill_clone = super()._fill_clone
+        except AttributeError:
+            pass
+        else:
+            fill_clone(clone, **kwargs)
+
     @property
     def _fit(self):
         try:
@@ -170,6 +192,16 @@ class BaseItemMixin(metaclass=ABCMeta):
         """Set effect's run mode for this item."""
         self._set_effects_modes({effect_id: effect_mode})
 
+    def _get_effects_modes(self):
+        """Get modes of effects which are run in non-default mode.
+
+        Returns:
+            Map in {effect ID: effect run mode} format.
+        """
+        if self.__effect_mode_overrides is None:
+            return {}
+        return dict(self.__effect_mode_overrides)
+
     def _set_effects_modes(self, effects_modes):
         """
         Set modes of multiple effects for this item.
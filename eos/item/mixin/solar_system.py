@@ -28,6 +28,7 @@ class SolarSystemItemMixin:
 
     Cooperative methods:
         __init__
+        _fill_clone
     """
 
     def __init__(self, **kwargs):
@@ -35,6 +36,17 @@ class SolarSystemItemMixin:
         self.__orientation = Orientation(1, 0, 0)
         super().__init__(**kwargs)
 
+    def _fill_clone(self, clone, **kwargs):
+        clone.coordinate = self.__coordinate
+        clone.orientation = self.__orientation
+        # Try next in MRO
+        try:
+            fill_clone = super()._fill_clone
+        except AttributeError:
+            pass
+        else:
+            fill_clone(clone, **kwargs)
+
     @property
     def coordinate(self):
         return self.__coordinate
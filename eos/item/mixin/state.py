@@ -55,12 +55,17 @@ class MutableStateMixin(BaseItemMixin):
 
     Cooperative methods:
         __init__
+        _fill_clone
     """
 
     def __init__(self, state, **kwargs):
         self.__state = state
         super().__init__(**kwargs)
 
+    def _fill_clone(self, clone, **kwargs):
+        clone.state = self.__state
+        super()._fill_clone(clone, **kwargs)
+
     @property
     def state(self):
         """Access point to get and set item's state."""
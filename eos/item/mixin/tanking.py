@@ -20,6 +20,7 @@
 
 
 from eos.const.eve import AttrId
+from eos.stats_container import DmgProfile
 from eos.stats_container import ItemHP
 from eos.stats_container import ResistProfile
 from eos.stats_container import TankingLayers
@@ -85,41 +86,56 @@ class BufferTankingMixin(BaseItemMixin):
         # If damage profile is not specified anywhere, return Nones
         if dmg_profile is None:
             return ItemHP(0, 0, 0)
-        hull_ehp = self.__get_layer_ehp(
-            self.hp.hull, self.resists.hull, dmg_profile)
-        armor_ehp = self.__get_layer_ehp(
-            self.hp.armor, self.resists.armor, dmg_profile)
-        shield_ehp = self.__get_layer_ehp(
-            self.hp.shield, self.resists.shield, dmg_profile)
-        return ItemHP(hull_ehp, armor_ehp, shield_ehp)
+        return self.get_ehp_many((dmg_profile,))[0]
 
-    def __get_layer_ehp(self, layer_hp, layer_resists, dmg_profile):
-        """Calculate layer EHP according to passed data.
+    def get_ehp_many(self, dmg_profiles):
+        """Get effective HP of an item against multiple damage profiles.
 
-        If layer raw HP is None, None is returned.
-        """
-        if not layer_hp:
-            return layer_hp
-        tank_mult = self.__get_tanking_efficiency(dmg_profile, layer_resists)
-        return layer_hp * tank_mult
+        HP and resistances of the item are fetched just once for all the
+        profiles.
+
+        Args:
+            dmg_profiles: Iterable with damage profiles. Every element can be
+                either DmgProfile helper container instance, or sequence of 4
+                numbers in em, thermal, kinetic, explosive order (e.g. row of
+                Nx4 table), which follow the same rules as DmgProfile values.
 
-    def __get_tanking_efficiency(self, dmg_profile, resists):
-        """Get tanking efficiency for passed damage/resistance profiles.
+        Returns:
+            List with TankingLayersTotal helper container instances, in the
+            same order as passed damage profiles.
 
-        If any of layer resistances are not specified, they're assumed to be 0.
+        Raises:
+            TypeError: If any of damage values is not a number.
+            ValueError: If any of damage values is negative, or if sum of
+                damage values of any profile is not positive.
         """
-        dealt = (
-            dmg_profile.em +
-            dmg_profile.thermal +
-            dmg_profile.kinetic +
-            dmg_profile.explosive)
-        absorbed = (
-            dmg_profile.em * resists.em +
-            dmg_profile.thermal * resists.thermal +
-            dmg_profile.kinetic * resists.kinetic +
-            dmg_profile.explosive * resists.explosive)
-        received = dealt - absorbed
-        return dealt / received
+        hp = self.hp
+        resists = self.resists
+        layers = (
+            (hp.hull, tuple(resists.hull)),
+            (hp.armor, tuple(resists.armor)),
+            (hp.shield, tuple(resists.shield)))
+        ehps = []
+        for dmg_profile in dmg_profiles:
+            # Validate rows the same way as damage profiles
+            if not isinstance(dmg_profile, DmgProfile):
+                dmg_profile = DmgProfile(*dmg_profile)
+            em, therm, kin, expl = dmg_profile
+            dealt = em + therm + kin + expl
+            layer_ehps = []
+            for layer_hp, (em_res, therm_res, kin_res, expl_res) in layers:
+                # If layer raw HP is 0, its EHP is 0 regardless of resists
+                if not layer_hp:
+                    layer_ehps.append(layer_hp)
+                    continue
+                absorbed = (
+                    em * em_res +
+                    therm * therm_res +
+                    kin * kin_res +
+                    expl * expl_res)
+                layer_ehps.append(layer_hp * (dealt / (dealt - absorbed)))
+            ehps.append(ItemHP(*layer_ehps))
+        return ehps
 
     @property
     def worst_case_ehp(self):
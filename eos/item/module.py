@@ -39,6 +39,12 @@ class Module(MutableStateMixin, EffectStatsMixin):
     # Charge-specific properties
     charge = ItemDescriptor('_charge', Charge)
 
+    def _fill_clone(self, clone, **kwargs):
+        charge = self.charge
+        if charge is not None:
+            clone.charge = charge._clone()
+        super()._fill_clone(clone, **kwargs)
+
     def _child_item_iter(self, **kwargs):
         charge = self.charge
         if charge is not None:
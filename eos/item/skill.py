@@ -41,6 +41,10 @@ class Skill(ImmutableStateMixin):
         self.attrs._set_override_callback(
             AttrId.skill_level, (getattr, (self, 'level'), {}))
 
+    def _fill_clone(self, clone, **kwargs):
+        clone.level = self.__level
+        super()._fill_clone(clone, **kwargs)
+
     # Item-specific properties
     @property
     def level(self):
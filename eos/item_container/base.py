@@ -49,7 +49,10 @@ class ItemContainerBase:
             for subitem in self.__subitem_iter(item):
                 msgs = MsgHelper.get_item_added_msgs(subitem)
                 fit._publish_bulk(msgs)
-                subitem._load()
+                # When fit is in batch mode, items are loaded when batch is
+                # finished
+                if not fit._in_batch:
+                    subitem._load()
 
     def _handle_item_removal(self, item):
         """Do all the generic work to remove item to container.
@@ -19,12 +19,21 @@
 # ==============================================================================
 
 
+from collections import deque
+
+
 class FitMsgBroker:
     """Manages message subscriptions and dispatch messages to recipients."""
 
     def __init__(self):
         # Format: {event class: {subscribers}}
         self.__subscribers = {}
+        # Attribute change messages waiting to be published, and keys of
+        # messages published during current invalidation round. Both are None
+        # when no attribute change is being processed
+        # Format: deque(messages), {(message type, item, attribute ID)}
+        self.__attr_change_queue = None
+        self.__attr_change_keys = None
 
     def _subscribe(self, subscriber, msg_types):
         """Register subscriber for passed message types."""
@@ -57,3 +66,49 @@ class FitMsgBroker:
             msg.fit = self
             for subscriber in self.__subscribers.get(type(msg), ()):
                 subscriber._notify(msg)
+
+    def _publish_attr_change(self, msg):
+        """Publish message about attribute value change.
+
+        Changes of attribute values trigger invalidation of dependent values,
+        which in turn publish their change messages. Whole invalidation
+        cascade is processed iteratively within top-level call, in rounds.
+        First, messages are dispatched to attribute invalidators only, and
+        messages they publish are queued and dispatched after the message
+        which caused them; messages with the same type, item and attribute ID
+        are dispatched just once per round. After that, all messages of the
+        round are dispatched to the rest of subscribers, which this way see
+        all dependent values already invalidated. Changes published by these
+        subscribers start new round.
+        """
+        key = (type(msg), msg.item, msg.attr_id)
+        queue = self.__attr_change_queue
+        if queue is not None:
+            keys = self.__attr_change_keys
+            if key not in keys:
+                keys.add(key)
+                queue.append(msg)
+            return
+        queue = self.__attr_change_queue = deque((msg,))
+        self.__attr_change_keys = {key}
+        subscribers = self.__subscribers
+        try:
+            while queue:
+                # Invalidation phase
+                round_msgs = []
+                while queue:
+                    msg = queue.popleft()
+                    msg.fit = self
+                    round_msgs.append(msg)
+                    for subscriber in subscribers.get(type(msg), ()):
+                        if subscriber._attr_invalidator:
+                            subscriber._notify(msg)
+                # Notification phase
+                self.__attr_change_keys = set()
+                for msg in round_msgs:
+                    for subscriber in subscribers.get(type(msg), ()):
+                        if not subscriber._attr_invalidator:
+                            subscriber._notify(msg)
+        finally:
+            self.__attr_change_queue = None
+            self.__attr_change_keys = None
@@ -21,7 +21,10 @@
 
 from .attr import AttrValueChanged
 from .attr import AttrValueChangedMasked
+from .fit import BatchFinished
+from .fit import BatchStarted
 from .fit import DefaultIncomingDmgChanged
+from .fit import ProfileAffectorsChanged
 from .fit import RahIncomingDmgChanged
 from .item import ItemAdded
 from .item import ItemRemoved
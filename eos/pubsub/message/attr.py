@@ -24,6 +24,8 @@ from eos.util.repr import make_repr_str
 
 class AttrValueChanged:
 
+    __slots__ = ('fit', 'item', 'attr_id')
+
     def __init__(self, item, attr_id):
         self.fit = None
         self.item = item
@@ -36,6 +38,8 @@ class AttrValueChanged:
 
 class AttrValueChangedMasked:
 
+    __slots__ = ('fit', 'item', 'attr_id')
+
     def __init__(self, item, attr_id):
         self.fit = None
         self.item = item
@@ -22,8 +22,34 @@
 from eos.util.repr import make_repr_str
 
 
+class BatchStarted:
+
+    __slots__ = ('fit',)
+
+    def __init__(self):
+        self.fit = None
+
+    def __repr__(self):
+        spec = ['fit']
+        return make_repr_str(self, spec)
+
+
+class BatchFinished:
+
+    __slots__ = ('fit',)
+
+    def __init__(self):
+        self.fit = None
+
+    def __repr__(self):
+        spec = ['fit']
+        return make_repr_str(self, spec)
+
+
 class DefaultIncomingDmgChanged:
 
+    __slots__ = ('fit',)
+
     def __init__(self):
         self.fit = None
 
@@ -34,9 +60,24 @@ class DefaultIncomingDmgChanged:
 
 class RahIncomingDmgChanged:
 
+    __slots__ = ('fit',)
+
     def __init__(self):
         self.fit = None
 
     def __repr__(self):
         spec = ['fit']
         return make_repr_str(self, spec)
+
+
+class ProfileAffectorsChanged:
+
+    __slots__ = ('fit', 'affectors')
+
+    def __init__(self, affectors):
+        self.fit = None
+        self.affectors = affectors
+
+    def __repr__(self):
+        spec = ['fit', 'affectors']
+        return make_repr_str(self, spec)
@@ -24,6 +24,8 @@ from eos.util.repr import make_repr_str
 
 class ItemLoaded:
 
+    __slots__ = ('fit', 'item')
+
     def __init__(self, item):
         self.fit = None
         self.item = item
@@ -35,6 +37,8 @@ class ItemLoaded:
 
 class ItemUnloaded:
 
+    __slots__ = ('fit', 'item')
+
     def __init__(self, item):
         self.fit = None
         self.item = item
@@ -46,6 +50,8 @@ class ItemUnloaded:
 
 class StatesActivatedLoaded:
 
+    __slots__ = ('fit', 'item', 'states')
+
     def __init__(self, item, states):
         self.fit = None
         self.item = item
@@ -59,6 +65,8 @@ class StatesActivatedLoaded:
 
 class StatesDeactivatedLoaded:
 
+    __slots__ = ('fit', 'item', 'states')
+
     def __init__(self, item, states):
         self.fit = None
         self.item = item
@@ -72,6 +80,8 @@ class StatesDeactivatedLoaded:
 
 class EffectsStarted:
 
+    __slots__ = ('fit', 'item', 'effect_ids')
+
     def __init__(self, item, effect_ids):
         self.fit = None
         self.item = item
@@ -85,6 +95,8 @@ class EffectsStarted:
 
 class EffectsStopped:
 
+    __slots__ = ('fit', 'item', 'effect_ids')
+
     def __init__(self, item, effect_ids):
         self.fit = None
         self.item = item
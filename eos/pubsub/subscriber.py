@@ -26,6 +26,11 @@ from abc import abstractmethod
 class BaseSubscriber(metaclass=ABCMeta):
     """Base class for subscribers."""
 
+    # Attribute invalidators remove dependent attribute values when they receive
+    # attribute change messages, and receive such messages before all other
+    # subscribers
+    _attr_invalidator = False
+
     @property
     @abstractmethod
     def _handler_map(self):
@@ -23,6 +23,7 @@ from abc import ABCMeta
 from abc import abstractmethod
 
 from eos.pubsub.subscriber import BaseSubscriber
+from eos.restriction.exception import RestrictionValidationError
 
 
 class BaseRestriction(metaclass=ABCMeta):
@@ -43,7 +44,52 @@ class BaseRestriction(metaclass=ABCMeta):
         """Get restriction type this register is dealing with."""
         ...
 
+    @property
+    @abstractmethod
+    def cost(self):
+        """Get relative cost of restriction check."""
+        ...
+
+    def _is_valid(self):
+        """Check if validation passes.
+
+        Restrictions which can tell it without collecting error data should
+        override this method.
+        """
+        return self._get_errors() is None
+
+    def _get_errors(self):
+        """Get validation error data.
+
+        Returns:
+            Error data in {item: item error data} format, or None if
+            validation passed.
+        """
+        try:
+            self.validate()
+        except RestrictionValidationError as e:
+            # Errors without tainted items do not fail validation
+            return e.args[0] or None
+        return None
+
 
 class BaseRestrictionRegister(BaseRestriction, BaseSubscriber):
-    """Base class for all restrictions which store some data on themselves."""
-    ...
+    """Base class for all restrictions which store some data on themselves.
+
+    Registers keep results of the last validation, and run it again only after
+    receiving any of messages they are subscribed to.
+    """
+
+    def __init__(self):
+        self.__errors = None
+        self.__dirty = True
+
+    def _notify(self, msg):
+        self.__dirty = True
+        BaseSubscriber._notify(self, msg)
+
+    def _get_errors(self):
+        if self.__dirty:
+            self.__errors = BaseRestriction._get_errors(self)
+            self.__dirty = False
+        return self.__errors
@@ -22,6 +22,7 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eve import AttrId
 from eos.item import ModuleHigh
 from eos.item import ModuleLow
@@ -51,8 +52,10 @@ class CapitalItemRestrictionRegister(BaseRestrictionRegister):
     """
 
     type = Restriction.capital_item
+    cost = RestrictionCost.item
 
     def __init__(self, fit):
+        BaseRestrictionRegister.__init__(self)
         self.__fit = fit
         self.__capital_items = set()
         fit._subscribe(self, self._handler_map.keys())
@@ -22,6 +22,7 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eve import AttrId
 from eos.pubsub.message import ItemLoaded
 from eos.pubsub.message import ItemUnloaded
@@ -52,8 +53,10 @@ class ChargeGroupRestrictionRegister(BaseRestrictionRegister):
     """
 
     type = Restriction.charge_group
+    cost = RestrictionCost.item
 
     def __init__(self, fit):
+        BaseRestrictionRegister.__init__(self)
         # Format: {container item: (allowed groups)}
         self.__restricted_containers = {}
         fit._subscribe(self, self._handler_map.keys())
@@ -22,6 +22,7 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eve import AttrId
 from eos.pubsub.message import ItemLoaded
 from eos.pubsub.message import ItemUnloaded
@@ -46,8 +47,10 @@ class ChargeSizeRestrictionRegister(BaseRestrictionRegister):
     """
 
     type = Restriction.charge_size
+    cost = RestrictionCost.item
 
     def __init__(self, fit):
+        BaseRestrictionRegister.__init__(self)
         self.__restricted_containers = set()
         fit._subscribe(self, self._handler_map.keys())
 
@@ -22,6 +22,7 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eve import AttrId
 from eos.pubsub.message import ItemLoaded
 from eos.pubsub.message import ItemUnloaded
@@ -43,8 +44,10 @@ class ChargeVolumeRestrictionRegister(BaseRestrictionRegister):
     """
 
     type = Restriction.charge_volume
+    cost = RestrictionCost.item
 
     def __init__(self, msg_broker):
+        BaseRestrictionRegister.__init__(self)
         self.__containers = set()
         msg_broker._subscribe(self, self._handler_map.keys())
 
@@ -22,6 +22,7 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eve import AttrId
 from eos.item import Drone
 from eos.pubsub.message import ItemLoaded
@@ -50,8 +51,10 @@ class DroneGroupRestrictionRegister(BaseRestrictionRegister):
     """
 
     type = Restriction.drone_group
+    cost = RestrictionCost.item
 
     def __init__(self, fit):
+        BaseRestrictionRegister.__init__(self)
         self.__fit = fit
         self.__drones = set()
         fit._subscribe(self, self._handler_map.keys())
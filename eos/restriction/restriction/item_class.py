@@ -22,10 +22,12 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eve import AttrId
 from eos.const.eve import EffectId
 from eos.const.eve import TypeCategoryId
 from eos.const.eve import TypeGroupId
+from eos.item import Autocharge
 from eos.item import Booster
 from eos.item import Character
 from eos.item import Charge
@@ -41,13 +43,17 @@ from eos.item import Ship
 from eos.item import Skill
 from eos.item import Stance
 from eos.item import Subsystem
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemUnloaded
 from eos.restriction.exception import RestrictionValidationError
-from .base import BaseRestriction
+from .base import BaseRestrictionRegister
 
 
 ItemClassErrorData = namedtuple(
     'ItemClassErrorData', ('item_class', 'allowed_classes'))
 
+EXCEPTIONS = (Autocharge,)
+
 
 CLASS_VALIDATORS = {
     Booster: lambda item_type:
@@ -92,7 +98,7 @@ CLASS_VALIDATORS = {
         EffectId.subsystem in item_type.effects}
 
 
-class ItemClassRestriction(BaseRestriction):
+class ItemClassRestrictionRegister(BaseRestrictionRegister):
     """Check that item type is wrapped by corresponding item class instance.
 
     For example, cybernetic subprocessor should be represented by Implant class
@@ -105,14 +111,28 @@ class ItemClassRestriction(BaseRestriction):
     """
 
     type = Restriction.item_class
+    cost = RestrictionCost.item
 
     def __init__(self, fit):
-        self.__fit = fit
+        BaseRestrictionRegister.__init__(self)
+        self.__items = set()
+        fit._subscribe(self, self._handler_map.keys())
+
+    def _handle_item_loaded(self, msg):
+        # User has no direct control over autoitems, so skip them
+        if not isinstance(msg.item, EXCEPTIONS):
+            self.__items.add(msg.item)
+
+    def _handle_item_unloaded(self, msg):
+        self.__items.discard(msg.item)
+
+    _handler_map = {
+        ItemLoaded: _handle_item_loaded,
+        ItemUnloaded: _handle_item_unloaded}
 
     def validate(self):
         tainted_items = {}
-        # User has no direct control over autoitems, so skip them
-        for item in self.__fit._loaded_item_iter(skip_autoitems=True):
+        for item in self.__items:
             # Get validator function for class of passed item. If it is not
             # found or fails, seek for 'right' item class for the item type
             try:
@@ -22,14 +22,22 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
+from eos.item import Autocharge
+from eos.pubsub.message import ItemAdded
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemRemoved
+from eos.pubsub.message import ItemUnloaded
 from eos.restriction.exception import RestrictionValidationError
-from .base import BaseRestriction
+from .base import BaseRestrictionRegister
 
 
 LoadedItemErrorData = namedtuple('LoadedItemErrorData', ())
 
+EXCEPTIONS = (Autocharge,)
 
-class LoadedItemRestriction(BaseRestriction):
+
+class LoadedItemRestrictionRegister(BaseRestrictionRegister):
     """Check that all items on fit are loaded.
 
     Details:
@@ -37,14 +45,31 @@ class LoadedItemRestriction(BaseRestriction):
     """
 
     type = Restriction.loaded_item
+    cost = RestrictionCost.item
 
     def __init__(self, fit):
-        self.__fit = fit
+        BaseRestrictionRegister.__init__(self)
+        self.__items = set()
+        # Loaded status of items is not stored on register, so also listen to
+        # item (un)loading messages just to know when validation has to be
+        # re-run
+        fit._subscribe(self, (*self._handler_map, ItemLoaded, ItemUnloaded))
+
+    def _handle_item_added(self, msg):
+        # User has no direct control over autoitems, so skip them
+        if not isinstance(msg.item, EXCEPTIONS):
+            self.__items.add(msg.item)
+
+    def _handle_item_removed(self, msg):
+        self.__items.discard(msg.item)
+
+    _handler_map = {
+        ItemAdded: _handle_item_added,
+        ItemRemoved: _handle_item_removed}
 
     def validate(self):
         tainted_items = {}
-        # User has no direct control over autoitems, so skip them
-        for item in self.__fit._item_iter(skip_autoitems=True):
+        for item in self.__items:
             if not item._is_loaded:
                 tainted_items[item] = LoadedItemErrorData()
         if tainted_items:
@@ -24,6 +24,7 @@ from abc import abstractmethod
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eos import State
 from eos.const.eve import AttrId
 from eos.item import ModuleHigh
@@ -49,6 +50,7 @@ class MaxGroupRestrictionRegister(BaseRestrictionRegister, metaclass=ABCMeta):
     """Base class for all max modules per group restrictions."""
 
     def __init__(self, fit):
+        BaseRestrictionRegister.__init__(self)
         # Container for all tracked items, keyed by their group ID
         # Format: {group ID: {items}}
         self.__group_item_map = KeyedStorage()
@@ -115,6 +117,7 @@ class MaxGroupFittedRestrictionRegister(MaxGroupRestrictionRegister):
     """
 
     type = Restriction.max_group_fitted
+    cost = RestrictionCost.item
     _max_group_attr_id = AttrId.max_group_fitted
 
     def _handle_item_loaded(self, msg):
@@ -137,6 +140,7 @@ class MaxGroupOnlineRestrictionRegister(MaxGroupRestrictionRegister):
     """
 
     type = Restriction.max_group_online
+    cost = RestrictionCost.item
     _max_group_attr_id = AttrId.max_group_online
 
     def _handle_states_activated(self, msg):
@@ -161,6 +165,7 @@ class MaxGroupActiveRestrictionRegister(MaxGroupRestrictionRegister):
     """
 
     type = Restriction.max_group_active
+    cost = RestrictionCost.item
     _max_group_attr_id = AttrId.max_group_active
 
     def _handle_states_activated_loaded(self, msg):
@@ -24,6 +24,7 @@ from abc import abstractmethod
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eve import AttrId
 from eos.restriction.exception import RestrictionValidationError
 from .base import BaseRestriction
@@ -54,6 +55,13 @@ class ResourceRestriction(BaseRestriction, metaclass=ABCMeta):
     def _use_attr_id(self):
         ...
 
+    def _is_valid(self):
+        stats = getattr(self.__fit.stats, self._stat_name)
+        if stats.used <= (stats.output or 0):
+            return True
+        # Validation still passes if no item actually consumes resource
+        return BaseRestriction._is_valid(self)
+
     def validate(self):
         # Use stats module to get resource use and output
         stats = getattr(self.__fit.stats, self._stat_name)
@@ -84,6 +92,7 @@ class CpuRestriction(ResourceRestriction):
     """
 
     type = Restriction.cpu
+    cost = RestrictionCost.attr
     _stat_name = 'cpu'
     _use_attr_id = AttrId.cpu
 
@@ -96,6 +105,7 @@ class PowergridRestriction(ResourceRestriction):
     """
 
     type = Restriction.powergrid
+    cost = RestrictionCost.attr
     _stat_name = 'powergrid'
     _use_attr_id = AttrId.power
 
@@ -108,6 +118,7 @@ class CalibrationRestriction(ResourceRestriction):
     """
 
     type = Restriction.calibration
+    cost = RestrictionCost.attr
     _stat_name = 'calibration'
     _use_attr_id = AttrId.upgrade_cost
 
@@ -120,6 +131,7 @@ class DroneBayVolumeRestriction(ResourceRestriction):
     """
 
     type = Restriction.dronebay_volume
+    cost = RestrictionCost.attr
     _stat_name = 'dronebay'
     _use_attr_id = AttrId.volume
 
@@ -132,5 +144,6 @@ class DroneBandwidthRestriction(ResourceRestriction):
     """
 
     type = Restriction.drone_bandwidth
+    cost = RestrictionCost.attr
     _stat_name = 'drone_bandwidth'
     _use_attr_id = AttrId.drone_bandwidth_used
@@ -22,10 +22,13 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eve import AttrId
 from eos.const.eve import EffectId
 from eos.pubsub.message import EffectsStarted
 from eos.pubsub.message import EffectsStopped
+from eos.pubsub.message import ItemLoaded
+from eos.pubsub.message import ItemUnloaded
 from eos.restriction.exception import RestrictionValidationError
 from .base import BaseRestrictionRegister
 
@@ -42,12 +45,16 @@ class RigSizeRestrictionRegister(BaseRestrictionRegister):
     """
 
     type = Restriction.rig_size
+    cost = RestrictionCost.item
 
     def __init__(self, fit):
+        BaseRestrictionRegister.__init__(self)
         self.__fit = fit
         # Container for items which have rig size restriction
         self.__restricted_items = set()
-        fit._subscribe(self, self._handler_map.keys())
+        # Ship rig size is not stored on register, so also listen to item
+        # (un)loading messages just to know when validation has to be re-run
+        fit._subscribe(self, (*self._handler_map, ItemLoaded, ItemUnloaded))
 
     def _handle_effects_started(self, msg):
         if (
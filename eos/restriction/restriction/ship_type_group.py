@@ -22,6 +22,7 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eve import AttrId
 from eos.item import ModuleHigh
 from eos.item import ModuleLow
@@ -95,8 +96,10 @@ class ShipTypeGroupRestrictionRegister(BaseRestrictionRegister):
     """
 
     type = Restriction.ship_type_group
+    cost = RestrictionCost.item
 
     def __init__(self, fit):
+        BaseRestrictionRegister.__init__(self)
         self.__fit = fit
         # Container for items which possess ship type/group restriction
         # Format: {item: allowed data}
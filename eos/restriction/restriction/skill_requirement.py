@@ -22,10 +22,14 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
+from eos.const.eve import AttrId
 from eos.item import Rig
+from eos.pubsub.message import AttrValueChanged
 from eos.pubsub.message import ItemLoaded
 from eos.pubsub.message import ItemUnloaded
 from eos.restriction.exception import RestrictionValidationError
+from .base import BaseRestriction
 from .base import BaseRestrictionRegister
 
 
@@ -39,7 +43,9 @@ class SkillRequirementRestrictionRegister(BaseRestrictionRegister):
     """To use item, all its skill requirements must be met.
 
     Details:
-        Only Skill items are able to satisfy skill requirements.
+        Only Skill items are able to satisfy skill requirements. Skills of
+            character profile are used when fit doesn't have skill of needed
+            type.
         Item_item type attributes are taken to determine skill and skill level
             requirements.
         If corresponding skill is found, but its skill level is None, check for
@@ -48,13 +54,17 @@ class SkillRequirementRestrictionRegister(BaseRestrictionRegister):
     """
 
     type = Restriction.skill_requirement
+    cost = RestrictionCost.attr
 
     def __init__(self, fit):
+        BaseRestrictionRegister.__init__(self)
         self.__fit = fit
         # Set with items which have any skill requirements
         # Format: {items}
         self.__restricted_items = set()
-        fit._subscribe(self, self._handler_map.keys())
+        # Skill levels are not stored on register, so also listen to attribute
+        # changes just to know when validation has to be re-run
+        fit._subscribe(self, (*self._handler_map, AttrValueChanged))
 
     def _handle_item_loaded(self, msg):
         if (
@@ -70,9 +80,25 @@ class SkillRequirementRestrictionRegister(BaseRestrictionRegister):
         ItemLoaded: _handle_item_loaded,
         ItemUnloaded: _handle_item_unloaded}
 
+    def _notify(self, msg):
+        if (
+            type(msg) is AttrValueChanged and
+            msg.attr_id != AttrId.skill_level
+        ):
+            return
+        BaseRestrictionRegister._notify(self, msg)
+
+    def _get_errors(self):
+        # Changes of character profile skills are not published to the fit,
+        # so results can be reused only when fit has no profile
+        if self.__fit.character_profile is not None:
+            return BaseRestriction._get_errors(self)
+        return BaseRestrictionRegister._get_errors(self)
+
     def validate(self):
         tainted_items = {}
         skills = self.__fit.skills
+        profile = self.__fit.character_profile
         # Go through restricted items
         for item in self.__restricted_items:
             # Container for skill requirement errors for current item
@@ -86,6 +112,13 @@ class SkillRequirementRestrictionRegister(BaseRestrictionRegister):
                 try:
                     skill = skills[skillrq_type_id]
                 except KeyError:
+                    skill = None
+                if skill is None and profile is not None:
+                    try:
+                        skill = profile.skills[skillrq_type_id]
+                    except KeyError:
+                        pass
+                if skill is None:
                     skill_level = None
                 else:
                     if skill._is_loaded:
@@ -24,6 +24,7 @@ from abc import abstractmethod
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eve import AttrId
 from eos.pubsub.message import ItemLoaded
 from eos.pubsub.message import ItemUnloaded
@@ -42,6 +43,7 @@ class SlotIndexRestrictionRegister(BaseRestrictionRegister, metaclass=ABCMeta):
     """
 
     def __init__(self, fit):
+        BaseRestrictionRegister.__init__(self)
         # All items which possess index of slot are stored in this container
         # Format: {slot index: {items}}
         self.__index_item_map = KeyedStorage()
@@ -91,6 +93,7 @@ class SubsystemIndexRestrictionRegister(SlotIndexRestrictionRegister):
     """
 
     type = Restriction.subsystem_index
+    cost = RestrictionCost.item
     _slot_index_attr_id = AttrId.subsystem_slot
 
 
@@ -102,6 +105,7 @@ class ImplantIndexRestrictionRegister(SlotIndexRestrictionRegister):
     """
 
     type = Restriction.implant_index
+    cost = RestrictionCost.item
     _slot_index_attr_id = AttrId.implantness
 
 
@@ -113,4 +117,5 @@ class BoosterIndexRestrictionRegister(SlotIndexRestrictionRegister):
     """
 
     type = Restriction.booster_index
+    cost = RestrictionCost.item
     _slot_index_attr_id = AttrId.boosterness
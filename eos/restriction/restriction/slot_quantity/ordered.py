@@ -23,6 +23,7 @@ from abc import ABCMeta
 from abc import abstractmethod
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.restriction.exception import RestrictionValidationError
 from eos.restriction.restriction.base import BaseRestriction
 from .error_data import SlotQuantityErrorData
@@ -43,6 +44,13 @@ class OrderedSlotRestriction(BaseRestriction, metaclass=ABCMeta):
     def _container(self):
         ...
 
+    def _is_valid(self):
+        used, total = self._slot_stats
+        if used <= total:
+            return True
+        # Validation still passes if there are no items to blame
+        return BaseRestriction._is_valid(self)
+
     def validate(self):
         used, total = self._slot_stats
         if used > total:
@@ -63,6 +71,7 @@ class HighSlotRestriction(OrderedSlotRestriction):
     """
 
     type = Restriction.high_slot
+    cost = RestrictionCost.slot
 
     @property
     def _slot_stats(self):
@@ -83,6 +92,7 @@ class MidSlotRestriction(OrderedSlotRestriction):
     """
 
     type = Restriction.mid_slot
+    cost = RestrictionCost.slot
 
     @property
     def _slot_stats(self):
@@ -103,6 +113,7 @@ class LowSlotRestriction(OrderedSlotRestriction):
     """
 
     type = Restriction.low_slot
+    cost = RestrictionCost.slot
 
     @property
     def _slot_stats(self):
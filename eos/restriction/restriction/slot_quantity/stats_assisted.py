@@ -23,6 +23,7 @@ from abc import ABCMeta
 from abc import abstractmethod
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.restriction.exception import RestrictionValidationError
 from eos.restriction.restriction.base import BaseRestriction
 from .error_data import SlotQuantityErrorData
@@ -38,6 +39,13 @@ class StatsAssistedSlotRestriction(BaseRestriction, metaclass=ABCMeta):
     def _slot_stats(self):
         ...
 
+    def _is_valid(self):
+        stats = self._slot_stats
+        if stats.used <= stats.total:
+            return True
+        # Validation still passes if there are no items to blame
+        return BaseRestriction._is_valid(self)
+
     def validate(self):
         stats = self._slot_stats
         if stats.used > stats.total:
@@ -56,6 +64,7 @@ class TurretSlotRestriction(StatsAssistedSlotRestriction):
     """
 
     type = Restriction.turret_slot
+    cost = RestrictionCost.slot
 
     @property
     def _slot_stats(self):
@@ -70,6 +79,7 @@ class LauncherSlotRestriction(StatsAssistedSlotRestriction):
     """
 
     type = Restriction.launcher_slot
+    cost = RestrictionCost.slot
 
     @property
     def _slot_stats(self):
@@ -84,6 +94,7 @@ class LaunchedDroneRestriction(StatsAssistedSlotRestriction):
     """
 
     type = Restriction.launched_drone
+    cost = RestrictionCost.slot
 
     @property
     def _slot_stats(self):
@@ -98,6 +109,7 @@ class FighterSquadSupportRestriction(StatsAssistedSlotRestriction):
     """
 
     type = Restriction.fighter_squad_support
+    cost = RestrictionCost.slot
 
     @property
     def _slot_stats(self):
@@ -112,6 +124,7 @@ class FighterSquadLightRestriction(StatsAssistedSlotRestriction):
     """
 
     type = Restriction.fighter_squad_light
+    cost = RestrictionCost.slot
 
     @property
     def _slot_stats(self):
@@ -126,6 +139,7 @@ class FighterSquadHeavyRestriction(StatsAssistedSlotRestriction):
     """
 
     type = Restriction.fighter_squad_heavy
+    cost = RestrictionCost.slot
 
     @property
     def _slot_stats(self):
@@ -23,6 +23,7 @@ from abc import ABCMeta
 from abc import abstractmethod
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.restriction.exception import RestrictionValidationError
 from eos.restriction.restriction.base import BaseRestriction
 from .error_data import SlotQuantityErrorData
@@ -43,6 +44,13 @@ class UnorderedSlotRestriction(BaseRestriction, metaclass=ABCMeta):
     def _container(self):
         ...
 
+    def _is_valid(self):
+        used, total = self._slot_stats
+        if used <= total:
+            return True
+        # Validation still passes if there are no items to blame
+        return BaseRestriction._is_valid(self)
+
     def validate(self):
         used, total = self._slot_stats
         if used > total:
@@ -61,6 +69,7 @@ class RigSlotRestriction(UnorderedSlotRestriction):
     """
 
     type = Restriction.rig_slot
+    cost = RestrictionCost.slot
 
     @property
     def _slot_stats(self):
@@ -79,6 +88,7 @@ class SubsystemSlotRestriction(UnorderedSlotRestriction):
     """
 
     type = Restriction.subsystem_slot
+    cost = RestrictionCost.slot
 
     @property
     def _slot_stats(self):
@@ -97,6 +107,7 @@ class FighterSquadRestriction(UnorderedSlotRestriction):
     """
 
     type = Restriction.fighter_squad
+    cost = RestrictionCost.slot
 
     @property
     def _slot_stats(self):
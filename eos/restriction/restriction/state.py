@@ -22,6 +22,7 @@
 from collections import namedtuple
 
 from eos.const.eos import Restriction
+from eos.const.eos import RestrictionCost
 from eos.const.eos import State
 from eos.item import Autocharge
 from eos.item import Charge
@@ -44,8 +45,10 @@ class StateRestrictionRegister(BaseRestrictionRegister):
     """
 
     type = Restriction.state
+    cost = RestrictionCost.item
 
     def __init__(self, fit):
+        BaseRestrictionRegister.__init__(self)
         self.__restricted_items = set()
         fit._subscribe(self, self._handler_map.keys())
 
@@ -19,7 +19,8 @@
 # ==============================================================================
 
 
-from .exception import RestrictionValidationError
+from operator import attrgetter
+
 from .exception import ValidationError
 from .restriction import BoosterIndexRestrictionRegister
 from .restriction import CalibrationRestriction
@@ -37,10 +38,10 @@ from .restriction import FighterSquadRestriction
 from .restriction import FighterSquadSupportRestriction
 from .restriction import HighSlotRestriction
 from .restriction import ImplantIndexRestrictionRegister
-from .restriction import ItemClassRestriction
+from .restriction import ItemClassRestrictionRegister
 from .restriction import LaunchedDroneRestriction
 from .restriction import LauncherSlotRestriction
-from .restriction import LoadedItemRestriction
+from .restriction import LoadedItemRestrictionRegister
 from .restriction import LowSlotRestriction
 from .restriction import MaxGroupActiveRestrictionRegister
 from .restriction import MaxGroupFittedRestrictionRegister
@@ -69,8 +70,8 @@ class RestrictionService:
     """
 
     def __init__(self, fit):
-        # Container for all restrictions
-        self.__restrictions = {
+        # Container for all restrictions, cheapest first
+        self.__restrictions = sorted((
             BoosterIndexRestrictionRegister(fit),
             CalibrationRestriction(fit),
             CapitalItemRestrictionRegister(fit),
@@ -87,10 +88,10 @@ class RestrictionService:
             FighterSquadSupportRestriction(fit),
             HighSlotRestriction(fit),
             ImplantIndexRestrictionRegister(fit),
-            ItemClassRestriction(fit),
+            ItemClassRestrictionRegister(fit),
             LaunchedDroneRestriction(fit),
             LauncherSlotRestriction(fit),
-            LoadedItemRestriction(fit),
+            LoadedItemRestrictionRegister(fit),
             LowSlotRestriction(fit),
             MaxGroupActiveRestrictionRegister(fit),
             MaxGroupFittedRestrictionRegister(fit),
@@ -104,7 +105,8 @@ class RestrictionService:
             StateRestrictionRegister(fit),
             SubsystemIndexRestrictionRegister(fit),
             SubsystemSlotRestriction(fit),
-            TurretSlotRestriction(fit)}
+            TurretSlotRestriction(fit)),
+            key=attrgetter('cost'))
 
     def validate(self, skip_checks=()):
         """Validate fit.
@@ -128,18 +130,36 @@ class RestrictionService:
             restriction_type = restriction.type
             if restriction_type in skip_checks:
                 continue
-            # Run validation for current register, if validation failure
-            # exception is raised - add it to container
-            try:
-                restriction.validate()
-            except RestrictionValidationError as e:
-                # All erroneous items should be in 1st argument of raised
-                # exception
-                exception_data = e.args[0]
-                for item in exception_data:
-                    item_error = exception_data[item]
-                    item_errors = invalid_items.setdefault(item, {})
-                    item_errors[restriction_type] = item_error
+            # Get validation results for current register; registers which
+            # haven't received any updates since last validation reuse its
+            # results
+            exception_data = restriction._get_errors()
+            if exception_data is None:
+                continue
+            for item in exception_data:
+                item_error = exception_data[item]
+                item_errors = invalid_items.setdefault(item, {})
+                item_errors[restriction_type] = item_error
         # Raise validation error only if we got any failures
         if invalid_items:
             raise ValidationError(invalid_items)
+
+    def is_valid(self, skip_checks=()):
+        """Check if fit is valid.
+
+        Restrictions are checked from cheapest to the most expensive, and
+        checking stops on the first failure.
+
+        Args:
+            skip_checks (optional): Iterable with restriction types validation
+                should ignore. By default, nothing is ignored.
+
+        Returns:
+            True if fit passes validation, False otherwise.
+        """
+        for restriction in self.__restrictions:
+            if restriction.type in skip_checks:
+                continue
+            if not restriction._is_valid():
+                return False
+        return True
@@ -20,18 +20,23 @@
 
 
 import math
-from copy import copy
+from collections import namedtuple
+from itertools import chain
 from logging import getLogger
 
+from eos.calculator.map import MULTIPLICATION_OPERATORS
+from eos.calculator.map import aggregate_mods
+from eos.calculator.map import penalize_values
 from eos.const.eve import AttrId
 from eos.const.eve import EffectId
+from eos.eve_obj.modifier import DogmaModifier
 from eos.pubsub.message import AttrValueChanged
 from eos.pubsub.message import AttrValueChangedMasked
 from eos.pubsub.message import EffectsStarted
 from eos.pubsub.message import EffectsStopped
 from eos.pubsub.message import RahIncomingDmgChanged
 from eos.pubsub.subscriber import BaseSubscriber
-from eos.util.repr import make_repr_str
+from eos.util.lru_storage import LruStorage
 from eos.util.round import sig_round
 
 
@@ -40,9 +45,16 @@ logger = getLogger(__name__)
 
 MAX_SIMULATION_TICKS = 500
 SIG_DIGITS = 10
+# Resonances are multiplied by this value and rounded to integer when looking
+# for simulation loops, as without it accumulated float errors may lead to
+# failed loop detection, in case float values are really close, but still
+# different
+RESO_QUANTUM_MULT = 10 ** SIG_DIGITS
+MEMO_SIZE = 1000
 # List all armor resonance attributes and also define default sorting order.
 # When equal damage is received across several damage types, those which come
-# earlier in this list will be picked as donors
+# earlier in this list will be picked as donors. All resonance sequences in
+# simulation core follow this order
 res_attr_ids = (
     AttrId.armor_em_dmg_resonance,
     AttrId.armor_expl_dmg_resonance,
@@ -56,43 +68,18 @@ attr_profile_map = {
     AttrId.armor_expl_dmg_resonance: 'explosive'}
 
 
-class RahState:
-    """Represents state of one RAH for single simulation tick.
-
-    Attributes:
-        item: RAH item.
-        cycling: How much time passed for this RAH since start of its cycle
-            until this moment.
-        resos: current resonances of RAH in {resonance attribute ID: resonance
-            attribute value} form.
-    """
-
-    def __init__(self, item, cycling, resos):
-        self.item = item
-        self.cycling = cycling
-        self.resos = resos
-        self._rounded_resos = {
-            attr_id: sig_round(value, SIG_DIGITS)
-            for attr_id, value in resos.items()}
-
-    # Use rounded resonances for more reliable loop detection, as without it
-    # accumulated float errors may lead to failed loop detection, in case float
-    # values are really close, but still different
-    def __hash__(self):
-        return hash((
-            id(self.item),
-            self.cycling,
-            frozenset(self._rounded_resos.items())))
-
-    def __eq__(self, other):
-        return all((
-            self.item is other.item,
-            self.cycling == other.cycling,
-            self._rounded_resos == other._rounded_resos))
-
-    def __repr__(self):
-        spec = ['item', 'cycling', 'resos']
-        return make_repr_str(self, spec)
+# Snapshot of everything needed to calculate one of ship resonances.
+# Modifications which do not come from RAHs are resolved into values in
+# {operator: [values]} format, and are aggregated in advance as much as
+# possible: base value includes all modifications applied before the first RAH
+# operator, and penalized modifications are kept only for operators which are
+# penalized for RAHs. If all remaining operations are multiplications, constant
+# multipliers are applied to base value too, and mult_only flag is set. RAH
+# modifications are grouped into tuples in (operator, normalization function,
+# penalize flag, ((RAH index, resonance index), ...)) format
+ShipResoData = namedtuple('ShipResoData', (
+    'attr', 'base_value', 'normal_mods', 'penalized_mods', 'rah_mod_groups',
+    'max_value', 'mult_only'))
 
 
 class ReactiveArmorHardenerSimulator(BaseSubscriber):
@@ -103,8 +90,18 @@ class ReactiveArmorHardenerSimulator(BaseSubscriber):
     completion, all values are stored for future use. When anything which may
     change RAH resistances changes, stored result is removed, so that upon
     next access they can be calculated again.
+
+    Results are also memoized process-wide, keyed by signature of simulation
+    inputs, so that equivalent setups (e.g. the same ship and RAH loadout on
+    different fits) do not trigger simulation again.
+
+    Attributes:
+        memo: LruStorage instance shared by all simulators, can be used to
+            fetch hit rate statistics.
     """
 
+    memo = LruStorage(MEMO_SIZE)
+
     def __init__(self, fit):
         # Contains all known RAHs and results of simulation
         # Format: {RAH item: {resonance attribute ID: resonance attribute
@@ -158,16 +155,6 @@ class ReactiveArmorHardenerSimulator(BaseSubscriber):
         if ship is None or not ship._is_loaded:
             return
 
-        # Containers for tick state history. We need history to detect loops,
-        # which helps to receive more accurate resonances and do it faster in
-        # majority of the cases.
-        # List contains actual history
-        # Format: [frozenset(RAH history entries), ...]
-        tick_history = []
-        # We also have set with historical entries for fast membership check
-        # Format: {frozenset(RAH history entries), ...}
-        ticks_seen = set()
-
         # Use RAH incoming damage profile if available, if it's not set - fall
         # back to default profile
         if self.__fit.rah_incoming_dmg is not None:
@@ -175,106 +162,300 @@ class ReactiveArmorHardenerSimulator(BaseSubscriber):
         else:
             incoming_dmg = self.__fit.default_incoming_dmg
 
+        # Fetch everything simulation depends on upfront, simulation core works
+        # just with these values and does not touch attributes
+        rahs = tuple(self.__data)
+        dmg = tuple(
+            getattr(incoming_dmg, attr_profile_map[attr_id])
+            for attr_id in res_attr_ids)
+        # Format: ((unsimulated resonances, shift amount, cycle time), ...)
+        rahs_data = tuple(
+            (
+                tuple(self.__data[item][attr_id] for attr_id in res_attr_ids),
+                item.attrs[AttrId.resist_shift_amount] / 100,
+                self.__get_rah_duration(item))
+            for item in rahs)
+        ship_data = self.__get_ship_data(ship, rahs)
+
+        # Use memoized results of equivalent simulation when they're available
+        signature = (
+            dmg, rahs_data, self.__get_ship_signature(ship_data),
+            MAX_SIMULATION_TICKS)
+        try:
+            results = self.memo.get(signature)
+        except KeyError:
+            results = self.__simulate(dmg, rahs_data, ship_data)
+            self.memo.add(signature, results)
+        for item, resos in zip(rahs, results):
+            self.__data[item] = dict(zip(res_attr_ids, resos))
+
+    def __set_unsimulated_resos(self):
+        """Put unsimulated resonance values into results.
+
+        Unsimulated resonance values are values which are modified by other
+        items, but not modified by overrides from this simulator.
+        """
+        for item, resos in self.__data.items():
+            for attr_id in res_attr_ids:
+                resos[attr_id] = item.attrs._get_without_overrides(attr_id)
+
+    def __get_ship_data(self, ship, rahs):
+        """Take snapshot of data needed to calculate ship resonances.
+
+        Modifications from RAHs are left unresolved, as they change during
+        simulation; all other modifications do not depend on RAH resonances,
+        thus are fetched just once.
+
+        Returns:
+            Tuple with ShipResoData instances.
+        """
+        rah_idxs = {item: idx for idx, item in enumerate(rahs)}
+
+        def is_variable(carrier_item, modifier):
+            return (
+                carrier_item in rah_idxs and
+                isinstance(modifier, DogmaModifier) and
+                modifier.src_attr_id in res_attr_ids)
+
+        ship_data = []
+        for attr_id in res_attr_ids:
+            (
+                attr, base_value, normal_mods, penalized_mods, variable_mods
+            ) = ship.attrs._get_mod_data(attr_id, is_variable)
+            # Format: {(operator, normalization function, penalize flag):
+            # [(RAH index, resonance index), ...]}
+            rah_mods = {}
+            for (
+                carrier_item, modifier, normalization_func, penalize
+            ) in variable_mods:
+                # Calculator ignores modifiers with unknown operators too
+                if normalization_func is None:
+                    continue
+                rah_mods.setdefault(
+                    (modifier.operator, normalization_func, penalize), []
+                ).append((
+                    rah_idxs[carrier_item],
+                    res_attr_ids.index(modifier.src_attr_id)))
+            rah_operators = {operator for operator, _, _ in rah_mods}
+            rah_penalized_operators = {
+                operator for operator, _, penalize in rah_mods if penalize}
+            if attr.max_attr_id is None:
+                max_value = None
+            else:
+                max_value = ship.attrs.get(attr.max_attr_id)
+            # Penalized modifications of operators which are not penalized for
+            # RAHs never change, aggregate them right away
+            for operator in tuple(penalized_mods):
+                if operator not in rah_penalized_operators:
+                    normal_mods.setdefault(operator, []).append(
+                        penalize_values(penalized_mods.pop(operator)))
+            # Same for operations which are applied before any of RAH ones
+            prefix_mods = {
+                operator: mod_values
+                for operator, mod_values in normal_mods.items()
+                if not rah_operators or operator < min(rah_operators)}
+            for operator in prefix_mods:
+                del normal_mods[operator]
+            base_value = aggregate_mods(attr, base_value, prefix_mods, {})
+            if not rah_operators and max_value is not None:
+                base_value = min(base_value, max_value)
+            # Order of multiplications does not matter, thus when there're only
+            # multiplications left, apply constant ones in advance
+            mult_only = all(
+                operator in MULTIPLICATION_OPERATORS
+                for operator in chain(normal_mods, rah_operators))
+            if mult_only:
+                for mod_values in normal_mods.values():
+                    for mod_value in mod_values:
+                        base_value *= mod_value
+                normal_mods = {}
+            ship_data.append(ShipResoData(
+                attr=attr, base_value=base_value, normal_mods=normal_mods,
+                penalized_mods=penalized_mods,
+                rah_mod_groups=tuple(
+                    (operator, normalization_func, penalize, tuple(positions))
+                    for (operator, normalization_func, penalize), positions in
+                    rah_mods.items()),
+                max_value=max_value, mult_only=mult_only))
+        return tuple(ship_data)
+
+    def __get_ship_signature(self, ship_data):
+        """Convert ship resonance data into hashable form."""
+        return tuple(
+            (
+                reso_data.attr.high_is_good,
+                reso_data.base_value,
+                tuple(sorted(
+                    (operator, tuple(sorted(mod_values)))
+                    for operator, mod_values in reso_data.normal_mods.items())),
+                tuple(sorted(
+                    (operator, tuple(sorted(mod_values)))
+                    for operator, mod_values in
+                    reso_data.penalized_mods.items())),
+                tuple(sorted(
+                    (operator, penalize, tuple(sorted(positions)))
+                    for operator, _, penalize, positions in
+                    reso_data.rah_mod_groups)),
+                reso_data.max_value,
+                reso_data.mult_only)
+            for reso_data in ship_data)
+
+    def __get_ship_resos(self, ship_data, rahs_resos):
+        """Calculate ship resonances for passed RAH resonances."""
+        ship_resos = []
+        for (
+            attr, base_value, normal_mods, penalized_mods, rah_mod_groups,
+            max_value, mult_only
+        ) in ship_data:
+            # Resonance which is not affected by RAHs is calculated in advance
+            if not rah_mod_groups:
+                ship_resos.append(base_value)
+                continue
+            if mult_only:
+                value = base_value
+                for (
+                    operator, normalization_func, penalize, positions
+                ) in rah_mod_groups:
+                    mod_values = [
+                        normalization_func(rahs_resos[rah_idx][reso_idx])
+                        for rah_idx, reso_idx in positions]
+                    if penalize:
+                        value *= penalize_values(
+                            penalized_mods.get(operator, []) + mod_values)
+                    else:
+                        for mod_value in mod_values:
+                            value *= mod_value
+            else:
+                # Aggregation modifies containers, thus pass copies
+                normal_mods = {o: v.copy() for o, v in normal_mods.items()}
+                penalized_mods = {
+                    o: v.copy() for o, v in penalized_mods.items()}
+                for (
+                    operator, normalization_func, penalize, positions
+                ) in rah_mod_groups:
+                    if penalize:
+                        mod_values = penalized_mods.setdefault(operator, [])
+                    else:
+                        mod_values = normal_mods.setdefault(operator, [])
+                    mod_values.extend(
+                        normalization_func(rahs_resos[rah_idx][reso_idx])
+                        for rah_idx, reso_idx in positions)
+                value = aggregate_mods(
+                    attr, base_value, normal_mods, penalized_mods)
+            if max_value is not None:
+                value = min(value, max_value)
+            ship_resos.append(value)
+        return ship_resos
+
+    def __simulate(self, dmg, rahs_data, ship_data):
+        """Run simulation.
+
+        Args:
+            dmg: Incoming damage values.
+            rahs_data: Iterable with (unsimulated resonances, shift amount,
+                cycle time) tuples for each RAH.
+            ship_data: Ship resonance data, as returned by __get_ship_data.
+
+        Returns:
+            Tuple with simulated resonances of each RAH, in the same order as
+            passed RAH data.
+        """
+        rah_count = len(rahs_data)
+        # Current resonances of RAHs, replaced when RAH finishes its cycle
+        rahs_resos = [resos for resos, _, _ in rahs_data]
+        shift_amts = [shift_amt for _, shift_amt, _ in rahs_data]
+        durations = [duration for _, _, duration in rahs_data]
+
+        # Containers for tick state history. We need history to detect loops,
+        # which helps to receive more accurate resonances and do it faster in
+        # majority of the cases. Tick state is composed of cycling times and
+        # resonances of each RAH
+        # Format: [(cycling times, RAHs resonances), ...]
+        tick_history = []
+        # We also have map with quantized tick states for fast loop detection
+        # Format: {(cycling times, quantized resonances): history index}
+        ticks_seen = {}
+
         # Container for damage each RAH received during its cycle. May
         # span across several simulation ticks for multi-RAH setups
-        # Format: {RAH item: {resonance attribute: damage received}}
-        cycle_dmg_data = {
-            item: {attr_id: 0 for attr_id in res_attr_ids}
-            for item in self.__data}
-        ship_attrs = ship.attrs
-
-        for tick_data in self.__sim_tick_iter(MAX_SIMULATION_TICKS):
-            time_passed, cycled, cycling_data = tick_data
+        cycle_dmgs = [[0, 0, 0, 0] for _ in range(rah_count)]
+        # Quantized resonances of RAHs, used for loop detection
+        rahs_quantized = [self.__quantize(resos) for resos in rahs_resos]
+
+        for tick_data in self.__sim_tick_iter(durations, MAX_SIMULATION_TICKS):
+            time_passed, cycled, cycling = tick_data
             # For each RAH, calculate damage received during this tick and add
             # it to damage received during RAH cycle
-            for item, item_cycle_dmg in cycle_dmg_data.items():
-                for attr_id in res_attr_ids:
-                    item_cycle_dmg[attr_id] += (
-                        getattr(incoming_dmg, attr_profile_map[attr_id]) *
-                        ship_attrs[attr_id] * time_passed)
-
-            for item in cycled:
-                # If RAH just finished its cycle, make resist switch - get new
-                # resonances
-                new_resos = self.__get_next_resos(
-                    self.__data[item], cycle_dmg_data[item],
-                    item.attrs[AttrId.resist_shift_amount] / 100)
-
-                # Then write these resonances to dictionary with results and
-                # notify everyone about these changes. This is needed to get
-                # updated ship resonances next tick
-                self.__data[item].update(new_resos)
-                for attr_id in res_attr_ids:
-                    item.attrs._override_value_may_change(attr_id)
-
-                # Reset damage counter for RAH which completed its cycle
-                for attr_id in res_attr_ids:
-                    cycle_dmg_data[item][attr_id] = 0
-
-            # Record current tick state
-            tick_state = frozenset(
-                # Copy resonances, as we will be modifying them each tick
-                RahState(item, cycling_data[item], copy(resos))
-                for item, resos in self.__data.items())
+            if time_passed:
+                ship_resos = self.__get_ship_resos(ship_data, rahs_resos)
+                tick_dmg = [
+                    dmg_value * ship_reso * time_passed
+                    for dmg_value, ship_reso in zip(dmg, ship_resos)]
+                for cycle_dmg in cycle_dmgs:
+                    for reso_idx, dmg_value in enumerate(tick_dmg):
+                        cycle_dmg[reso_idx] += dmg_value
+
+            # If RAH just finished its cycle, make resist switch and reset its
+            # damage counter
+            for rah_idx in cycled:
+                rahs_resos[rah_idx] = new_resos = self.__get_next_resos(
+                    rahs_resos[rah_idx], cycle_dmgs[rah_idx],
+                    shift_amts[rah_idx])
+                rahs_quantized[rah_idx] = self.__quantize(new_resos)
+                cycle_dmgs[rah_idx] = [0, 0, 0, 0]
 
             # See if we're in a loop, if we are - calculate average resists
             # across tick states which are within the loop
-            if tick_state in ticks_seen:
-                tick_states_loop = tick_history[tick_history.index(tick_state):]
-                avg_resos = self.__get_avg_resos(tick_states_loop)
-                for item, resos in avg_resos.items():
-                    self.__data[item] = resos
-                return
+            tick_key = (cycling, tuple(rahs_quantized))
+            loop_start = ticks_seen.get(tick_key)
+            if loop_start is not None:
+                return self.__get_avg_resos(
+                    tick_history[loop_start:], rahs_resos)
 
             # Update history only if we don't have such entries
-            ticks_seen.add(tick_state)
-            tick_history.append(tick_state)
+            ticks_seen[tick_key] = len(tick_history)
+            tick_history.append((cycling, tuple(rahs_resos)))
 
         # If we didn't find any RAH state loops during specified quantity of sim
         # ticks, calculate average resonances based on whole history, excluding
         # initial adaptation period
-        else:
-            ticks_to_ignore = min(
-                self.__estimate_initial_adaptation_ticks(tick_history),
-                # Never ignore more than half of the history
-                math.floor(len(tick_history) / 2))
-
-            avg_resos = self.__get_avg_resos(tick_history[ticks_to_ignore:])
-            for item, resos in avg_resos.items():
-                self.__data[item] = resos
-            return
-
-    def __set_unsimulated_resos(self):
-        """Put unsimulated resonance values into results.
-
-        Unsimulated resonance values are values which are modified by other
-        items, but not modified by overrides from this simulator.
-        """
-        for item, resos in self.__data.items():
-            for attr_id in res_attr_ids:
-                resos[attr_id] = item.attrs._get_without_overrides(attr_id)
-
-    def __sim_tick_iter(self, max_ticks):
+        ticks_to_ignore = min(
+            self.__estimate_initial_adaptation_ticks(tick_history, rahs_data),
+            # Never ignore more than half of the history
+            math.floor(len(tick_history) / 2))
+        return self.__get_avg_resos(
+            tick_history[ticks_to_ignore:], rahs_resos)
+
+    def __quantize(self, resos):
+        """Convert resonances into integers for reliable comparison."""
+        return tuple(round(reso * RESO_QUANTUM_MULT) for reso in resos)
+
+    def __sim_tick_iter(self, durations, max_ticks):
         """Iterate over simulation ticks.
 
         Ticks are points in time when cycle of any RAH is finished.
 
         Args:
+            durations: Cycle times of RAHs.
             max_ticks: Limit quantity of ticks produced.
 
         Yields:
             Tick data in the form of tuple of (time passed since last tick, list
-            of RAHs finished cycling, map with info on how long each RAH has
-            been in current cycle) format.
+            with indices of RAHs finished cycling, tuple with info on how long
+            each RAH has been in current cycle) format.
         """
         if max_ticks < 1:
             return
-        # Keep track of RAH cycle data in this map
-        # Format: {RAH item: current cycle time}
-        iter_cycle_data = {item: 0 for item in self.__data}
-        # Always copy cycle data map to make sure it's not getting modified from
-        # outside, which may alter iter state
-        yield 0, (), copy(iter_cycle_data)
+        rah_idxs = range(len(durations))
+        rounded_durations = [
+            sig_round(duration, SIG_DIGITS) for duration in durations]
+        # Values which differ from cycle time by more than this never match it
+        # after rounding
+        end_tolerances = [
+            abs(duration) * 10 ** (2 - SIG_DIGITS) for duration in durations]
+        # Keep track of RAH cycle data in this list
+        cycling = [0] * len(durations)
+        yield 0, (), tuple(cycling)
         # We've already yielded 1 value
         tick = 1
         while True:
@@ -284,141 +465,133 @@ class ReactiveArmorHardenerSimulator(BaseSubscriber):
                 return
             # Pick time remaining until some RAH finishes its cycle
             time_passed = min(
-                self.__get_rah_duration(item) - cycling
-                for item, cycling in iter_cycle_data.items())
-            # Compose set of RAHs which will finish cycle after passed amount of
-            # time
-            cycled = set()
-            for item, cycling in iter_cycle_data.items():
-                # Have time tolerance to cancel float calculation errors. It's
-                # needed for multi-RAH configurations, e.g. when normal RAH does
-                # 17 cycles, heated one does 20, but
-                # >>> sum([0.85] * 20) == 17
-                # False
+                duration - rah_cycling
+                for duration, rah_cycling in zip(durations, cycling))
+            # Compose list of RAHs which will finish cycle after passed amount
+            # of time. Have time tolerance to cancel float calculation errors.
+            # It's needed for multi-RAH configurations, e.g. when normal RAH
+            # does 17 cycles, heated one does 20, but
+            # >>> sum([0.85] * 20) == 17
+            # False
+            cycled = []
+            for rah_idx in rah_idxs:
+                cycle_end = cycling[rah_idx] + time_passed
+                # Rounding is relatively slow, thus do it only for cycles
+                # which are close to completion
                 if (
-                    sig_round(cycling + time_passed, SIG_DIGITS) ==
-                    sig_round(self.__get_rah_duration(item), SIG_DIGITS)
+                    abs(cycle_end - durations[rah_idx]) <=
+                    end_tolerances[rah_idx] and
+                    sig_round(cycle_end, SIG_DIGITS) ==
+                    rounded_durations[rah_idx]
                 ):
-                    cycled.add(item)
-            # Update map which tracks RAHs' cycle states
-            for item in iter_cycle_data:
-                if item in cycled:
-                    iter_cycle_data[item] = 0
+                    cycled.append(rah_idx)
+            # Update list which tracks RAHs' cycle states
+            for rah_idx in rah_idxs:
+                if rah_idx in cycled:
+                    cycling[rah_idx] = 0
                 else:
-                    iter_cycle_data[item] += time_passed
-            yield time_passed, cycled, copy(iter_cycle_data)
+                    cycling[rah_idx] += time_passed
+            yield time_passed, cycled, tuple(cycling)
 
     def __get_next_resos(self, current_resos, received_dmg, shift_amt):
         """Calculate new resonances RAH should take on the next cycle.
 
         Args:
-            current_resos: Current RAH resonances in {resonance attribute ID:
-                resonance attribute value} format.
+            current_resos: Current RAH resonances.
             received_dmg: Damage received by RAH during current cycle.
             shift_amt: Max allowed value of resonance attribute value it can
                 take from donor resonances.
 
         Returns:
-            New RAH resonances in {resonance attribute ID: resonance attribute
-            value} format.
+            Tuple with new RAH resonances.
         """
         # We borrow resistances from at least 2 resist types, possibly more if
         # ship didn't take damage of these types
-        donors = max(2, len([
-            item
-            for item in received_dmg
-            if received_dmg[item] == 0]))
+        donors = max(2, received_dmg.count(0))
         recipients = 4 - donors
         # Primary key for sorting is received damage, secondary is default
         # order. Default order "sorting" happens due to default order of
-        # attributes and stable sorting against primary key.
-        sorted_reso_attr_ids = sorted(res_attr_ids, key=received_dmg.get)
+        # resonances and stable sorting against primary key.
+        sorted_reso_idxs = sorted(range(4), key=received_dmg.__getitem__)
         donated_amt = 0
-        new_resos = {}
+        new_resos = list(current_resos)
         # Donate
-        for reso_attr_id in sorted_reso_attr_ids[:donors]:
-            current_reso = current_resos[reso_attr_id]
+        for reso_idx in sorted_reso_idxs[:donors]:
+            current_reso = current_resos[reso_idx]
             # Can't borrow more than it has
             to_donate = min(1 - current_reso, shift_amt)
             donated_amt += to_donate
-            new_resos[reso_attr_id] = current_reso + to_donate
+            new_resos[reso_idx] = current_reso + to_donate
         # Take
-        for reso_attr_id in sorted_reso_attr_ids[donors:]:
-            current_reso = current_resos[reso_attr_id]
-            new_resos[reso_attr_id] = current_reso - donated_amt / recipients
-        return new_resos
+        for reso_idx in sorted_reso_idxs[donors:]:
+            current_reso = current_resos[reso_idx]
+            new_resos[reso_idx] = current_reso - donated_amt / recipients
+        return tuple(new_resos)
 
-    def __get_avg_resos(self, tick_states):
+    def __get_avg_resos(self, tick_states, last_resos):
         """Calculate average resonances for RAHs.
 
         Args:
-            tick_states: Iterable with tick states, where each tick state is
-                iterable of RAH states.
+            tick_states: Iterable with tick states from history.
+            last_resos: Resonances RAHs have at the end of simulation, used
+                for RAHs which haven't started any cycle during passed ticks.
 
         Returns:
-            Average resonance values in {RAH item: averaged resonances} format.
+            Tuple with average resonances of each RAH.
         """
         # Container for resonances each RAH used
-        # Format: {RAH item: [resonance maps]}
-        rahs_resos_used = {}
-        for tick_state in tick_states:
-            for rah_state in tick_state:
+        # Format: [[RAH resonances, ...], ...]
+        rahs_resos_used = [[] for _ in last_resos]
+        for cycling, rahs_resos in tick_states:
+            for rah_idx, rah_resos_used in enumerate(rahs_resos_used):
                 # Add resonances to container only when RAH cycle is just
                 # starting
-                if rah_state.cycling != 0:
-                    continue
-                rah_resos_used = rahs_resos_used.setdefault(rah_state.item, [])
-                rah_resos_used.append(rah_state.resos)
+                if cycling[rah_idx] == 0:
+                    rah_resos_used.append(rahs_resos[rah_idx])
         # Calculate average values
-        avg_resos = {}
-        for item, resos in rahs_resos_used.items():
-            avg_resos[item] = {
-                attr_id: sum(r[attr_id] for r in resos) / len(resos)
-                for attr_id in res_attr_ids}
-        return avg_resos
-
-    def __estimate_initial_adaptation_ticks(self, tick_states):
+        avg_resos = []
+        for rah_resos_used, rah_last_resos in zip(rahs_resos_used, last_resos):
+            if not rah_resos_used:
+                avg_resos.append(rah_last_resos)
+                continue
+            avg_resos.append(tuple(
+                sum(r[reso_idx] for r in rah_resos_used) / len(rah_resos_used)
+                for reso_idx in range(4)))
+        return tuple(avg_resos)
+
+    def __estimate_initial_adaptation_ticks(self, tick_states, rahs_data):
         """Estimate how much time RAH takes for initial adaptation.
 
         Pick RAH which has the slowest adaptation and guesstimate its
         approximate adaptation period in ticks for the worst-case.
         """
         # Get max amount of time it takes to exhaust the highest resistance of
-        # each RAH
-        # Format: {RAH item: quantity of cycles}
-        exhaustion_cycles = {}
-        for item in self.__data:
-            # Calculate how many cycles it would take for highest resistance
-            # (lowest resonance) to be exhausted
-            exhaustion_cycles[item] = max(math.ceil(
-                (1 - item.attrs._get_without_overrides(attr_id)) /
-                (item.attrs[AttrId.resist_shift_amount] / 100)
-            ) for attr_id in res_attr_ids)
+        # each RAH, in quantity of cycles
+        exhaustion_cycles = [
+            max(math.ceil((1 - reso) / shift_amt) for reso in unsim_resos)
+            for unsim_resos, shift_amt, _ in rahs_data]
         # Slowest RAH is the one which takes the most time to exhaust its
         # highest resistance when it's used strictly as donor
-        slowest_item = max(
-            self.__data,
-            key=lambda i: exhaustion_cycles[i] * self.__get_rah_duration(i))
+        slowest_idx = max(
+            range(len(rahs_data)),
+            key=lambda i: exhaustion_cycles[i] * rahs_data[i][2])
         # Multiply quantity of resistance exhaustion cycles by 1.5, to give RAH
         # more time for 'finer' adjustments
-        slowest_cycles = math.ceil(exhaustion_cycles[slowest_item] * 1.5)
+        slowest_cycles = math.ceil(exhaustion_cycles[slowest_idx] * 1.5)
         if slowest_cycles == 0:
             return 0
-        # We rely on cycling time attribute to be zero in order to determine
-        # that cycle for the slowest RAH has just ended. It is zero for the very
-        # first tick in the history too, thus we skip it, but take it into
-        # initial tick count
+        # We rely on cycling time to be zero in order to determine that cycle
+        # for the slowest RAH has just ended. It is zero for the very first
+        # tick in the history too, thus we skip it, but take it into initial
+        # tick count
         ignored_tick_count = 1
         tick_count = ignored_tick_count
         cycle_count = 0
-        for tick_state in tick_states[ignored_tick_count:]:
+        for cycling, _ in tick_states[ignored_tick_count:]:
             # Once slowest RAH finished last cycle, do not count this tick and
             # break the loop
-            for item_state in tick_state:
-                if item_state.item is slowest_item:
-                    if item_state.cycling == 0:
-                        cycle_count += 1
-                    break
+            if cycling[slowest_idx] == 0:
+                cycle_count += 1
             if cycle_count >= slowest_cycles:
                 break
             tick_count += 1
@@ -19,8 +19,10 @@
 # ==============================================================================
 
 
+from itertools import chain
 from math import sqrt
 
+from eos.calculator import AttrSnapshot
 from eos.calculator import CalculationService
 from eos.const.eve import AttrId
 from eos.source import Source
@@ -74,6 +76,22 @@ class SolarSystem:
             for fit in self.fits:
                 fit._load_items()
 
+    def attr_snapshot(self, attr_ids, items=None):
+        """Get values of multiple attributes of multiple items at once.
+
+        Args:
+            attr_ids: Iterable with IDs of attributes to include.
+            items (optional): Iterable with items to include. By default, all
+                loaded items of all fits in the solar system are included.
+
+        Returns:
+            AttrSnapshot instance.
+        """
+        if items is None:
+            items = chain.from_iterable(
+                fit._loaded_item_iter() for fit in self.fits)
+        return AttrSnapshot._make(items, attr_ids)
+
     def get_ctc_range(self, item1, item2):
         """Calculate center-to-center range between two items."""
         try:
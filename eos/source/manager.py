@@ -22,6 +22,7 @@
 from logging import getLogger
 
 from eos import __version__ as eos_version
+from eos.eve_obj_builder import BuildState
 from eos.eve_obj_builder import EveObjBuilder
 from eos.util.repr import make_repr_str
 from .exception import ExistingSourceError
@@ -47,7 +48,9 @@ class SourceManager:
     default = None
 
     @classmethod
-    def add(cls, alias, data_handler, cache_handler, make_default=False):
+    def add(
+            cls, alias, data_handler, cache_handler, make_default=False,
+            builder_workers=None, build_state_path=None):
         """Add source to source manager.
 
         Adding includes initializing all facilities hidden behind name 'source'.
@@ -60,6 +63,12 @@ class SourceManager:
             make_default (optional): Do we need to mark passed source as default
                 or not. Default source will be used for instantiating new fits,
                 if no other source is specified.
+            builder_workers (optional): Quantity of worker processes eve object
+                builder can use when cache has to be updated. By default,
+                builder runs in current process.
+            build_state_path (optional): File path where results of eve object
+                building will be stored. When specified, cache updates reuse
+                objects not affected by changes in data since previous update.
         """
         logger.info('adding source with alias "{}"'.format(alias))
         if alias in cls._sources:
@@ -83,7 +92,15 @@ class SourceManager:
 
             # Generate eve objects and cache them, as generation takes
             # significant amount of time
-            eve_objects = EveObjBuilder.run(data_handler)
+            if build_state_path is None:
+                eve_objects = EveObjBuilder.run(
+                    data_handler, workers=builder_workers)
+            else:
+                eve_objects, build_state = EveObjBuilder.run_incremental(
+                    data_handler,
+                    prev_state=BuildState.load(build_state_path),
+                    workers=builder_workers)
+                build_state.save(build_state_path)
             cache_handler.update_cache(eve_objects, current_fp)
 
         # Finally, add record to list of sources
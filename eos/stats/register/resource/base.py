@@ -21,17 +21,46 @@
 
 from abc import ABCMeta
 from abc import abstractmethod
+from math import fsum
 
 from eos.stats.register.base import BaseStatRegister
 from eos.util.repr import make_repr_str
 
 
 class BaseResourceRegister(BaseStatRegister, metaclass=ABCMeta):
+    """Base class for resource registers.
+
+    Keeps total of resource use, which is recalculated only when users are
+    added or removed, or when resource use value of some user changes, thus
+    allowing to get used amount without going through all the users when
+    nothing changed. Total is recalculated from scratch rather than adjusted,
+    so floating point error does not accumulate.
+    """
+
+    def __init__(self):
+        BaseStatRegister.__init__(self)
+        # Format: {item: resource use value included into total}
+        self.__use_values = {}
+        # Users whose resource use value may have changed since it was
+        # included into total. Values are re-fetched lazily, as attribute
+        # calculation is not something we want to do on every invalidation
+        self.__dirty_users = set()
+        # Total of resource use values, None when it has to be recalculated
+        self.__used = 0
 
     @property
-    @abstractmethod
     def used(self):
-        ...
+        dirty_users = self.__dirty_users
+        if dirty_users:
+            use_attr_id = self._use_attr_id
+            use_values = self.__use_values
+            for item in tuple(dirty_users):
+                use_values[item] = item.attrs[use_attr_id]
+                dirty_users.discard(item)
+            self.__used = None
+        if self.__used is None:
+            self.__used = fsum(self.__use_values.values())
+        return self.__used
 
     @property
     @abstractmethod
@@ -40,9 +69,35 @@ class BaseResourceRegister(BaseStatRegister, metaclass=ABCMeta):
 
     @property
     @abstractmethod
-    def _users(self):
+    def _use_attr_id(self):
         ...
 
+    @property
+    def _users(self):
+        return self.__use_values.keys()
+
+    def _add_user(self, item):
+        if item in self.__use_values:
+            return
+        self.__use_values[item] = 0
+        self.__dirty_users.add(item)
+
+    def _remove_user(self, item):
+        try:
+            value = self.__use_values.pop(item)
+        except KeyError:
+            return
+        self.__dirty_users.discard(item)
+        if value:
+            self.__used = None
+
+    def _handle_attr_value_changed(self, msg):
+        if (
+            msg.attr_id == self._use_attr_id and
+            msg.item in self.__use_values
+        ):
+            self.__dirty_users.add(msg.item)
+
     def __repr__(self):
         spec = ['used', 'output']
         return make_repr_str(self, spec)
@@ -22,6 +22,7 @@
 from eos.const.eos import State
 from eos.const.eve import AttrId
 from eos.item import Drone
+from eos.pubsub.message import AttrValueChanged
 from eos.pubsub.message import StatesActivatedLoaded
 from eos.pubsub.message import StatesDeactivatedLoaded
 from .base import BaseResourceRegister
@@ -29,18 +30,13 @@ from .base import BaseResourceRegister
 
 class DroneBandwidthRegister(BaseResourceRegister):
 
+    _use_attr_id = AttrId.drone_bandwidth_used
+
     def __init__(self, fit):
         BaseResourceRegister.__init__(self)
         self.__fit = fit
-        self.__resource_users = set()
         fit._subscribe(self, self._handler_map.keys())
 
-    @property
-    def used(self):
-        return sum(
-            item.attrs[AttrId.drone_bandwidth_used]
-            for item in self.__resource_users)
-
     @property
     def output(self):
         try:
@@ -48,22 +44,19 @@ class DroneBandwidthRegister(BaseResourceRegister):
         except (AttributeError, KeyError):
             return 0
 
-    @property
-    def _users(self):
-        return self.__resource_users
-
     def _handle_states_activated_loaded(self, msg):
         if (
             isinstance(msg.item, Drone) and
             State.online in msg.states and
-            AttrId.drone_bandwidth_used in msg.item._type_attrs
+            self._use_attr_id in msg.item._type_attrs
         ):
-            self.__resource_users.add(msg.item)
+            self._add_user(msg.item)
 
     def _handle_states_deactivated_loaded(self, msg):
         if isinstance(msg.item, Drone) and State.online in msg.states:
-            self.__resource_users.discard(msg.item)
+            self._remove_user(msg.item)
 
     _handler_map = {
         StatesActivatedLoaded: _handle_states_activated_loaded,
-        StatesDeactivatedLoaded: _handle_states_deactivated_loaded}
+        StatesDeactivatedLoaded: _handle_states_deactivated_loaded,
+        AttrValueChanged: BaseResourceRegister._handle_attr_value_changed}
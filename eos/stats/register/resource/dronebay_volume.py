@@ -21,6 +21,7 @@
 
 from eos.const.eve import AttrId
 from eos.item import Drone
+from eos.pubsub.message import AttrValueChanged
 from eos.pubsub.message import ItemLoaded
 from eos.pubsub.message import ItemUnloaded
 from .base import BaseResourceRegister
@@ -28,16 +29,13 @@ from .base import BaseResourceRegister
 
 class DronebayVolumeRegister(BaseResourceRegister):
 
+    _use_attr_id = AttrId.volume
+
     def __init__(self, fit):
         BaseResourceRegister.__init__(self)
         self.__fit = fit
-        self.__resource_users = set()
         fit._subscribe(self, self._handler_map.keys())
 
-    @property
-    def used(self):
-        return sum(item.attrs[AttrId.volume] for item in self.__resource_users)
-
     @property
     def output(self):
         try:
@@ -45,21 +43,18 @@ class DronebayVolumeRegister(BaseResourceRegister):
         except (AttributeError, KeyError):
             return 0
 
-    @property
-    def _users(self):
-        return self.__resource_users
-
     def _handle_item_loaded(self, msg):
         if (
             isinstance(msg.item, Drone) and
-            AttrId.volume in msg.item._type_attrs
+            self._use_attr_id in msg.item._type_attrs
         ):
-            self.__resource_users.add(msg.item)
+            self._add_user(msg.item)
 
     def _handle_item_unloaded(self, msg):
         if isinstance(msg.item, Drone):
-            self.__resource_users.discard(msg.item)
+            self._remove_user(msg.item)
 
     _handler_map = {
         ItemLoaded: _handle_item_loaded,
-        ItemUnloaded: _handle_item_unloaded}
+        ItemUnloaded: _handle_item_unloaded,
+        AttrValueChanged: BaseResourceRegister._handle_attr_value_changed}
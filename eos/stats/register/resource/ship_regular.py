@@ -24,6 +24,7 @@ from abc import abstractmethod
 
 from eos.const.eve import AttrId
 from eos.const.eve import EffectId
+from eos.pubsub.message import AttrValueChanged
 from eos.pubsub.message import EffectsStarted
 from eos.pubsub.message import EffectsStopped
 from .base import BaseResourceRegister
@@ -34,7 +35,6 @@ class ShipRegularResourceRegister(BaseResourceRegister, metaclass=ABCMeta):
     def __init__(self, fit):
         BaseResourceRegister.__init__(self)
         self.__fit = fit
-        self.__resource_users = set()
         fit._subscribe(self, self._handler_map.keys())
 
     @property
@@ -47,17 +47,6 @@ class ShipRegularResourceRegister(BaseResourceRegister, metaclass=ABCMeta):
     def _use_effect_id(self):
         ...
 
-    @property
-    @abstractmethod
-    def _use_attr_id(self):
-        ...
-
-    @property
-    def used(self):
-        return sum(
-            item.attrs[self._use_attr_id]
-            for item in self.__resource_users)
-
     @property
     def output(self):
         try:
@@ -65,24 +54,21 @@ class ShipRegularResourceRegister(BaseResourceRegister, metaclass=ABCMeta):
         except (AttributeError, KeyError):
             return 0
 
-    @property
-    def _users(self):
-        return self.__resource_users
-
     def _handle_effects_started(self, msg):
         if (
             self._use_effect_id in msg.effect_ids and
             self._use_attr_id in msg.item._type_attrs
         ):
-            self.__resource_users.add(msg.item)
+            self._add_user(msg.item)
 
     def _handle_effects_stopped(self, msg):
         if self._use_effect_id in msg.effect_ids:
-            self.__resource_users.discard(msg.item)
+            self._remove_user(msg.item)
 
     _handler_map = {
         EffectsStarted: _handle_effects_started,
-        EffectsStopped: _handle_effects_stopped}
+        EffectsStopped: _handle_effects_stopped,
+        AttrValueChanged: BaseResourceRegister._handle_attr_value_changed}
 
 
 class RoundedShipRegularResourceRegister(ShipRegularResourceRegister):
@@ -146,6 +146,26 @@ class StatService:
         except AttributeError:
             return ItemHP(0, 0, 0)
 
+    def get_ehp_many(self, dmg_profiles):
+        """Get effective HP of ship against multiple damage profiles.
+
+        Args:
+            dmg_profiles: Iterable with damage profiles. Every element can be
+                either DmgProfile helper container instance, or sequence of 4
+                numbers in em, thermal, kinetic, explosive order.
+
+        Returns:
+            List with TankingLayersTotal helper container instances, in the
+            same order as passed damage profiles. If ship data cannot be
+            fetched, EHP values will be 0.
+        """
+        # Materialize profiles, as they may be needed to be iterated over twice
+        dmg_profiles = tuple(dmg_profiles)
+        try:
+            return self.__fit.ship.get_ehp_many(dmg_profiles)
+        except AttributeError:
+            return [ItemHP(0, 0, 0) for _ in dmg_profiles]
+
     @property
     def worst_case_ehp(self):
         """Get eve-style effective HP for the item.
@@ -24,6 +24,7 @@ from .coordinates import Orientation
 from .dmg_types import DmgProfile
 from .dmg_types import DmgStats
 from .dmg_types import ResistProfile
+from .resources import ResourceStats
 from .slots import SlotStats
 from .tanking_layers import ItemHP
 from .tanking_layers import TankingLayers
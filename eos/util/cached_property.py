@@ -24,6 +24,9 @@ Original code by Entity, as seen in reverence.
 """
 
 
+from types import MemberDescriptorType
+
+
 class cached_property:
     """Decorator which stores call return value on instance.
 
@@ -31,18 +34,42 @@ class cached_property:
     which decorated method belongs. As python, when getting attribute with
     certain name, seeks for class instance's attributes first, then for methods,
     it gets cached result. To clear cache, just delete cached attribute.
+
+    Classes which define __slots__ can declare slot with the name of decorated
+    method prefixed by '_cached_'; in this case value is stored in that slot,
+    and to clear cache the slot attribute should be deleted.
     """
 
     def __init__(self, method):
         self.__method = method
+        self.__name = method.__name__
+        # Descriptor of slot which stores cached value, if owner declares it
+        self.__slot = None
+
+    def __set_name__(self, owner, name):
+        self.__name = name
+        slot = getattr(owner, '_cached_{}'.format(name), None)
+        # Use only slots, as anything else cannot be relied upon to store
+        # per-instance value
+        if isinstance(slot, MemberDescriptorType):
+            self.__slot = slot
 
     def __get__(self, instance, _):
         # Return descriptor if called from class
         if instance is None:
             return self
-        # If called from instance, execute decorated method and store returned
-        # value as class attribute, which has the same name as method, then
-        # return it to caller
-        value = self.__method(instance)
-        setattr(instance, self.__method.__name__, value)
-        return value
+        slot = self.__slot
+        # If there's no slot, execute decorated method and store returned value
+        # as instance attribute, which has the same name as method, then return
+        # it to caller
+        if slot is None:
+            value = self.__method(instance)
+            setattr(instance, self.__name, value)
+            return value
+        # Otherwise, get value from slot, filling it if it's empty
+        try:
+            return slot.__get__(instance)
+        except AttributeError:
+            value = self.__method(instance)
+            slot.__set__(instance, value)
+            return value
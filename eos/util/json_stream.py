@@ -0,0 +1,143 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import json
+
+
+WHITESPACE = ' \t\n\r'
+
+
+def iter_json_items(file, chunk_size=65536):
+    """Iterate over items of top-level JSON container.
+
+    Only one item at a time is decoded and kept in memory, which allows to
+    process documents much larger than available memory.
+
+    Args:
+        file: Text file object with JSON document, whose top-level element is
+            an object or an array.
+        chunk_size (optional): Quantity of characters to read from file at
+            once.
+
+    Yields:
+        Tuples in (key, value) format. For arrays, position of value in array
+        is used as key.
+
+    Raises:
+        ValueError: If document is malformed.
+    """
+    reader = _JsonReader(file, chunk_size)
+    opener = reader.peek()
+    if opener == '{':
+        closer = '}'
+    elif opener == '[':
+        closer = ']'
+    else:
+        raise ValueError('top-level element is not a container')
+    reader.skip()
+    position = 0
+    while True:
+        char = reader.peek()
+        if char == closer:
+            reader.skip()
+            return
+        if position > 0:
+            if char != ',':
+                raise ValueError('expected delimiter at item {}'.format(
+                    position))
+            reader.skip()
+        if opener == '{':
+            key = reader.decode()
+            if not isinstance(key, str):
+                raise ValueError('expected key at item {}'.format(position))
+            if reader.peek() != ':':
+                raise ValueError('expected colon at item {}'.format(position))
+            reader.skip()
+        else:
+            key = position
+        yield key, reader.decode()
+        position += 1
+
+
+class _JsonReader:
+    """Decodes JSON values one by one from file."""
+
+    def __init__(self, file, chunk_size):
+        self.__file = file
+        self.__chunk_size = chunk_size
+        self.__decoder = json.JSONDecoder()
+        self.__buffer = ''
+        self.__pos = 0
+        self.__eof = False
+
+    def peek(self):
+        """Return next non-whitespace character without consuming it."""
+        while True:
+            buffer = self.__buffer
+            pos = self.__pos
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+            self.__pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self.__fill():
+                raise ValueError('unexpected end of JSON document')
+
+    def skip(self):
+        """Consume character returned by peek()."""
+        self.__pos += 1
+
+    def decode(self):
+        """Decode next JSON value and consume it."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(
+                    self.__buffer, self.__pos)
+            except ValueError:
+                if not self.__fill():
+                    raise
+                continue
+            # Value which spans until end of buffer might be cut in the
+            # middle, e.g. number, thus try again with more data
+            if end == len(self.__buffer) and self.__fill():
+                continue
+            self.__pos = end
+            return value
+
+    def __fill(self):
+        """Read next chunk of data into buffer, dropping consumed data.
+
+        Returns:
+            False if file has no more data, True otherwise.
+        """
+        if self.__eof:
+            return False
+        # Values larger than chunk size are decoded from scratch on each fill,
+        # thus read at least as much as we have, to keep it linear
+        chunk = self.__file.read(max(
+            self.__chunk_size, len(self.__buffer) - self.__pos))
+        if not chunk:
+            self.__eof = True
+            return False
+        self.__buffer = self.__buffer[self.__pos:] + chunk
+        self.__pos = 0
+        return True
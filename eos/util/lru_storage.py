@@ -0,0 +1,113 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from collections import OrderedDict
+from collections import namedtuple
+
+from eos.util.repr import make_repr_str
+
+
+class StorageStats(namedtuple(
+    'StorageStats', ('hits', 'misses', 'materializations', 'size'))
+):
+    """Access statistics of storage."""
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        """Share of lookups which returned stored value."""
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0
+        return self.hits / lookups
+
+
+class LruStorage:
+    """Keyed storage which keeps access statistics.
+
+    If storage size is limited, entries which were not accessed for the longest
+    time are dropped from it when limit is exceeded.
+
+    Args:
+        max_size (optional): Max quantity of entries kept in storage. If not
+            specified, storage size is not limited.
+    """
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size
+        # Format: {key: value}
+        self.__data = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__materializations = 0
+
+    def get(self, key):
+        """Get stored value.
+
+        Raises:
+            KeyError: If there's nothing stored for the key.
+        """
+        data = self.__data
+        try:
+            value = data[key]
+        except KeyError:
+            self.__misses += 1
+            raise
+        self.__hits += 1
+        if self.max_size is not None:
+            data.move_to_end(key)
+        return value
+
+    def add(self, key, value):
+        """Store value, evicting least recently used entries if needed."""
+        data = self.__data
+        data[key] = value
+        self.__materializations += 1
+        if self.max_size is not None:
+            data.move_to_end(key)
+            while len(data) > self.max_size:
+                data.popitem(last=False)
+
+    def clear(self):
+        """Drop all stored values, leaving statistics intact."""
+        self.__data.clear()
+
+    def reset_stats(self):
+        """Reset access statistics."""
+        self.__hits = 0
+        self.__misses = 0
+        self.__materializations = 0
+
+    @property
+    def stats(self):
+        """Return access statistics of the storage."""
+        return StorageStats(
+            hits=self.__hits,
+            misses=self.__misses,
+            materializations=self.__materializations,
+            size=len(self.__data))
+
+    def __len__(self):
+        return len(self.__data)
+
+    def __repr__(self):
+        spec = ['max_size', 'stats']
+        return make_repr_str(self, spec)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Measure time needed to calculate attributes of items which are influenced by
+full set of level 5 skills.
+"""
+
+
+import argparse
+from timeit import default_timer
+
+from synthetic_source import CHAR_ATTR_IDS
+from synthetic_source import MODULE_ATTR_IDS
+from synthetic_source import MODULE_TYPE_ID
+from synthetic_source import SHIP_ATTR_IDS
+from synthetic_source import SHIP_TYPE_ID
+from synthetic_source import add_source
+
+from eos import Fit
+from eos import ModuleLow
+from eos import Ship
+from eos import Skill
+
+
+def make_fit(skill_type_ids):
+    fit = Fit()
+    fit.ship = Ship(SHIP_TYPE_ID)
+    for skill_type_id in skill_type_ids:
+        fit.skills.add(Skill(skill_type_id, level=5))
+    fit.modules.low.append(ModuleLow(MODULE_TYPE_ID))
+    return fit
+
+
+def calculate_all(fit):
+    """Access all attributes which are influenced by skills."""
+    for attr_id in SHIP_ATTR_IDS:
+        fit.ship.attrs[attr_id]
+    for attr_id in CHAR_ATTR_IDS:
+        fit.character.attrs[attr_id]
+    for module in fit.modules.low:
+        for attr_id in MODULE_ATTR_IDS:
+            module.attrs[attr_id]
+
+
+def lookup_all(fit):
+    """Request affectors of all attributes which are influenced by skills."""
+    calculator = fit.solar_system._calculator
+    for attr_id in SHIP_ATTR_IDS:
+        calculator.get_affectors(fit.ship, attr_id)
+    for attr_id in CHAR_ATTR_IDS:
+        calculator.get_affectors(fit.character, attr_id)
+    for module in fit.modules.low:
+        for attr_id in MODULE_ATTR_IDS:
+            calculator.get_affectors(module, attr_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--skills', type=int, default=400)
+    parser.add_argument('--mods-per-skill', type=int, default=4)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+    skill_type_ids = add_source(
+        'synthetic', skill_count=args.skills,
+        mods_per_skill=args.mods_per_skill)
+    calc_total = 0
+    lookup_total = 0
+    for _ in range(args.rounds):
+        fit = make_fit(skill_type_ids)
+        started = default_timer()
+        lookup_all(fit)
+        lookup_total += default_timer() - started
+        started = default_timer()
+        calculate_all(fit)
+        calc_total += default_timer() - started
+    print('{} skills, {} modifiers each'.format(
+        args.skills, args.mods_per_skill))
+    print('affector lookup: {:.2f} ms per fit'.format(
+        lookup_total / args.rounds * 1000))
+    print('cold attribute calculation: {:.2f} ms per fit'.format(
+        calc_total / args.rounds * 1000))
+
+
+if __name__ == '__main__':
+    main()
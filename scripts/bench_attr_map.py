@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Measure memory taken by many fits and latency of reading already calculated
+attribute values from them.
+"""
+
+
+import argparse
+import tracemalloc
+from timeit import default_timer
+
+from bench_attr_calculation import calculate_all
+from bench_attr_calculation import make_fit
+from synthetic_source import CHAR_ATTR_IDS
+from synthetic_source import MODULE_ATTR_IDS
+from synthetic_source import SHIP_ATTR_IDS
+from synthetic_source import add_source
+
+
+def read_all(fits):
+    """Read all calculated attributes of passed fits."""
+    for fit in fits:
+        ship_attrs = fit.ship.attrs
+        for attr_id in SHIP_ATTR_IDS:
+            ship_attrs[attr_id]
+        char_attrs = fit.character.attrs
+        for attr_id in CHAR_ATTR_IDS:
+            char_attrs[attr_id]
+        for module in fit.modules.low:
+            module_attrs = module.attrs
+            for attr_id in MODULE_ATTR_IDS:
+                module_attrs[attr_id]
+                attr_id in module_attrs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--fits', type=int, default=1000)
+    parser.add_argument('--skills', type=int, default=20)
+    parser.add_argument('--rounds', type=int, default=10)
+    args = parser.parse_args()
+    skill_type_ids = add_source('synthetic', skill_count=args.skills)
+    tracemalloc.start()
+    fits = []
+    for _ in range(args.fits):
+        fit = make_fit(skill_type_ids)
+        calculate_all(fit)
+        fits.append(fit)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    started = default_timer()
+    for _ in range(args.rounds):
+        read_all(fits)
+    elapsed = default_timer() - started
+    read_count = args.rounds * args.fits * (
+        len(SHIP_ATTR_IDS) + len(CHAR_ATTR_IDS) + len(MODULE_ATTR_IDS) * 2)
+    print('{} fits, {} skills each'.format(args.fits, args.skills))
+    print('memory: {:.1f} KiB per fit'.format(memory / args.fits / 1024))
+    print('calculated attribute access: {:.0f} ns'.format(
+        elapsed / read_count * 1e9))
+
+
+if __name__ == '__main__':
+    main()
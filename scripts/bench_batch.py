@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Measure throughput of batch fit evaluation in current process and in process
+pool.
+"""
+
+
+import argparse
+from timeit import default_timer
+
+from synthetic_source import MODULE_TYPE_ID
+from synthetic_source import SHIP_TYPE_ID
+from synthetic_source import add_source
+
+from eos import Fit
+from eos import ModuleLow
+from eos import Ship
+from eos import Skill
+from eos import State
+from eos.batch import BatchEvaluator
+
+
+STATS = ('cpu', 'powergrid', 'hp', 'ehp', 'dps', 'valid')
+
+
+def make_specs(fit_count, skill_type_ids):
+    fit = Fit()
+    fit.ship = Ship(SHIP_TYPE_ID)
+    for skill_type_id in skill_type_ids:
+        fit.skills.add(Skill(skill_type_id, level=5))
+    specs = []
+    for i in range(fit_count):
+        fit.modules.low.clear()
+        for _ in range(i % 8):
+            fit.modules.low.append(
+                ModuleLow(MODULE_TYPE_ID, state=State.online))
+        specs.append(fit.to_spec())
+    return specs
+
+
+def measure(specs, workers, chunk_size):
+    with BatchEvaluator(
+        STATS, workers=workers, chunk_size=chunk_size
+    ) as evaluator:
+        # Warm worker processes up
+        for _ in evaluator.evaluate(specs[:chunk_size]):
+            pass
+        started = default_timer()
+        for _ in evaluator.evaluate(specs):
+            pass
+        return default_timer() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--fits', type=int, default=400)
+    parser.add_argument('--skills', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--chunk-size', type=int, default=25)
+    args = parser.parse_args()
+    skill_type_ids = add_source('synthetic', skill_count=args.skills)
+    specs = make_specs(args.fits, skill_type_ids)
+    print('{} fits, {} skills each'.format(args.fits, args.skills))
+    for workers in (None, args.workers):
+        elapsed = measure(specs, workers, args.chunk_size)
+        print('{} workers: {:.0f} fits per second'.format(
+            workers or 1, args.fits / elapsed))
+
+
+if __name__ == '__main__':
+    main()
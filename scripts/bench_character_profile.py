@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Compare time and memory needed to construct many fits of the same pilot, with
+skills added to every fit and with skills taken from shared character profile.
+"""
+
+
+import argparse
+import tracemalloc
+from timeit import default_timer
+
+from bench_attr_calculation import calculate_all
+from synthetic_source import MODULE_TYPE_ID
+from synthetic_source import SHIP_TYPE_ID
+from synthetic_source import add_source
+
+from eos import CharacterProfile
+from eos import Fit
+from eos import ModuleLow
+from eos import Ship
+from eos import Skill
+
+
+def make_fit(skill_type_ids, profile):
+    fit = Fit()
+    fit.ship = Ship(SHIP_TYPE_ID)
+    if profile is None:
+        for skill_type_id in skill_type_ids:
+            fit.skills.add(Skill(skill_type_id, level=5))
+    else:
+        fit.character_profile = profile
+    fit.modules.low.append(ModuleLow(MODULE_TYPE_ID))
+    return fit
+
+
+def measure(skill_type_ids, profile, fit_count):
+    """Return time in seconds and memory in bytes used to build fits."""
+    tracemalloc.start()
+    started = default_timer()
+    fits = []
+    for _ in range(fit_count):
+        fit = make_fit(skill_type_ids, profile)
+        calculate_all(fit)
+        fits.append(fit)
+    elapsed = default_timer() - started
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--skills', type=int, default=400)
+    parser.add_argument('--mods-per-skill', type=int, default=4)
+    parser.add_argument('--fits', type=int, default=50)
+    args = parser.parse_args()
+    skill_type_ids = add_source(
+        'synthetic', skill_count=args.skills,
+        mods_per_skill=args.mods_per_skill)
+    profile = CharacterProfile()
+    for skill_type_id in skill_type_ids:
+        profile.skills.add(Skill(skill_type_id, level=5))
+    print('{} fits, {} skills, {} modifiers each'.format(
+        args.fits, args.skills, args.mods_per_skill))
+    for label, fit_profile in (('own skills', None), ('profile', profile)):
+        elapsed, memory = measure(skill_type_ids, fit_profile, args.fits)
+        print('{}: {:.2f} ms, {:.1f} KiB per fit'.format(
+            label, elapsed / args.fits * 1000, memory / args.fits / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Measure memory taken by eve objects of loaded source, and by items added to
+fits.
+"""
+
+
+import argparse
+import gc
+import tracemalloc
+
+from bench_attr_calculation import calculate_all
+from synthetic_source import MODULE_TYPE_ID
+from synthetic_source import SHIP_TYPE_ID
+from synthetic_source import add_source
+from synthetic_source import make_eve_objects
+
+from eos import Fit
+from eos import ModuleLow
+from eos import Ship
+from eos import Skill
+
+
+def measure(func):
+    """Return value returned by function and memory allocated during call."""
+    gc.collect()
+    tracemalloc.start()
+    value = func()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, memory
+
+
+def make_fits(fit_count, skill_type_ids, module_count):
+    fits = []
+    for _ in range(fit_count):
+        fit = Fit()
+        fit.ship = Ship(SHIP_TYPE_ID)
+        for skill_type_id in skill_type_ids:
+            fit.skills.add(Skill(skill_type_id, level=5))
+        for _ in range(module_count):
+            fit.modules.low.append(ModuleLow(MODULE_TYPE_ID))
+        calculate_all(fit)
+        fits.append(fit)
+    return fits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--skills', type=int, default=2000)
+    parser.add_argument('--mods-per-skill', type=int, default=4)
+    parser.add_argument('--fits', type=int, default=100)
+    parser.add_argument('--fit-skills', type=int, default=20)
+    parser.add_argument('--modules', type=int, default=8)
+    args = parser.parse_args()
+    eve_objects, source_memory = measure(lambda: make_eve_objects(
+        skill_count=args.skills, mods_per_skill=args.mods_per_skill))
+    types, attrs, effects = eve_objects
+    print('source: {} types, {} effects, {} attributes'.format(
+        len(types), len(effects), len(attrs)))
+    print('source eve objects: {:.1f} KiB ({:.0f} bytes per type)'.format(
+        source_memory / 1024, source_memory / len(types)))
+    skill_type_ids = add_source(
+        'synthetic', skill_count=args.fit_skills,
+        mods_per_skill=args.mods_per_skill)
+    _, empty_memory = measure(lambda: make_fits(args.fits, (), 0))
+    fits, full_memory = measure(lambda: make_fits(
+        args.fits, skill_type_ids, args.modules))
+    # Account items which were added, i.e. skills and modules
+    item_count = args.fits * (args.fit_skills + args.modules)
+    print('fitted items: {:.0f} bytes per item'.format(
+        (full_memory - empty_memory) / item_count))
+
+
+if __name__ == '__main__':
+    main()
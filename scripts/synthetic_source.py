@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Build source with synthetic, but structurally realistic data, to be used by
+benchmark scripts which cannot rely on availability of real EVE data.
+"""
+
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..')))
+
+from eos import __version__ as eos_version  # noqa: E402
+from eos import SourceManager  # noqa: E402
+from eos.cache_handler import AttrFetchError  # noqa: E402
+from eos.cache_handler import EffectFetchError  # noqa: E402
+from eos.cache_handler import TypeFetchError  # noqa: E402
+from eos.cache_handler.base import BaseCacheHandler  # noqa: E402
+from eos.const.eos import EosTypeId  # noqa: E402
+from eos.const.eos import ModDomain  # noqa: E402
+from eos.const.eos import ModOperator  # noqa: E402
+from eos.const.eos import ModTgtFilter  # noqa: E402
+from eos.const.eve import AttrId  # noqa: E402
+from eos.const.eve import EffectCategoryId  # noqa: E402
+from eos.const.eve import EffectId  # noqa: E402
+from eos.const.eve import TypeCategoryId  # noqa: E402
+from eos.const.eve import TypeGroupId  # noqa: E402
+from eos.const.eve import TypeId  # noqa: E402
+from eos.eve_obj.attribute import AttrFactory  # noqa: E402
+from eos.eve_obj.effect import EffectFactory  # noqa: E402
+from eos.eve_obj.modifier import DogmaModifier  # noqa: E402
+from eos.eve_obj.type import TypeFactory  # noqa: E402
+
+
+DATA_VERSION = 'synthetic'
+
+SHIP_TYPE_ID = 100
+MODULE_TYPE_ID = 200
+SKILL_TYPE_ID_START = 1000
+
+SHIP_GROUP_ID = 10
+MODULE_GROUP_ID = 20
+SKILL_GROUP_ID = 30
+
+# IDs of synthetic attributes which are modified by skills
+SHIP_ATTR_IDS = tuple(range(10000, 10100))
+CHAR_ATTR_IDS = tuple(range(11000, 11020))
+MODULE_ATTR_IDS = tuple(range(12000, 12020))
+# Attribute which keeps value of skill bonus
+SKILL_BONUS_ATTR_ID = 13000
+# Attributes which are read by fit stats and restrictions, with values of
+# synthetic ship
+SHIP_STAT_ATTRS = {
+    AttrId.hp: 3000,
+    AttrId.armor_hp: 4000,
+    AttrId.shield_capacity: 5000,
+    AttrId.cpu_output: 500,
+    AttrId.power_output: 1000,
+    AttrId.upgrade_capacity: 400,
+    AttrId.drone_capacity: 0,
+    AttrId.drone_bandwidth: 0,
+    AttrId.hi_slots: 0,
+    AttrId.med_slots: 0,
+    AttrId.low_slots: 8,
+    AttrId.rig_slots: 0,
+    AttrId.max_subsystems: 0,
+    AttrId.turret_slots_left: 0,
+    AttrId.launcher_slots_left: 0,
+    AttrId.fighter_tubes: 0,
+    AttrId.fighter_light_slots: 0,
+    AttrId.fighter_support_slots: 0,
+    AttrId.fighter_heavy_slots: 0}
+RESONANCE_ATTR_IDS = (
+    AttrId.em_dmg_resonance,
+    AttrId.therm_dmg_resonance,
+    AttrId.kin_dmg_resonance,
+    AttrId.expl_dmg_resonance,
+    AttrId.armor_em_dmg_resonance,
+    AttrId.armor_therm_dmg_resonance,
+    AttrId.armor_kin_dmg_resonance,
+    AttrId.armor_expl_dmg_resonance,
+    AttrId.shield_em_dmg_resonance,
+    AttrId.shield_therm_dmg_resonance,
+    AttrId.shield_kin_dmg_resonance,
+    AttrId.shield_expl_dmg_resonance)
+
+EFFECT_ID_START = 100000
+
+
+class SyntheticDataHandler:
+    """Data handler stub, which provides just data version.
+
+    Cache handler is filled with synthetic data beforehand, thus source manager
+    never needs actual data tables.
+    """
+
+    def get_version(self):
+        return DATA_VERSION
+
+
+class SyntheticCacheHandler(BaseCacheHandler):
+    """Cache handler which keeps eve objects in memory only."""
+
+    def __init__(self):
+        self.__types = {}
+        self.__attrs = {}
+        self.__effects = {}
+        self.__fingerprint = None
+
+    def get_type(self, type_id):
+        try:
+            return self.__types[type_id]
+        except KeyError as e:
+            raise TypeFetchError(type_id) from e
+
+    def get_attr(self, attr_id):
+        try:
+            return self.__attrs[attr_id]
+        except KeyError as e:
+            raise AttrFetchError(attr_id) from e
+
+    def get_effect(self, effect_id):
+        try:
+            return self.__effects[effect_id]
+        except KeyError as e:
+            raise EffectFetchError(effect_id) from e
+
+    def get_fingerprint(self):
+        return self.__fingerprint
+
+    def update_cache(self, eve_objects, fingerprint):
+        types, attrs, effects = eve_objects
+        self.__types = {t.id: t for t in types}
+        self.__attrs = {a.id: a for a in attrs}
+        self.__effects = {e.id: e for e in effects}
+        self.__fingerprint = fingerprint
+
+
+def make_eve_objects(skill_count=400, mods_per_skill=4):
+    """Compose eve objects for synthetic source.
+
+    Every skill carries single passive effect with modifiers which target ship,
+    character and modules which require the skill, in round-robin fashion.
+
+    Returns:
+        Tuple with item types, attributes and effects.
+    """
+    attrs = []
+    for attr_id in (
+        *SHIP_ATTR_IDS, *CHAR_ATTR_IDS, *MODULE_ATTR_IDS, SKILL_BONUS_ATTR_ID,
+        *SHIP_STAT_ATTRS, AttrId.max_active_drones, AttrId.skill_level,
+        AttrId.required_skill_1, AttrId.required_skill_1_level
+    ):
+        attrs.append(AttrFactory.make(
+            attr_id=attr_id, default_value=0, high_is_good=True,
+            stackable=True))
+    for attr_id in RESONANCE_ATTR_IDS:
+        attrs.append(AttrFactory.make(
+            attr_id=attr_id, default_value=1, high_is_good=False,
+            stackable=False))
+    effects = []
+    types = []
+    skill_type_ids = []
+    for skill_idx in range(skill_count):
+        skill_type_id = SKILL_TYPE_ID_START + skill_idx
+        skill_type_ids.append(skill_type_id)
+        modifiers = []
+        for mod_idx in range(mods_per_skill):
+            seq = skill_idx * mods_per_skill + mod_idx
+            kind = seq % 3
+            if kind == 0:
+                modifier = DogmaModifier(
+                    tgt_filter=ModTgtFilter.item,
+                    tgt_domain=ModDomain.ship,
+                    tgt_attr_id=SHIP_ATTR_IDS[seq % len(SHIP_ATTR_IDS)],
+                    operator=ModOperator.post_percent,
+                    src_attr_id=SKILL_BONUS_ATTR_ID)
+            elif kind == 1:
+                modifier = DogmaModifier(
+                    tgt_filter=ModTgtFilter.item,
+                    tgt_domain=ModDomain.character,
+                    tgt_attr_id=CHAR_ATTR_IDS[seq % len(CHAR_ATTR_IDS)],
+                    operator=ModOperator.mod_add,
+                    src_attr_id=SKILL_BONUS_ATTR_ID)
+            else:
+                modifier = DogmaModifier(
+                    tgt_filter=ModTgtFilter.domain_skillrq,
+                    tgt_domain=ModDomain.ship,
+                    tgt_filter_extra_arg=EosTypeId.current_self,
+                    tgt_attr_id=MODULE_ATTR_IDS[seq % len(MODULE_ATTR_IDS)],
+                    operator=ModOperator.post_percent,
+                    src_attr_id=SKILL_BONUS_ATTR_ID)
+            modifiers.append(modifier)
+        effect = EffectFactory.make(
+            effect_id=EFFECT_ID_START + skill_idx,
+            category_id=EffectCategoryId.passive,
+            modifiers=tuple(modifiers))
+        effects.append(effect)
+        types.append(TypeFactory.make(
+            type_id=skill_type_id,
+            group_id=SKILL_GROUP_ID,
+            category_id=TypeCategoryId.skill,
+            attrs={SKILL_BONUS_ATTR_ID: 5},
+            effects=(effect,)))
+    types.append(TypeFactory.make(
+        type_id=TypeId.character_static,
+        group_id=TypeGroupId.character,
+        attrs={attr_id: 100 for attr_id in CHAR_ATTR_IDS}))
+    types.append(TypeFactory.make(
+        type_id=SHIP_TYPE_ID,
+        group_id=SHIP_GROUP_ID,
+        category_id=TypeCategoryId.ship,
+        attrs={
+            **{attr_id: 100 for attr_id in SHIP_ATTR_IDS},
+            **SHIP_STAT_ATTRS}))
+    module_attrs = {attr_id: 100 for attr_id in MODULE_ATTR_IDS}
+    if skill_type_ids:
+        module_attrs[AttrId.required_skill_1] = skill_type_ids[0]
+        module_attrs[AttrId.required_skill_1_level] = 1
+    # Module effects do not modify anything, but let module be fit into low
+    # slot and be put online
+    module_effects = (
+        EffectFactory.make(
+            effect_id=EffectId.lo_power,
+            category_id=EffectCategoryId.passive),
+        EffectFactory.make(
+            effect_id=EffectId.online,
+            category_id=EffectCategoryId.online))
+    effects.extend(module_effects)
+    types.append(TypeFactory.make(
+        type_id=MODULE_TYPE_ID,
+        group_id=MODULE_GROUP_ID,
+        category_id=TypeCategoryId.module,
+        attrs=module_attrs,
+        effects=module_effects))
+    return types, attrs, effects
+
+
+def add_source(alias, make_default=True, **kwargs):
+    """Add synthetic source to source manager.
+
+    Args:
+        alias: Alias of source.
+        make_default (optional): Make source default or not. True by default.
+        **kwargs: Arguments which are passed to eve object generator.
+
+    Returns:
+        Tuple with IDs of skill types in the source.
+    """
+    types, attrs, effects = make_eve_objects(**kwargs)
+    cache_handler = SyntheticCacheHandler()
+    # Fingerprint should match data version to avoid running builder
+    cache_handler.update_cache(
+        (types, attrs, effects), '{}_{}'.format(DATA_VERSION, eos_version))
+    SourceManager.add(
+        alias, SyntheticDataHandler(), cache_handler,
+        make_default=make_default)
+    return tuple(
+        t.id for t in types if t.category_id == TypeCategoryId.skill)
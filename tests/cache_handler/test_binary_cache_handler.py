@@ -0,0 +1,139 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import os
+from tempfile import TemporaryDirectory
+
+from eos.cache_handler import BinaryCacheHandler
+from eos.cache_handler import AttrFetchError
+from eos.cache_handler import EffectFetchError
+from eos.cache_handler import TypeFetchError
+from eos.const.eos import ModTgtFilter
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eve import EffectCategoryId
+from eos.eve_obj.attribute import Attribute
+from eos.eve_obj.effect import Effect
+from eos.eve_obj.modifier import DogmaModifier
+from eos.eve_obj.type import AbilityData
+from eos.eve_obj.type import Type
+from tests.testcase import EosTestCase
+
+
+class TestBinaryCacheHandler(EosTestCase):
+
+    def setUp(self):
+        EosTestCase.setUp(self)
+        self.tmp_dir = TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp_dir.name, 'sub', 'cache.bin')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        EosTestCase.tearDown(self)
+
+    def make_eve_objects(self):
+        attr1 = Attribute(
+            attr_id=1, max_attr_id=None, default_value=None,
+            high_is_good=True, stackable=False)
+        attr2 = Attribute(
+            attr_id=2, max_attr_id=1, default_value=5.5,
+            high_is_good=False, stackable=True)
+        modifier = DogmaModifier(
+            tgt_filter=ModTgtFilter.domain_group,
+            tgt_domain=ModDomain.ship,
+            tgt_filter_extra_arg=35,
+            tgt_attr_id=2,
+            operator=ModOperator.post_mul,
+            src_attr_id=1)
+        effect1 = Effect(
+            effect_id=11, category_id=EffectCategoryId.passive,
+            is_offensive=False, is_assistance=True, duration_attr_id=1,
+            build_status=2, modifiers=(modifier,))
+        effect2 = Effect(effect_id=12, category_id=None, is_offensive=True)
+        item_type = Type(
+            type_id=21, group_id=31, category_id=None,
+            attrs={1: 10.0, 2: -3.25}, effects=(effect1, effect2),
+            default_effect=effect2,
+            abilities_data={
+                5: AbilityData(cooldown_time=30, charge_quantity=3)})
+        return (item_type,), (attr1, attr2), (effect1, effect2)
+
+    def test_roundtrip(self):
+        cache_handler = BinaryCacheHandler(self.cache_path)
+        self.assertIsNone(cache_handler.get_fingerprint())
+        cache_handler.update_cache(self.make_eve_objects(), 'fp1')
+        # Verification - check data from fresh handler, which only maps file
+        cache_handler = BinaryCacheHandler(self.cache_path)
+        self.assertEqual(cache_handler.get_fingerprint(), 'fp1')
+        attr1 = cache_handler.get_attr(1)
+        self.assertIsNone(attr1.max_attr_id)
+        self.assertIsNone(attr1.default_value)
+        self.assertIs(attr1.high_is_good, True)
+        self.assertIs(attr1.stackable, False)
+        attr2 = cache_handler.get_attr(2)
+        self.assertEqual(attr2.max_attr_id, 1)
+        self.assertAlmostEqual(attr2.default_value, 5.5)
+        item_type = cache_handler.get_type(21)
+        self.assertEqual(item_type.group_id, 31)
+        self.assertIsNone(item_type.category_id)
+        self.assertEqual(item_type.attrs, {1: 10.0, 2: -3.25})
+        self.assertEqual(set(item_type.effects), {11, 12})
+        self.assertIs(item_type.default_effect, item_type.effects[12])
+        self.assertEqual(item_type.abilities_data[5].cooldown_time, 30)
+        self.assertEqual(item_type.abilities_data[5].charge_quantity, 3)
+        effect = cache_handler.get_effect(11)
+        self.assertIs(effect, item_type.effects[11])
+        self.assertEqual(effect.category_id, EffectCategoryId.passive)
+        self.assertIs(effect.is_assistance, True)
+        self.assertEqual(effect.duration_attr_id, 1)
+        self.assertIsNone(effect.range_attr_id)
+        self.assertEqual(effect.build_status, 2)
+        self.assertEqual(len(effect.modifiers), 1)
+        modifier = effect.modifiers[0]
+        self.assertEqual(
+            modifier.tgt_filter, ModTgtFilter.domain_group)
+        self.assertEqual(modifier.tgt_domain, ModDomain.ship)
+        self.assertEqual(modifier.tgt_filter_extra_arg, 35)
+        self.assertEqual(modifier.tgt_attr_id, 2)
+        self.assertEqual(modifier.operator, ModOperator.post_mul)
+        self.assertEqual(modifier.src_attr_id, 1)
+        self.assert_log_entries(0)
+
+    def test_missing(self):
+        cache_handler = BinaryCacheHandler(self.cache_path)
+        cache_handler.update_cache(self.make_eve_objects(), 'fp1')
+        with self.assertRaises(TypeFetchError):
+            cache_handler.get_type(22)
+        with self.assertRaises(AttrFetchError):
+            cache_handler.get_attr(3)
+        with self.assertRaises(EffectFetchError):
+            cache_handler.get_effect(None)
+        self.assert_log_entries(0)
+
+    def test_malformed(self):
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, 'wb') as file:
+            file.write(b'garbage')
+        cache_handler = BinaryCacheHandler(self.cache_path)
+        self.assertIsNone(cache_handler.get_fingerprint())
+        with self.assertRaises(TypeFetchError):
+            cache_handler.get_type(21)
+        self.assert_log_entries(1)
@@ -0,0 +1,103 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import os
+from tempfile import TemporaryDirectory
+
+from eos.cache_handler import JsonCacheHandler
+from eos.cache_handler import TypeFetchError
+from eos.eve_obj.attribute import Attribute
+from eos.eve_obj.effect import Effect
+from eos.eve_obj.type import Type
+from tests.testcase import EosTestCase
+
+
+class TestJsonCacheHandler(EosTestCase):
+
+    def setUp(self):
+        EosTestCase.setUp(self)
+        self.tmp_dir = TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp_dir.name, 'cache.json.bz2')
+        effect = Effect(effect_id=11)
+        types = tuple(
+            Type(type_id=i, attrs={1: i}, effects=(effect,),
+                 default_effect=effect)
+            for i in range(1, 6))
+        attrs = (Attribute(attr_id=1),)
+        JsonCacheHandler(self.cache_path).update_cache(
+            (types, attrs, (effect,)), 'fp')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        EosTestCase.tearDown(self)
+
+    def test_eager(self):
+        cache_handler = JsonCacheHandler(self.cache_path)
+        self.assertEqual(cache_handler.get_stats()['types'].materializations, 5)
+        item_type = cache_handler.get_type(3)
+        self.assertEqual(item_type.attrs, {1: 3})
+        self.assertIs(cache_handler.get_type(3), item_type)
+        stats = cache_handler.get_stats()['types']
+        self.assertEqual(stats.hits, 2)
+        self.assertEqual(stats.misses, 0)
+        self.assertEqual(stats.materializations, 5)
+        self.assertEqual(stats.size, 5)
+        self.assert_log_entries(0)
+
+    def test_lazy(self):
+        cache_handler = JsonCacheHandler(self.cache_path, lazy=True)
+        self.assertEqual(cache_handler.get_stats()['types'].size, 0)
+        self.assertEqual(cache_handler.get_stats()['effects'].size, 0)
+        item_type = cache_handler.get_type(3)
+        self.assertEqual(item_type.attrs, {1: 3})
+        self.assertIs(item_type.default_effect, item_type.effects[11])
+        self.assertIs(cache_handler.get_type(3), item_type)
+        self.assertIs(cache_handler.get_effect(11), item_type.effects[11])
+        with self.assertRaises(TypeFetchError):
+            cache_handler.get_type(6)
+        stats = cache_handler.get_stats()['types']
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.misses, 2)
+        self.assertEqual(stats.materializations, 1)
+        self.assertEqual(stats.size, 1)
+        self.assertEqual(cache_handler.get_stats()['effects'].size, 1)
+        self.assertEqual(cache_handler.get_stats()['attrs'].size, 0)
+        self.assert_log_entries(0)
+
+    def test_lazy_limited(self):
+        cache_handler = JsonCacheHandler(
+            self.cache_path, lazy=True, max_types=2)
+        type1 = cache_handler.get_type(1)
+        cache_handler.get_type(2)
+        # Make type 2 least recently used one
+        cache_handler.get_type(1)
+        cache_handler.get_type(3)
+        stats = cache_handler.get_stats()['types']
+        self.assertEqual(stats.size, 2)
+        self.assertEqual(stats.materializations, 3)
+        self.assertIs(cache_handler.get_type(1), type1)
+        cache_handler.get_type(2)
+        stats = cache_handler.get_stats()['types']
+        self.assertEqual(stats.hits, 2)
+        self.assertEqual(stats.misses, 4)
+        self.assertEqual(stats.materializations, 4)
+        self.assertEqual(stats.size, 2)
+        self.assert_log_entries(0)
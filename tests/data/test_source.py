@@ -25,6 +25,7 @@ from unittest.mock import Mock
 import pytest
 
 from eos import SourceManager
+from eos.eve_obj_builder import BuildState
 from eos.source import Source
 from eos.source.exception import ExistingSourceError
 from eos.source.exception import UnknownSourceError
@@ -97,6 +98,19 @@ def test_add_fingerprint_mismatch(
     assert log_msg in caplog.text
 
 
+def test_add_saves_build_state(
+        mock_data_handler, mock_cache_handler, tmp_path):
+    mock_cache_handler.get_fingerprint = Mock(return_value='cache_fingerprint')
+    mock_data_handler.get_version = Mock(return_value='dh_version')
+    state_path = str(tmp_path / 'state.bz2')
+    SourceManager.add(
+        'test', mock_data_handler, mock_cache_handler,
+        build_state_path=state_path)
+
+    assert mock_cache_handler.update_cache.call_count == 1
+    assert BuildState.load(state_path) is not None
+
+
 def test_removing_known_source(mock_data_handler, mock_cache_handler):
     SourceManager.add('test', mock_data_handler, mock_cache_handler)
     SourceManager.remove('test')
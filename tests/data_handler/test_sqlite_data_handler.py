@@ -0,0 +1,124 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import os
+import sqlite3
+from tempfile import TemporaryDirectory
+
+from eos import SQLiteDataHandler
+from eos.const.eve import AttrId
+from eos.const.eve import TypeCategoryId
+from eos.eve_obj_builder import EveObjBuilder
+from tests.testcase import EosTestCase
+
+
+class TestSQLiteDataHandler(EosTestCase):
+
+    def setUp(self):
+        EosTestCase.setUp(self)
+        self.tmp_dir = TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, 'data.db')
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(
+            'CREATE TABLE evegroups (groupID INTEGER, categoryID INTEGER);'
+            'CREATE TABLE evetypes ('
+            'typeID INTEGER, groupID INTEGER, typeName TEXT, mass REAL);'
+            'CREATE TABLE dgmattribs ('
+            'attributeID INTEGER, highIsGood BOOLEAN, attributeName TEXT);'
+            'CREATE TABLE dgmtypeattribs ('
+            'typeID INTEGER, attributeID INTEGER, value REAL);'
+            'CREATE TABLE dgmeffects ('
+            'effectID INTEGER, preExpression INTEGER, '
+            'postExpression INTEGER, description TEXT);'
+            'CREATE TABLE dgmtypeeffects ('
+            'typeID INTEGER, effectID INTEGER, isDefault BOOLEAN);'
+            'CREATE TABLE dgmexpressions ('
+            'expressionID INTEGER, operandID INTEGER, arg1 INTEGER, '
+            'arg2 INTEGER, expressionValue TEXT, expressionTypeID INTEGER, '
+            'expressionGroupID INTEGER, expressionAttributeID INTEGER);'
+            'CREATE TABLE phbmetadata (field_name TEXT, field_value TEXT);')
+        conn.executemany('INSERT INTO evegroups VALUES (?, ?)', (
+            (1, TypeCategoryId.ship), (2, 4)))
+        # Ship is kept by cleanup, item type 20 is referenced from
+        # expression, item type 22 is loaded into ship, item type 21 is
+        # removed
+        conn.executemany('INSERT INTO evetypes VALUES (?, ?, ?, ?)', (
+            (10, 1, 'Ship', 1000.0), (20, 2, 'Ref', None),
+            (21, 2, 'Junk', None), (22, 2, 'Ammo', None)))
+        conn.executemany('INSERT INTO dgmattribs VALUES (?, ?, ?)', (
+            (5, 1, 'five'), (AttrId.ammo_loaded, 0, 'ammo')))
+        conn.executemany('INSERT INTO dgmtypeattribs VALUES (?, ?, ?)', (
+            (10, 5, 1.0), (10, AttrId.ammo_loaded, 22.0), (20, 5, 3.0),
+            (21, 5, 2.0)))
+        conn.executemany('INSERT INTO dgmeffects VALUES (?, ?, ?, ?)', (
+            (100, 1000, 1000, 'used'), (101, None, None, 'junk')))
+        conn.executemany('INSERT INTO dgmtypeeffects VALUES (?, ?, ?)', (
+            (10, 100, 1), (21, 101, 0)))
+        conn.execute(
+            'INSERT INTO dgmexpressions VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (1000, 36, None, None, None, 20, None, None))
+        conn.execute(
+            'INSERT INTO phbmetadata VALUES (?, ?)',
+            ('client_build', '1234'))
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        EosTestCase.tearDown(self)
+
+    def test_projection(self):
+        data_handler = SQLiteDataHandler(self.db_path)
+        self.assertEqual(
+            sorted(
+                data_handler.get_dgmattribs(),
+                key=lambda r: r['attributeID']), [
+                {'attributeID': 5, 'highIsGood': True},
+                {'attributeID': AttrId.ammo_loaded, 'highIsGood': False}])
+        self.assertEqual(list(data_handler.get_typefighterabils()), [])
+        self.assertEqual(data_handler.get_version(), '1234')
+        self.assert_log_entries(0)
+
+    def test_prefilter(self):
+        data_handler = SQLiteDataHandler(self.db_path, prefilter=True)
+        self.assertEqual(
+            {r['typeID'] for r in data_handler.get_evetypes()}, {10, 20, 22})
+        self.assertEqual(
+            {r['typeID'] for r in data_handler.get_dgmtypeattribs()},
+            {10, 20})
+        self.assertEqual(
+            [r['effectID'] for r in data_handler.get_dgmeffects()], [100])
+        self.assertEqual(
+            [r['typeID'] for r in data_handler.get_dgmtypeeffects()], [10])
+        self.assert_log_entries(0)
+
+    def test_prefilter_builder_results(self):
+        results = []
+        for prefilter in (False, True):
+            types, attrs, effects = EveObjBuilder.run(
+                SQLiteDataHandler(self.db_path, prefilter=prefilter))
+            results.append((
+                {t.id: (t.group_id, t.attrs, set(t.effects)) for t in types},
+                {a.id for a in attrs},
+                {e.id for e in effects}))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(set(results[0][0]), {10, 20, 22})
+        self.assertEqual(results[0][2], {100})
@@ -0,0 +1,98 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import io
+import json
+import os
+from tempfile import TemporaryDirectory
+
+from eos import JsonDataHandler
+from eos import StreamingJsonDataHandler
+from eos.util.json_stream import iter_json_items
+from tests.testcase import EosTestCase
+
+
+class TestStreamingJsonDataHandler(EosTestCase):
+
+    def setUp(self):
+        EosTestCase.setUp(self)
+        self.tmp_dir = TemporaryDirectory()
+        files = {
+            'evetypes': {
+                '1': {'typeID': 1, 'groupID': 5, 'typeName': 'Abç "d"'},
+                '2': {'typeID': 2, 'groupID': 6, 'mass': 1.5e+20}},
+            'evegroups': {'5': {'groupID': 5, 'categoryID': 6}},
+            'dgmattribs': [{'attributeID': 12345, 'highIsGood': True}],
+            'dgmtypeattribs': [
+                {'typeID': 1, 'attributeID': 12345, 'value': -0.25},
+                {'typeID': 2, 'attributeID': 12345, 'value': 1000000}],
+            'dgmeffects': [
+                {'effectID': 3, 'modifierInfo': '- domain: shipID\n'}],
+            'dgmtypeeffects': [],
+            'dgmexpressions': [{
+                'expressionID': 7, 'arg1': None, 'expressionValue': '[{,}]'}],
+            'fighterabilitiesbytype': {
+                '2': {'1': {'abilityID': 5, 'cooldownSeconds': 30}}},
+            'phbmetadata': [
+                {'field_name': 'dump_time', 'field_value': 1},
+                {'field_name': 'client_build', 'field_value': 1234}]}
+        for file_name, content in files.items():
+            file_path = os.path.join(
+                self.tmp_dir.name, '{}.json'.format(file_name))
+            with open(file_path, 'w', encoding='utf8') as file:
+                json.dump(content, file, indent=2)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        EosTestCase.tearDown(self)
+
+    def test_matches_regular_handler(self):
+        regular_dh = JsonDataHandler(self.tmp_dir.name)
+        # Small chunk size to make sure values are split across chunks
+        streaming_dh = StreamingJsonDataHandler(self.tmp_dir.name, chunk_size=3)
+        for getter_name in (
+            'get_evetypes', 'get_evegroups', 'get_dgmattribs',
+            'get_dgmtypeattribs', 'get_dgmeffects', 'get_dgmtypeeffects',
+            'get_dgmexpressions', 'get_typefighterabils', 'get_version'
+        ):
+            regular_data = getattr(regular_dh, getter_name)()
+            streaming_data = getattr(streaming_dh, getter_name)()
+            if getter_name != 'get_version':
+                streaming_data = list(streaming_data)
+            self.assertEqual(streaming_data, regular_data, msg=getter_name)
+        self.assert_log_entries(0)
+
+    def test_items_numbers_at_chunk_border(self):
+        file = io.StringIO('[1, 22, 333,4444]')
+        items = list(iter_json_items(file, chunk_size=2))
+        self.assertEqual(items, [(0, 1), (1, 22), (2, 333), (3, 4444)])
+        self.assert_log_entries(0)
+
+    def test_items_empty(self):
+        self.assertEqual(list(iter_json_items(io.StringIO(' { } '))), [])
+        self.assertEqual(list(iter_json_items(io.StringIO('[]'))), [])
+        self.assert_log_entries(0)
+
+    def test_items_malformed(self):
+        for document in ('[1, 2', '[1 2]', '{"a" 1}', '{1: 2}', '5', ''):
+            with self.assertRaises(ValueError, msg=document):
+                list(iter_json_items(io.StringIO(document), chunk_size=1))
+        self.assert_log_entries(0)
@@ -0,0 +1,73 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from unittest.mock import patch
+
+from tests.eve_obj_builder.testcase import EveObjBuilderTestCase
+
+
+class TestConversionParallel(EveObjBuilderTestCase):
+    """Modifiers built in process pool should match serially built ones."""
+
+    def get_log(self, name='eos.eve_obj_builder.converter'):
+        return EveObjBuilderTestCase.get_log(self, name=name)
+
+    def setUp(self):
+        EveObjBuilderTestCase.setUp(self)
+        self.dh.data['evetypes'].append({'typeID': 1, 'groupID': 1})
+        for effect_id in range(100, 107):
+            self.dh.data['dgmtypeeffects'].append(
+                {'typeID': 1, 'effectID': effect_id})
+            self.dh.data['dgmeffects'].append({
+                'effectID': effect_id, 'effectCategory': 0,
+                'modifierInfo':
+                    '- domain: shipID\n  func: ItemModifier\n'
+                    '  modifiedAttributeID: {}\n'
+                    '  modifyingAttributeID: 11\n'
+                    '  operator: 6\n'.format(effect_id)})
+        # Effect whose modifiers cannot be built
+        self.dh.data['dgmtypeeffects'].append({'typeID': 1, 'effectID': 107})
+        self.dh.data['dgmeffects'].append({
+            'effectID': 107, 'effectCategory': 0,
+            'modifierInfo': '- domain: shipID\n  func: ItemModifier\n'})
+
+    def get_mod_data(self):
+        mod_data = {}
+        for effect_id, effect in self.effects.items():
+            mod_data[effect_id] = (effect.build_status, tuple(
+                (m.tgt_filter, m.tgt_domain, m.tgt_filter_extra_arg,
+                 m.tgt_attr_id, m.operator, m.src_attr_id)
+                for m in effect.modifiers))
+        return mod_data
+
+    @patch('eos.eve_obj_builder.converter.WORKER_CHUNK_SIZE', 3)
+    def test_matches_serial(self):
+        self.run_builder()
+        serial_effect_ids = list(self.effects)
+        serial_mod_data = self.get_mod_data()
+        self.run_builder(workers=2)
+        # Verification
+        self.assertEqual(list(self.effects), serial_effect_ids)
+        self.assertEqual(self.get_mod_data(), serial_mod_data)
+        self.assertEqual(len(self.effects[103].modifiers), 1)
+        self.assertEqual(self.effects[103].modifiers[0].tgt_attr_id, 103)
+        self.assertEqual(len(self.effects[107].modifiers), 0)
+        self.assert_log_entries(0)
@@ -0,0 +1,185 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import os
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from eos.eve_obj_builder import BuildState
+from eos.eve_obj_builder import EveObjBuilder
+from tests.eve_obj_builder.testcase import EveObjBuilderTestCase
+
+
+@patch('eos.eve_obj_builder.converter.ModBuilder')
+class TestIncremental(EveObjBuilderTestCase):
+    """Only objects affected by data changes should be converted again."""
+
+    def get_log(self, name='eos.eve_obj_builder.converter'):
+        return EveObjBuilderTestCase.get_log(self, name=name)
+
+    def setUp(self):
+        EveObjBuilderTestCase.setUp(self)
+        self.dh.data['evetypes'].append({'typeID': 1, 'groupID': 6})
+        self.dh.data['evetypes'].append({'typeID': 2, 'groupID': 7})
+        self.dh.data['evegroups'].append({'groupID': 6, 'categoryID': 16})
+        self.dh.data['evegroups'].append({'groupID': 7, 'categoryID': 16})
+        self.dh.data['dgmattribs'].append({'attributeID': 5})
+        self.dh.data['dgmattribs'].append({'attributeID': 6})
+        self.dh.data['dgmtypeattribs'].append(
+            {'typeID': 1, 'attributeID': 5, 'value': 1.0})
+        self.dh.data['dgmtypeattribs'].append(
+            {'typeID': 2, 'attributeID': 6, 'value': 2.0})
+        self.dh.data['dgmtypeeffects'].append({'typeID': 1, 'effectID': 11})
+        self.dh.data['dgmtypeeffects'].append({'typeID': 2, 'effectID': 12})
+        self.dh.data['dgmeffects'].append(
+            {'effectID': 11, 'preExpression': 21, 'postExpression': 21})
+        self.dh.data['dgmeffects'].append(
+            {'effectID': 12, 'preExpression': 22, 'postExpression': 22})
+        self.add_exp(21, operandID=6, arg1=23)
+        self.add_exp(22, operandID=6)
+        self.add_exp(23, operandID=22, expressionValue='a')
+
+    def add_exp(self, exp_id, **kwargs):
+        row = {
+            'expressionID': exp_id, 'operandID': None, 'arg1': None,
+            'arg2': None, 'expressionValue': None, 'expressionTypeID': None,
+            'expressionGroupID': None, 'expressionAttributeID': None}
+        row.update(kwargs)
+        self.dh.data['dgmexpressions'].append(row)
+
+    def run_incremental(self, prev_state=None):
+        (types, attrs, effects), state = EveObjBuilder.run_incremental(
+            self.dh, prev_state=prev_state)
+        self.types = {t.id: t for t in types}
+        self.attrs = {a.id: a for a in attrs}
+        self.effects = {e.id: e for e in effects}
+        return state
+
+    def test_no_changes(self, mod_builder):
+        mod_builder.return_value.build.return_value = ([], 0)
+        state = self.run_incremental()
+        old_types = self.types
+        old_attrs = self.attrs
+        old_effects = self.effects
+        self.assertEqual(mod_builder.return_value.build.call_count, 2)
+        mod_builder.return_value.build.reset_mock()
+        self.run_incremental(prev_state=state)
+        # Verification
+        self.assertEqual(mod_builder.return_value.build.call_count, 0)
+        self.assertEqual(len(self.types), 2)
+        self.assertIs(self.types[1], old_types[1])
+        self.assertIs(self.types[2], old_types[2])
+        self.assertEqual(len(self.attrs), 2)
+        self.assertIs(self.attrs[5], old_attrs[5])
+        self.assertIs(self.attrs[6], old_attrs[6])
+        self.assertEqual(len(self.effects), 2)
+        self.assertIs(self.effects[11], old_effects[11])
+        self.assertIs(self.effects[12], old_effects[12])
+        self.assert_log_entries(0)
+
+    def test_attr_changed(self, mod_builder):
+        mod_builder.return_value.build.return_value = ([], 0)
+        state = self.run_incremental()
+        old_types = self.types
+        old_attrs = self.attrs
+        self.dh.data['dgmattribs'][1]['highIsGood'] = False
+        self.run_incremental(prev_state=state)
+        # Verification
+        self.assertIs(self.attrs[5], old_attrs[5])
+        self.assertIsNot(self.attrs[6], old_attrs[6])
+        self.assertIs(self.attrs[6].high_is_good, False)
+        self.assertIs(self.types[1], old_types[1])
+        self.assertIs(self.types[2], old_types[2])
+        self.assert_log_entries(0)
+
+    def test_type_attr_value_changed(self, mod_builder):
+        mod_builder.return_value.build.return_value = ([], 0)
+        state = self.run_incremental()
+        old_types = self.types
+        self.dh.data['dgmtypeattribs'][0]['value'] = 3.0
+        self.run_incremental(prev_state=state)
+        # Verification
+        self.assertIsNot(self.types[1], old_types[1])
+        self.assertEqual(self.types[1].attrs, {5: 3.0})
+        self.assertIs(self.types[2], old_types[2])
+        self.assert_log_entries(0)
+
+    def test_group_changed(self, mod_builder):
+        mod_builder.return_value.build.return_value = ([], 0)
+        state = self.run_incremental()
+        old_types = self.types
+        self.dh.data['evegroups'][1]['categoryID'] = 7
+        self.run_incremental(prev_state=state)
+        # Verification
+        self.assertIs(self.types[1], old_types[1])
+        self.assertIsNot(self.types[2], old_types[2])
+        self.assertEqual(self.types[2].category_id, 7)
+        self.assert_log_entries(0)
+
+    def test_nested_expression_changed(self, mod_builder):
+        mod_builder.return_value.build.return_value = ([], 0)
+        state = self.run_incremental()
+        old_types = self.types
+        old_effects = self.effects
+        mod_builder.return_value.build.reset_mock()
+        self.dh.data['dgmexpressions'][2]['expressionValue'] = 'b'
+        self.run_incremental(prev_state=state)
+        # Verification
+        self.assertEqual(mod_builder.return_value.build.call_count, 1)
+        self.assertEqual(
+            mod_builder.return_value.build.call_args[0][0]['effectID'], 11)
+        self.assertIsNot(self.effects[11], old_effects[11])
+        self.assertIs(self.effects[12], old_effects[12])
+        # Type which has rebuilt effect should refer new effect object
+        self.assertIsNot(self.types[1], old_types[1])
+        self.assertIs(self.types[1].effects[11], self.effects[11])
+        self.assertIs(self.types[2], old_types[2])
+        self.assert_log_entries(0)
+
+    def test_effect_removed(self, mod_builder):
+        mod_builder.return_value.build.return_value = ([], 0)
+        state = self.run_incremental()
+        old_types = self.types
+        del self.dh.data['dgmeffects'][0]
+        self.run_incremental(prev_state=state)
+        # Verification
+        self.assertEqual(len(self.effects), 1)
+        self.assertIn(12, self.effects)
+        self.assertIsNot(self.types[1], old_types[1])
+        self.assertEqual(len(self.types[1].effects), 0)
+        self.assertIs(self.types[2], old_types[2])
+        self.assert_log_entries(0)
+
+    def test_state_persistence(self, mod_builder):
+        mod_builder.return_value.build.return_value = ([], 0)
+        state = self.run_incremental()
+        with TemporaryDirectory() as tmp_dir:
+            state_path = os.path.join(tmp_dir, 'sub', 'state.bz2')
+            self.assertIsNone(BuildState.load(state_path))
+            state.save(state_path)
+            loaded_state = BuildState.load(state_path)
+        mod_builder.return_value.build.reset_mock()
+        self.run_incremental(prev_state=loaded_state)
+        # Verification
+        self.assertEqual(mod_builder.return_value.build.call_count, 0)
+        self.assertEqual(len(self.types), 2)
+        self.assertIs(self.types[1].effects[11], self.effects[11])
+        self.assert_log_entries(0)
@@ -0,0 +1,131 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Fit
+from eos import ModuleHigh
+from eos import Ship
+from eos import State
+from eos.batch import BatchEvaluator
+from eos.batch import STAT_GETTERS
+from eos.batch import UnknownStatError
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.stats_container import ResourceStats
+from tests.integration.testcase import IntegrationTestCase
+
+
+class TestBatchEvaluator(IntegrationTestCase):
+
+    def get_log(self, name='eos.batch*'):
+        return IntegrationTestCase.get_log(self, name=name)
+
+    def setUp(self):
+        IntegrationTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.cpu_output)
+        self.mkattr(attr_id=AttrId.cpu)
+        self.mkattr(attr_id=AttrId.hi_slots)
+        online_effect = self.mkeffect(
+            effect_id=EffectId.online,
+            category_id=EffectCategoryId.online)
+        self.ship_type = self.mktype(
+            attrs={AttrId.cpu_output: 100, AttrId.hi_slots: 3})
+        self.module_type = self.mktype(
+            attrs={AttrId.cpu: 30}, effects=[online_effect])
+
+    def make_spec(self, module_quantity):
+        fit = Fit()
+        fit.ship = Ship(self.ship_type.id)
+        for _ in range(module_quantity):
+            fit.modules.high.append(
+                ModuleHigh(self.module_type.id, state=State.online))
+        return fit.to_spec()
+
+    def test_serial(self):
+        evaluator = BatchEvaluator(('cpu', 'high_slots'))
+        # Action
+        results = list(evaluator.evaluate(
+            self.make_spec(i) for i in range(5)))
+        # Verification
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results[0]['cpu'], ResourceStats(0, 100))
+        self.assertEqual(results[2]['cpu'], ResourceStats(60, 100))
+        self.assertEqual(results[4]['cpu'], ResourceStats(120, 100))
+        self.assertEqual(tuple(results[4]['high_slots']), (4, 3))
+        # Cleanup
+        self.assert_log_entries(0)
+
+    def test_parallel(self):
+        specs = [self.make_spec(i % 4) for i in range(9)]
+        serial_results = list(BatchEvaluator(('cpu',)).evaluate(specs))
+        # Action
+        with BatchEvaluator(('cpu',), workers=2, chunk_size=2) as evaluator:
+            results = list(evaluator.evaluate(iter(specs)))
+            # Verification - workers are reused between evaluations
+            self.assertEqual(results, serial_results)
+            self.assertEqual(list(evaluator.evaluate(specs)), serial_results)
+        # Cleanup
+        self.assert_log_entries(0)
+
+    def test_parallel_all_stats(self):
+        # Containers of all stats should survive transfer from workers
+        tank_attrs = {
+            AttrId.hp: 100,
+            AttrId.armor_hp: 200,
+            AttrId.shield_capacity: 300,
+            AttrId.em_dmg_resonance: 0.5,
+            AttrId.armor_therm_dmg_resonance: 0.4,
+            AttrId.shield_kin_dmg_resonance: 0.3}
+        for attr_id in tank_attrs:
+            self.mkattr(attr_id=attr_id)
+        self.ship_type = self.mktype(attrs={
+            AttrId.cpu_output: 100, AttrId.hi_slots: 3, **tank_attrs})
+        specs = [self.make_spec(i % 4) for i in range(5)]
+        serial_results = list(BatchEvaluator(STAT_GETTERS).evaluate(specs))
+        # Action
+        with BatchEvaluator(STAT_GETTERS, workers=2) as evaluator:
+            results = list(evaluator.evaluate(specs))
+        # Verification
+        self.assertEqual(len(results), 5)
+        self.assertAlmostEqual(results[0]['hp'].total, 600)
+        self.assertAlmostEqual(results[0]['ehp'].total, 713.216, places=3)
+        for result, serial_result in zip(results, serial_results):
+            self.assertEqual(set(result), set(STAT_GETTERS))
+            for stat_name in STAT_GETTERS:
+                self.assertIs(
+                    type(result[stat_name]), type(serial_result[stat_name]))
+                self.assertEqual(result[stat_name], serial_result[stat_name])
+        # Cleanup
+        self.assert_log_entries(0)
+
+    def test_empty(self):
+        with BatchEvaluator(('cpu',), workers=2) as evaluator:
+            # Verification
+            self.assertEqual(list(evaluator.evaluate([])), [])
+        # Cleanup
+        self.assert_log_entries(0)
+
+    def test_unknown_stat(self):
+        # Verification
+        with self.assertRaises(UnknownStatError):
+            BatchEvaluator(('cpu', 'nonexistent'))
+        # Cleanup
+        self.assert_log_entries(0)
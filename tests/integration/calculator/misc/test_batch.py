@@ -0,0 +1,104 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Implant
+from eos import Rig
+from eos import Ship
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModTgtFilter
+from eos.const.eve import EffectCategoryId
+from tests.integration.calculator.testcase import CalculatorTestCase
+
+
+class TestBatch(CalculatorTestCase):
+
+    def setUp(self):
+        CalculatorTestCase.setUp(self)
+        self.src_attr = self.mkattr()
+        self.tgt_attr = self.mkattr()
+        modifier = self.mkmod(
+            tgt_filter=ModTgtFilter.domain,
+            tgt_domain=ModDomain.ship,
+            tgt_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_percent,
+            src_attr_id=self.src_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=[modifier])
+        self.implant_type = self.mktype(
+            attrs={self.src_attr.id: 20}, effects=[effect])
+        self.rig_type = self.mktype(attrs={self.tgt_attr.id: 100})
+
+    def test_load_deferred(self):
+        rig = Rig(self.rig_type.id)
+        # Action
+        with self.fit.batch() as fit:
+            fit.ship = Ship(self.mktype().id)
+            fit.rigs.add(rig)
+            fit.implants.add(Implant(self.implant_type.id))
+            # Verification
+            self.assertIs(fit, self.fit)
+            self.assertIs(rig._is_loaded, False)
+        self.assertIs(rig._is_loaded, True)
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr.id], 120)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_invalidation_deferred(self):
+        self.fit.ship = Ship(self.mktype().id)
+        rig = Rig(self.rig_type.id)
+        self.fit.rigs.add(rig)
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr.id], 100)
+        implant1 = Implant(self.implant_type.id)
+        implant2 = Implant(self.implant_type.id)
+        self.fit.implants.add(implant1)
+        # Action
+        with self.fit.batch():
+            with self.fit.batch():
+                self.fit.implants.remove(implant1)
+                self.fit.implants.add(implant2)
+            # Verification
+            self.assertIs(implant2._is_loaded, False)
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr.id], 120)
+        # Action
+        with self.fit.batch():
+            self.fit.implants.remove(implant2)
+        # Verification
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_exception(self):
+        rig = Rig(self.rig_type.id)
+        # Action
+        with self.assertRaises(ZeroDivisionError):
+            with self.fit.batch():
+                self.fit.ship = Ship(self.mktype().id)
+                self.fit.rigs.add(rig)
+                self.fit.implants.add(Implant(self.implant_type.id))
+                1 / 0
+        # Verification
+        self.assertAlmostEqual(rig.attrs[self.tgt_attr.id], 120)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
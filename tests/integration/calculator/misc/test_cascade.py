@@ -0,0 +1,165 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Implant
+from eos import Rig
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModTgtFilter
+from eos.const.eve import EffectCategoryId
+from eos.pubsub.message import AttrValueChanged
+from eos.pubsub.subscriber import BaseSubscriber
+from tests.integration.calculator.testcase import CalculatorTestCase
+
+
+class MsgRecorder(BaseSubscriber):
+
+    def __init__(self):
+        self.msgs = []
+
+    def _handle_attr_value_changed(self, msg):
+        self.msgs.append((msg.item, msg.attr_id))
+
+    _handler_map = {AttrValueChanged: _handle_attr_value_changed}
+
+
+class ValueReader(BaseSubscriber):
+
+    def __init__(self, item, trigger_attr_id, read_attr_id):
+        self.item = item
+        self.trigger_attr_id = trigger_attr_id
+        self.read_attr_id = read_attr_id
+        self.values = []
+
+    def _handle_attr_value_changed(self, msg):
+        if msg.item is self.item and msg.attr_id == self.trigger_attr_id:
+            self.values.append(self.item.attrs[self.read_attr_id])
+
+    _handler_map = {AttrValueChanged: _handle_attr_value_changed}
+
+
+class TestInvalidationCascade(CalculatorTestCase):
+
+    def make_chain_effect(self, attrs):
+        modifiers = []
+        for src_attr, tgt_attr in zip(attrs, attrs[1:]):
+            modifiers.append(self.mkmod(
+                tgt_filter=ModTgtFilter.item,
+                tgt_domain=ModDomain.self,
+                tgt_attr_id=tgt_attr.id,
+                operator=ModOperator.mod_add,
+                src_attr_id=src_attr.id))
+        return self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=modifiers)
+
+    def make_implant(self, tgt_attr):
+        src_attr = self.mkattr()
+        modifier = self.mkmod(
+            tgt_filter=ModTgtFilter.domain,
+            tgt_domain=ModDomain.ship,
+            tgt_attr_id=tgt_attr.id,
+            operator=ModOperator.mod_add,
+            src_attr_id=src_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=[modifier])
+        return Implant(self.mktype(
+            attrs={src_attr.id: 1}, effects=[effect]).id)
+
+    def test_diamond(self):
+        # Every attribute which depends on changed attribute, directly or via
+        # several paths, should be reported once
+        attr1 = self.mkattr()
+        attr2 = self.mkattr()
+        attr3 = self.mkattr()
+        attr4 = self.mkattr()
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=(
+                *self.make_chain_effect((attr1, attr2, attr4)).modifiers,
+                *self.make_chain_effect((attr1, attr3, attr4)).modifiers))
+        item = Rig(self.mktype(
+            attrs={attr1.id: 1, attr2.id: 0, attr3.id: 0, attr4.id: 0},
+            effects=[effect]).id)
+        self.fit.rigs.add(item)
+        self.assertAlmostEqual(item.attrs[attr4.id], 2)
+        recorder = MsgRecorder()
+        self.fit._subscribe(recorder, recorder._handler_map.keys())
+        # Action
+        self.fit.implants.add(self.make_implant(attr1))
+        # Verification
+        self.assertCountEqual(recorder.msgs, (
+            (item, attr1.id), (item, attr2.id), (item, attr3.id),
+            (item, attr4.id)))
+        self.assertAlmostEqual(item.attrs[attr4.id], 4)
+        # Cleanup
+        self.fit._unsubscribe(recorder, recorder._handler_map.keys())
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_read_transitive_dependent(self):
+        # When subscriber receives message about attribute change, attributes
+        # which depend on it, directly or transitively, should already be
+        # invalidated
+        attr1 = self.mkattr()
+        attr2 = self.mkattr()
+        attr3 = self.mkattr()
+        item = Rig(self.mktype(
+            attrs={attr1.id: 1, attr2.id: 0, attr3.id: 0},
+            effects=[self.make_chain_effect((attr1, attr2, attr3))]).id)
+        self.fit.rigs.add(item)
+        self.assertAlmostEqual(item.attrs[attr3.id], 1)
+        reader = ValueReader(item, attr1.id, attr3.id)
+        recorder = MsgRecorder()
+        self.fit._subscribe(reader, reader._handler_map.keys())
+        self.fit._subscribe(recorder, recorder._handler_map.keys())
+        # Action
+        self.fit.implants.add(self.make_implant(attr1))
+        # Verification
+        self.assertEqual(len(reader.values), 1)
+        self.assertAlmostEqual(reader.values[0], 2)
+        self.assertCountEqual(recorder.msgs, (
+            (item, attr1.id), (item, attr2.id), (item, attr3.id)))
+        self.assertAlmostEqual(item.attrs[attr3.id], 2)
+        # Cleanup
+        self.fit._unsubscribe(reader, reader._handler_map.keys())
+        self.fit._unsubscribe(recorder, recorder._handler_map.keys())
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_long_chain(self):
+        # Invalidation of long dependency chain should not be limited by
+        # recursion depth
+        attrs = [self.mkattr() for _ in range(2000)]
+        item = Rig(self.mktype(
+            attrs={attr.id: 0 for attr in attrs},
+            effects=[self.make_chain_effect(attrs)]).id)
+        self.fit.rigs.add(item)
+        # Calculate values one by one, to keep calculation recursion shallow
+        for attr in attrs:
+            self.assertAlmostEqual(item.attrs[attr.id], 0)
+        # Action
+        self.fit.implants.add(self.make_implant(attrs[0]))
+        # Verification
+        for attr in attrs:
+            self.assertAlmostEqual(item.attrs[attr.id], 1)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
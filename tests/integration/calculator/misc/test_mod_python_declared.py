@@ -0,0 +1,171 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Charge
+from eos import EffectMode
+from eos import Implant
+from eos import ModuleHigh
+from eos import Ship
+from eos import State
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModTgtFilter
+from eos.const.eve import EffectCategoryId
+from eos.const.eve import EffectId
+from eos.eve_obj.modifier import BasePythonModifier
+from eos.eve_obj.modifier import ModificationCalculationError
+from tests.integration.calculator.testcase import CalculatorTestCase
+
+
+class TestModifierPythonDeclared(CalculatorTestCase):
+    """Check python modifiers which declare their dependencies."""
+
+    def setUp(self):
+        CalculatorTestCase.setUp(self)
+        self.attr1 = attr1 = self.mkattr()
+        self.attr2 = attr2 = self.mkattr()
+        self.attr3 = attr3 = self.mkattr()
+
+        class TestPythonModifier(BasePythonModifier):
+
+            def __init__(self):
+                BasePythonModifier.__init__(
+                    self,
+                    tgt_filter=ModTgtFilter.item,
+                    tgt_domain=ModDomain.self,
+                    tgt_filter_extra_arg=None,
+                    tgt_attr_id=attr1.id)
+
+            def get_modification(self, carrier_item):
+                ship = carrier_item._fit.ship
+                try:
+                    carrier_mul = carrier_item.attrs[attr2.id]
+                    ship_mul = ship.attrs[attr3.id]
+                except (AttributeError, KeyError) as e:
+                    raise ModificationCalculationError from e
+                charge_mul = 1 if carrier_item.charge is None else 2
+                return ModOperator.post_mul, carrier_mul * ship_mul * charge_mul
+
+            @property
+            def attr_dependencies(self):
+                return ((ModDomain.self, attr2.id), (ModDomain.ship, attr3.id))
+
+            @property
+            def charge_dependency(self):
+                return True
+
+        self.python_effect = self.mkeffect(
+            category_id=EffectCategoryId.online,
+            modifiers=(TestPythonModifier(),))
+        self.online_effect = self.mkeffect(
+            effect_id=EffectId.online,
+            category_id=EffectCategoryId.online)
+        self.fit.ship = Ship(self.mktype(attrs={attr3.id: 3}).id)
+        self.item = ModuleHigh(self.mktype(
+            attrs={self.attr1.id: 100, self.attr2.id: 2},
+            effects=(self.python_effect, self.online_effect)).id,
+            state=State.online)
+        self.fit.modules.high.append(self.item)
+
+    def make_dogma_effect(self, tgt_domain, tgt_attr_id):
+        src_attr = self.mkattr()
+        modifier = self.mkmod(
+            tgt_filter=ModTgtFilter.item,
+            tgt_domain=tgt_domain,
+            tgt_attr_id=tgt_attr_id,
+            operator=ModOperator.post_mul,
+            src_attr_id=src_attr.id)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=[modifier])
+        return src_attr, effect
+
+    def test_attr_self(self):
+        src_attr, effect = self.make_dogma_effect(
+            ModDomain.self, self.attr2.id)
+        item = ModuleHigh(self.mktype(
+            attrs={self.attr1.id: 100, self.attr2.id: 2, src_attr.id: 5},
+            effects=(self.python_effect, self.online_effect, effect)).id,
+            state=State.online)
+        item.set_effect_mode(effect.id, EffectMode.force_stop)
+        self.fit.modules.high.append(item)
+        self.assertAlmostEqual(item.attrs[self.attr1.id], 600)
+        # Action
+        item.set_effect_mode(effect.id, EffectMode.full_compliance)
+        # Verification
+        self.assertAlmostEqual(item.attrs[self.attr1.id], 3000)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_attr_ship(self):
+        self.assertAlmostEqual(self.item.attrs[self.attr1.id], 600)
+        src_attr, effect = self.make_dogma_effect(
+            ModDomain.ship, self.attr3.id)
+        implant = Implant(self.mktype(
+            attrs={src_attr.id: 5}, effects=[effect]).id)
+        # Action
+        self.fit.implants.add(implant)
+        # Verification
+        self.assertAlmostEqual(self.item.attrs[self.attr1.id], 3000)
+        # Action
+        self.fit.implants.remove(implant)
+        # Verification
+        self.assertAlmostEqual(self.item.attrs[self.attr1.id], 600)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_attr_ship_replaced(self):
+        self.assertAlmostEqual(self.item.attrs[self.attr1.id], 600)
+        # Action
+        self.fit.ship = Ship(self.mktype(attrs={self.attr3.id: 4}).id)
+        # Verification
+        self.assertAlmostEqual(self.item.attrs[self.attr1.id], 800)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_charge(self):
+        self.assertAlmostEqual(self.item.attrs[self.attr1.id], 600)
+        charge = Charge(self.mktype().id)
+        # Action
+        self.item.charge = charge
+        # Verification
+        self.assertAlmostEqual(self.item.attrs[self.attr1.id], 1200)
+        # Action
+        self.item.charge = None
+        # Verification
+        self.assertAlmostEqual(self.item.attrs[self.attr1.id], 600)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_stopped(self):
+        self.assertAlmostEqual(self.item.attrs[self.attr1.id], 600)
+        # Action
+        self.item.state = State.offline
+        # Verification
+        self.assertAlmostEqual(self.item.attrs[self.attr1.id], 100)
+        self.item.charge = Charge(self.mktype().id)
+        self.assertAlmostEqual(self.item.attrs[self.attr1.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
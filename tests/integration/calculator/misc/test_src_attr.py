@@ -21,7 +21,10 @@
 
 import logging
 
+from eos import EffectMode
+from eos import Implant
 from eos import Rig
+from eos import Ship
 from eos.const.eos import ModDomain
 from eos.const.eos import ModOperator
 from eos.const.eos import ModTgtFilter
@@ -69,3 +72,64 @@ class TestSrcAttr(CalculatorTestCase):
             'on item type {}'.format(abs_attr.id, item_type.id))
         # Cleanup
         self.assert_solsys_buffers_empty(self.fit.solar_system)
+
+    def make_src_attr_chain(self):
+        """Make ship which modifies itself, and implant changing source."""
+        self.src_attr = self.mkattr()
+        self.tgt_attr = self.mkattr()
+        ship_modifier = self.mkmod(
+            tgt_filter=ModTgtFilter.item,
+            tgt_domain=ModDomain.self,
+            tgt_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_percent,
+            src_attr_id=self.src_attr.id)
+        self.ship_effect = self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=[ship_modifier])
+        implant_attr = self.mkattr()
+        implant_modifier = self.mkmod(
+            tgt_filter=ModTgtFilter.item,
+            tgt_domain=ModDomain.ship,
+            tgt_attr_id=self.src_attr.id,
+            operator=ModOperator.post_mul,
+            src_attr_id=implant_attr.id)
+        implant_effect = self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=[implant_modifier])
+        self.ship = Ship(self.mktype(
+            attrs={self.src_attr.id: 10, self.tgt_attr.id: 100},
+            effects=[self.ship_effect]).id)
+        self.implant = Implant(self.mktype(
+            attrs={implant_attr.id: 2}, effects=[implant_effect]).id)
+
+    def test_src_attr_change(self):
+        self.make_src_attr_chain()
+        self.fit.ship = self.ship
+        self.assertAlmostEqual(self.ship.attrs[self.tgt_attr.id], 110)
+        # Action
+        self.fit.implants.add(self.implant)
+        # Verification
+        self.assertAlmostEqual(self.ship.attrs[self.tgt_attr.id], 120)
+        # Action
+        self.fit.implants.remove(self.implant)
+        # Verification
+        self.assertAlmostEqual(self.ship.attrs[self.tgt_attr.id], 110)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_src_attr_change_effect_stopped(self):
+        self.make_src_attr_chain()
+        self.fit.ship = self.ship
+        self.ship.set_effect_mode(self.ship_effect.id, EffectMode.force_stop)
+        self.assertAlmostEqual(self.ship.attrs[self.tgt_attr.id], 100)
+        # Action
+        self.fit.implants.add(self.implant)
+        # Verification
+        self.assertAlmostEqual(self.ship.attrs[self.tgt_attr.id], 100)
+        # Action
+        self.ship.set_effect_mode(
+            self.ship_effect.id, EffectMode.full_compliance)
+        # Verification
+        self.assertAlmostEqual(self.ship.attrs[self.tgt_attr.id], 120)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
@@ -0,0 +1,170 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import CharacterProfile
+from eos import Fit
+from eos import Ship
+from eos import Skill
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModTgtFilter
+from eos.const.eve import AttrId
+from eos.const.eve import EffectCategoryId
+from tests.integration.testcase import IntegrationTestCase
+
+
+class TestCharacterProfile(IntegrationTestCase):
+
+    def setUp(self):
+        IntegrationTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.skill_level)
+        self.tgt_attr = self.mkattr()
+        modifier = self.mkmod(
+            tgt_filter=ModTgtFilter.item,
+            tgt_domain=ModDomain.ship,
+            tgt_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_percent,
+            src_attr_id=AttrId.skill_level)
+        effect = self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=[modifier])
+        self.skill_type = self.mktype(
+            attrs={AttrId.skill_level: 0}, effects=[effect])
+        self.ship_type = self.mktype(attrs={self.tgt_attr.id: 100})
+
+    def make_fit(self, profile):
+        fit = Fit()
+        fit.ship = Ship(self.ship_type.id)
+        fit.character_profile = profile
+        return fit
+
+    def assert_profile_buffers_empty(self, profile):
+        profile.skills.clear()
+        profile.implants.clear()
+        profile.boosters.clear()
+        self.assert_solsys_buffers_empty(
+            profile._CharacterProfile__fit.solar_system)
+
+    def test_shared(self):
+        profile = CharacterProfile()
+        profile.skills.add(Skill(self.skill_type.id, level=5))
+        # Action
+        fit1 = self.make_fit(profile)
+        fit2 = self.make_fit(profile)
+        # Verification
+        self.assertAlmostEqual(fit1.ship.attrs[self.tgt_attr.id], 105)
+        self.assertAlmostEqual(fit2.ship.attrs[self.tgt_attr.id], 105)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit1.solar_system)
+        self.assert_solsys_buffers_empty(fit2.solar_system)
+        self.assert_profile_buffers_empty(profile)
+        self.assert_log_entries(0)
+
+    def test_skill_level_change(self):
+        profile = CharacterProfile()
+        skill = Skill(self.skill_type.id, level=5)
+        profile.skills.add(skill)
+        fit1 = self.make_fit(profile)
+        fit2 = self.make_fit(profile)
+        self.assertAlmostEqual(fit1.ship.attrs[self.tgt_attr.id], 105)
+        self.assertAlmostEqual(fit2.ship.attrs[self.tgt_attr.id], 105)
+        # Action
+        skill.level = 3
+        # Verification
+        self.assertAlmostEqual(fit1.ship.attrs[self.tgt_attr.id], 103)
+        self.assertAlmostEqual(fit2.ship.attrs[self.tgt_attr.id], 103)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit1.solar_system)
+        self.assert_solsys_buffers_empty(fit2.solar_system)
+        self.assert_profile_buffers_empty(profile)
+        self.assert_log_entries(0)
+
+    def test_skill_add_remove(self):
+        profile = CharacterProfile()
+        fit = self.make_fit(profile)
+        self.assertAlmostEqual(fit.ship.attrs[self.tgt_attr.id], 100)
+        skill = Skill(self.skill_type.id, level=5)
+        # Action
+        profile.skills.add(skill)
+        # Verification
+        self.assertAlmostEqual(fit.ship.attrs[self.tgt_attr.id], 105)
+        # Action
+        profile.skills.remove(skill)
+        # Verification
+        self.assertAlmostEqual(fit.ship.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_profile_buffers_empty(profile)
+        self.assert_log_entries(0)
+
+    def test_override_by_fit_skill(self):
+        profile = CharacterProfile()
+        profile.skills.add(Skill(self.skill_type.id, level=5))
+        fit1 = self.make_fit(profile)
+        fit2 = self.make_fit(profile)
+        self.assertAlmostEqual(fit1.ship.attrs[self.tgt_attr.id], 105)
+        fit_skill = Skill(self.skill_type.id, level=2)
+        # Action
+        fit1.skills.add(fit_skill)
+        # Verification
+        self.assertAlmostEqual(fit1.ship.attrs[self.tgt_attr.id], 102)
+        self.assertAlmostEqual(fit2.ship.attrs[self.tgt_attr.id], 105)
+        # Action
+        fit1.skills.remove(fit_skill)
+        # Verification
+        self.assertAlmostEqual(fit1.ship.attrs[self.tgt_attr.id], 105)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit1.solar_system)
+        self.assert_solsys_buffers_empty(fit2.solar_system)
+        self.assert_profile_buffers_empty(profile)
+        self.assert_log_entries(0)
+
+    def test_detach(self):
+        profile = CharacterProfile()
+        profile.skills.add(Skill(self.skill_type.id, level=5))
+        fit = self.make_fit(profile)
+        self.assertAlmostEqual(fit.ship.attrs[self.tgt_attr.id], 105)
+        # Action
+        fit.character_profile = None
+        # Verification
+        self.assertIsNone(fit.character_profile)
+        self.assertAlmostEqual(fit.ship.attrs[self.tgt_attr.id], 100)
+        # Changes to profile should not influence detached fit
+        profile.skills.clear()
+        self.assertAlmostEqual(fit.ship.attrs[self.tgt_attr.id], 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_profile_buffers_empty(profile)
+        self.assert_log_entries(0)
+
+    def test_fit_copy(self):
+        profile = CharacterProfile()
+        profile.skills.add(Skill(self.skill_type.id, level=5))
+        fit = self.make_fit(profile)
+        # Action
+        fit_copy = fit.copy()
+        # Verification
+        self.assertIs(fit_copy.character_profile, profile)
+        self.assertAlmostEqual(fit_copy.ship.attrs[self.tgt_attr.id], 105)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_solsys_buffers_empty(fit_copy.solar_system)
+        self.assert_profile_buffers_empty(profile)
+        self.assert_log_entries(0)
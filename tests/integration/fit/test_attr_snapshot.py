@@ -0,0 +1,123 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+import math
+
+from eos import Fit
+from eos import Implant
+from eos import ModuleHigh
+from eos import Ship
+from eos import SolarSystem
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModTgtFilter
+from eos.const.eve import EffectCategoryId
+from tests.integration.testcase import IntegrationTestCase
+
+
+class TestFitAttrSnapshot(IntegrationTestCase):
+
+    def setUp(self):
+        IntegrationTestCase.setUp(self)
+        self.attr1 = self.mkattr()
+        self.attr2 = self.mkattr()
+        self.src_attr = self.mkattr()
+        modifier = self.mkmod(
+            tgt_filter=ModTgtFilter.item,
+            tgt_domain=ModDomain.ship,
+            tgt_attr_id=self.attr1.id,
+            operator=ModOperator.post_percent,
+            src_attr_id=self.src_attr.id)
+        self.effect = self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=[modifier])
+
+    def make_fit(self, solar_system=None):
+        fit = Fit(solar_system=solar_system)
+        fit.character = None
+        fit.ship = Ship(self.mktype(
+            attrs={self.attr1.id: 100, self.attr2.id: 5}).id)
+        fit.implants.add(Implant(self.mktype(
+            attrs={self.src_attr.id: 20}, effects=[self.effect]).id))
+        return fit
+
+    def test_fit(self):
+        fit = self.make_fit()
+        module = ModuleHigh(self.mktype(attrs={self.attr2.id: 8}).id)
+        fit.modules.high.append(module)
+        # Action
+        snapshot = fit.attr_snapshot((self.attr1.id, self.attr2.id))
+        # Verification
+        self.assertEqual(len(snapshot.items), 3)
+        self.assertEqual(snapshot.attr_ids, (self.attr1.id, self.attr2.id))
+        self.assertEqual(len(snapshot.values), 6)
+        self.assertAlmostEqual(snapshot.get(fit.ship, self.attr1.id), 120)
+        self.assertAlmostEqual(snapshot.get(fit.ship, self.attr2.id), 5)
+        self.assertAlmostEqual(snapshot.get(module, self.attr2.id), 8)
+        self.assertIsNone(snapshot.get(module, self.attr1.id))
+        self.assertEqual(snapshot.get(module, self.attr1.id, 0), 0)
+        self.assertEqual(snapshot.row(module), {self.attr2.id: 8})
+        column = snapshot.column(self.attr1.id)
+        self.assertAlmostEqual(column[snapshot.items.index(fit.ship)], 120)
+        self.assertTrue(math.isnan(column[snapshot.items.index(module)]))
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        # Values absent on implant and module are logged
+        self.assert_log_entries(3)
+
+    def test_items(self):
+        fit = self.make_fit()
+        # Action
+        snapshot = fit.attr_snapshot([self.attr1.id], items=[fit.ship])
+        # Verification
+        self.assertEqual(snapshot.items, (fit.ship,))
+        self.assertAlmostEqual(snapshot.get(fit.ship, self.attr1.id), 120)
+        with self.assertRaises(KeyError):
+            snapshot.get(fit.ship, self.attr2.id)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_not_loaded(self):
+        fit = self.make_fit()
+        module = ModuleHigh(self.allocate_type_id())
+        fit.modules.high.append(module)
+        # Action
+        snapshot = fit.attr_snapshot([self.attr1.id])
+        # Verification
+        self.assertNotIn(module, snapshot.items)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(1)
+
+    def test_solar_system(self):
+        solar_system = SolarSystem()
+        fit1 = self.make_fit(solar_system)
+        fit2 = self.make_fit(solar_system)
+        fit2.implants.clear()
+        # Action
+        snapshot = solar_system.attr_snapshot([self.attr1.id])
+        # Verification
+        self.assertEqual(len(snapshot.items), 3)
+        self.assertAlmostEqual(snapshot.get(fit1.ship, self.attr1.id), 120)
+        self.assertAlmostEqual(snapshot.get(fit2.ship, self.attr1.id), 100)
+        # Cleanup
+        self.assert_solsys_buffers_empty(solar_system)
+        self.assert_log_entries(1)
@@ -0,0 +1,150 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Booster
+from eos import Charge
+from eos import EffectMode
+from eos import Fit
+from eos import Implant
+from eos import ModuleHigh
+from eos import Ship
+from eos import Skill
+from eos import State
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModTgtFilter
+from eos.const.eve import EffectCategoryId
+from eos.stats_container import Coordinates
+from eos.stats_container import DmgProfile
+from tests.integration.testcase import IntegrationTestCase
+
+
+class TestFitCopy(IntegrationTestCase):
+
+    def setUp(self):
+        IntegrationTestCase.setUp(self)
+        self.src_attr = self.mkattr()
+        self.tgt_attr = self.mkattr()
+        modifier = self.mkmod(
+            tgt_filter=ModTgtFilter.item,
+            tgt_domain=ModDomain.ship,
+            tgt_attr_id=self.tgt_attr.id,
+            operator=ModOperator.post_percent,
+            src_attr_id=self.src_attr.id)
+        self.effect = self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=[modifier])
+
+    def test_items(self):
+        fit = Fit()
+        fit.ship = Ship(self.mktype().id)
+        fit.ship.coordinate = Coordinates(1, 2, 3)
+        skill = Skill(self.mktype().id, level=3)
+        fit.skills.add(skill)
+        implant = Implant(self.mktype(effects=[self.effect]).id)
+        implant.set_effect_mode(self.effect.id, EffectMode.force_stop)
+        fit.implants.add(implant)
+        fit.boosters.add(Booster(self.mktype().id))
+        module = ModuleHigh(
+            self.mktype().id, state=State.active,
+            charge=Charge(self.mktype().id))
+        fit.modules.high.place(2, module)
+        fit.default_incoming_dmg = DmgProfile(1, 2, 3, 4)
+        # Action
+        fit_copy = fit.copy()
+        # Verification
+        self.assertIsNot(fit_copy.solar_system, fit.solar_system)
+        self.assertIs(fit_copy.solar_system.source, fit.solar_system.source)
+        self.assertIsNot(fit_copy.ship, fit.ship)
+        self.assertEqual(fit_copy.ship._type_id, fit.ship._type_id)
+        self.assertEqual(fit_copy.ship.coordinate, Coordinates(1, 2, 3))
+        self.assertIsNot(fit_copy.character, fit.character)
+        self.assertEqual(len(fit_copy.skills), 1)
+        skill_copy = next(iter(fit_copy.skills))
+        self.assertIsNot(skill_copy, skill)
+        self.assertEqual(skill_copy.level, 3)
+        implant_copy = next(iter(fit_copy.implants))
+        self.assertEqual(
+            implant_copy.get_effect_mode(self.effect.id),
+            EffectMode.force_stop)
+        self.assertEqual(len(fit_copy.boosters), 1)
+        self.assertEqual(len(fit_copy.modules.high), 3)
+        self.assertIsNone(fit_copy.modules.high[0])
+        module_copy = fit_copy.modules.high[2]
+        self.assertIsNot(module_copy, module)
+        self.assertIs(module_copy.state, State.active)
+        self.assertIsNot(module_copy.charge, module.charge)
+        self.assertEqual(module_copy.charge._type_id, module.charge._type_id)
+        self.assertIs(module_copy.charge._is_loaded, True)
+        self.assertEqual(fit_copy.default_incoming_dmg, DmgProfile(1, 2, 3, 4))
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_solsys_buffers_empty(fit_copy.solar_system)
+        self.assert_log_entries(0)
+
+    def test_attrs(self):
+        fit = Fit()
+        fit.ship = Ship(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        implant = Implant(self.mktype(
+            attrs={self.src_attr.id: 20}, effects=[self.effect]).id)
+        fit.implants.add(implant)
+        self.assertAlmostEqual(fit.ship.attrs[self.tgt_attr.id], 120)
+        # Action
+        fit_copy = fit.copy()
+        # Verification
+        self.assertAlmostEqual(fit_copy.ship.attrs[self.tgt_attr.id], 120)
+        # Changes on copy should not affect original, and carried over values
+        # should be invalidated as usual
+        fit_copy.implants.clear()
+        self.assertAlmostEqual(fit_copy.ship.attrs[self.tgt_attr.id], 100)
+        self.assertAlmostEqual(fit.ship.attrs[self.tgt_attr.id], 120)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_solsys_buffers_empty(fit_copy.solar_system)
+        self.assert_log_entries(0)
+
+    def test_no_character(self):
+        fit = Fit()
+        fit.character = None
+        # Action
+        fit_copy = fit.copy(copy_attrs=False)
+        # Verification
+        self.assertIsNone(fit_copy.character)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_solsys_buffers_empty(fit_copy.solar_system)
+        self.assert_log_entries(0)
+
+    def test_detached(self):
+        fit = Fit()
+        fit.ship = Ship(self.mktype(attrs={self.tgt_attr.id: 100}).id)
+        fit.skills.add(Skill(self.mktype().id, level=2))
+        fit.solar_system.fits.remove(fit)
+        # Action
+        fit_copy = fit.copy()
+        # Verification
+        self.assertIsNone(fit.solar_system)
+        self.assertIsNone(fit_copy.solar_system.source)
+        self.assertEqual(fit_copy.ship._type_id, fit.ship._type_id)
+        self.assertIs(fit_copy.ship._is_loaded, False)
+        self.assertEqual(next(iter(fit_copy.skills)).level, 2)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit_copy.solar_system)
+        self.assert_log_entries(0)
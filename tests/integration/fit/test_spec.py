@@ -0,0 +1,151 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import Charge
+from eos import Drone
+from eos import EffectMode
+from eos import Fit
+from eos import Implant
+from eos import ModuleHigh
+from eos import ModuleLow
+from eos import Ship
+from eos import Skill
+from eos import SolarSystem
+from eos import SpecFormatError
+from eos import State
+from eos.const.eve import EffectCategoryId
+from eos.fit_spec import pack_spec
+from eos.fit_spec import spec_from_json
+from eos.fit_spec import spec_to_json
+from eos.fit_spec import unpack_spec
+from eos.stats_container import DmgProfile
+from tests.integration.testcase import IntegrationTestCase
+
+
+class TestFitSpec(IntegrationTestCase):
+
+    def make_fit(self):
+        effect = self.mkeffect(category_id=EffectCategoryId.passive)
+        fit = Fit()
+        fit.ship = Ship(self.mktype().id)
+        fit.skills.add(Skill(self.mktype().id, level=3))
+        fit.skills.add(Skill(self.mktype().id, level=5))
+        implant = Implant(self.mktype(effects=[effect]).id)
+        implant.set_effect_mode(effect.id, EffectMode.force_stop)
+        fit.implants.add(implant)
+        fit.modules.high.place(2, ModuleHigh(
+            self.mktype().id, state=State.active,
+            charge=Charge(self.mktype().id)))
+        fit.modules.low.append(ModuleLow(self.mktype().id))
+        fit.drones.add(Drone(self.mktype().id, state=State.active))
+        fit.default_incoming_dmg = DmgProfile(1, 2, 3, 4.5)
+        fit.rah_incoming_dmg = DmgProfile(0, 1, 0, 0)
+        return fit
+
+    def test_roundtrip(self):
+        fit = self.make_fit()
+        spec = fit.to_spec()
+        # Action
+        fit_copy = Fit.from_spec(spec)
+        # Verification
+        self.assertEqual(fit_copy.to_spec(), spec)
+        self.assertEqual(fit_copy.ship._type_id, fit.ship._type_id)
+        self.assertEqual(fit_copy.character._type_id, fit.character._type_id)
+        self.assertEqual(
+            {s._type_id: s.level for s in fit_copy.skills},
+            {s._type_id: s.level for s in fit.skills})
+        implant = next(iter(fit.implants))
+        implant_copy = next(iter(fit_copy.implants))
+        self.assertEqual(implant_copy._type_id, implant._type_id)
+        self.assertEqual(
+            implant_copy._get_effects_modes(), implant._get_effects_modes())
+        self.assertEqual(len(fit_copy.modules.high), 3)
+        self.assertIsNone(fit_copy.modules.high[0])
+        module = fit.modules.high[2]
+        module_copy = fit_copy.modules.high[2]
+        self.assertIs(module_copy.state, State.active)
+        self.assertEqual(module_copy.charge._type_id, module.charge._type_id)
+        self.assertIs(module_copy.charge._is_loaded, True)
+        self.assertIs(fit_copy.modules.low[0].state, State.offline)
+        self.assertIs(next(iter(fit_copy.drones)).state, State.active)
+        self.assertEqual(
+            fit_copy.default_incoming_dmg, DmgProfile(1, 2, 3, 4.5))
+        self.assertEqual(fit_copy.rah_incoming_dmg, DmgProfile(0, 1, 0, 0))
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_solsys_buffers_empty(fit_copy.solar_system)
+        self.assert_log_entries(0)
+
+    def test_hashable(self):
+        fit = self.make_fit()
+        # Verification - set order does not change specification
+        self.assertEqual(
+            hash(fit.to_spec()), hash(Fit.from_spec(fit.to_spec()).to_spec()))
+        # Cleanup
+        self.assert_log_entries(0)
+
+    def test_json(self):
+        spec = self.make_fit().to_spec()
+        # Verification
+        self.assertEqual(spec_from_json(spec_to_json(spec)), spec)
+        # Cleanup
+        self.assert_log_entries(0)
+
+    def test_binary(self):
+        fit = self.make_fit()
+        fit.rah_incoming_dmg = None
+        spec = fit.to_spec()
+        # Verification
+        self.assertEqual(unpack_spec(pack_spec(spec)), spec)
+        # Cleanup
+        self.assert_log_entries(0)
+
+    def test_empty(self):
+        fit = Fit()
+        fit.character = None
+        spec = fit.to_spec()
+        # Action
+        fit_copy = Fit.from_spec(unpack_spec(pack_spec(spec)))
+        # Verification
+        self.assertIsNone(fit_copy.character)
+        self.assertIsNone(fit_copy.ship)
+        self.assertEqual(fit_copy.to_spec(), spec)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit_copy.solar_system)
+        self.assert_log_entries(0)
+
+    def test_malformed(self):
+        spec = self.make_fit().to_spec()
+        solar_system = SolarSystem()
+        # Verification
+        with self.assertRaises(SpecFormatError):
+            Fit.from_spec((99,) + spec[1:], solar_system=solar_system)
+        with self.assertRaises(SpecFormatError):
+            Fit.from_spec(spec[:-3], solar_system=solar_system)
+        self.assertEqual(len(solar_system.fits), 0)
+        with self.assertRaises(SpecFormatError):
+            unpack_spec(pack_spec(spec)[:-1])
+        with self.assertRaises(SpecFormatError):
+            unpack_spec(pack_spec(spec) + b'\x00')
+        with self.assertRaises(SpecFormatError):
+            spec_from_json('[1,')
+        # Cleanup
+        self.assert_log_entries(0)
@@ -364,3 +364,85 @@ class TestItemMixinTankingEhp(ItemMixinTestCase):
         # Cleanup
         self.assert_solsys_buffers_empty(fit.solar_system)
         self.assert_log_entries(0)
+
+    def test_many(self):
+        fit = Fit()
+        item = Ship(self.mktype(attrs={
+            AttrId.hp: 10,
+            AttrId.em_dmg_resonance: 0.9,
+            AttrId.therm_dmg_resonance: 0.8,
+            AttrId.kin_dmg_resonance: 0.7,
+            AttrId.expl_dmg_resonance: 0.6,
+            AttrId.armor_hp: 50,
+            AttrId.armor_em_dmg_resonance: 0.4,
+            AttrId.armor_therm_dmg_resonance: 0.6,
+            AttrId.armor_kin_dmg_resonance: 0.8,
+            AttrId.armor_expl_dmg_resonance: 0.9,
+            AttrId.shield_capacity: 600,
+            AttrId.shield_em_dmg_resonance: 1.0,
+            AttrId.shield_therm_dmg_resonance: 0.8,
+            AttrId.shield_kin_dmg_resonance: 0.6,
+            AttrId.shield_expl_dmg_resonance: 0.5}).id)
+        fit.ship = item
+        # Verification
+        results = item.get_ehp_many((
+            DmgProfile(25, 6, 8.333, 1),
+            (1, 1, 1, 1),
+            [0, 0, 0, 2]))
+        self.assertEqual(len(results), 3)
+        self.assertAlmostEqual(results[0].hull, 11.957, places=3)
+        self.assertAlmostEqual(results[0].armor, 95.276, places=3)
+        self.assertAlmostEqual(results[0].shield, 685.551, places=3)
+        self.assertAlmostEqual(results[0].total, 792.783, places=3)
+        self.assertAlmostEqual(results[1].hull, 13.333, places=3)
+        self.assertAlmostEqual(results[1].armor, 74.074, places=3)
+        self.assertAlmostEqual(results[1].shield, 827.586, places=3)
+        self.assertAlmostEqual(results[1].total, 914.994, places=3)
+        self.assertAlmostEqual(results[2].hull, 16.667, places=3)
+        self.assertAlmostEqual(results[2].armor, 55.556, places=3)
+        self.assertAlmostEqual(results[2].shield, 1200, places=3)
+        self.assertAlmostEqual(results[2].total, 1272.222, places=3)
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_many_empty(self):
+        fit = Fit()
+        item = Ship(self.mktype(attrs={
+            AttrId.hp: 10,
+            AttrId.armor_hp: 50,
+            AttrId.shield_capacity: 600}).id)
+        fit.ship = item
+        # Verification
+        self.assertEqual(item.get_ehp_many(()), [])
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_many_zero_sum(self):
+        fit = Fit()
+        item = Ship(self.mktype(attrs={
+            AttrId.hp: 10,
+            AttrId.armor_hp: 50,
+            AttrId.shield_capacity: 600}).id)
+        fit.ship = item
+        # Verification
+        with self.assertRaises(ValueError):
+            item.get_ehp_many(((1, 1, 1, 1), (0, 0, 0, 0)))
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_many_negative(self):
+        fit = Fit()
+        item = Ship(self.mktype(attrs={
+            AttrId.hp: 10,
+            AttrId.armor_hp: 50,
+            AttrId.shield_capacity: 600}).id)
+        fit.ship = item
+        # Verification
+        with self.assertRaises(ValueError):
+            item.get_ehp_many(((1, 1, 1, 1), (2, -1, 0, 0)))
+        # Cleanup
+        self.assert_solsys_buffers_empty(fit.solar_system)
+        self.assert_log_entries(0)
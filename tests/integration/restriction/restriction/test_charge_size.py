@@ -53,6 +53,27 @@ class TestChargeSize(RestrictionTestCase):
         self.assert_solsys_buffers_empty(self.fit.solar_system)
         self.assert_log_entries(0)
 
+    def test_fail_charge_replaced_after_validation(self):
+        # Check that charge replacement after validation is accounted for
+        container = ModuleHigh(
+            self.mktype(attrs={AttrId.charge_size: 3}).id,
+            state=State.offline)
+        container.charge = Charge(self.mktype(attrs={AttrId.charge_size: 3}).id)
+        self.fit.modules.high.append(container)
+        self.assertIsNone(
+            self.get_error(container.charge, Restriction.charge_size))
+        charge = Charge(self.mktype(attrs={AttrId.charge_size: 2}).id)
+        container.charge = charge
+        # Action
+        error = self.get_error(charge, Restriction.charge_size)
+        # Verification
+        self.assertIsNotNone(error)
+        self.assertEqual(error.size, 2)
+        self.assertEqual(error.allowed_size, 3)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
     def test_fail_charge_attr_greater(self):
         charge = Charge(self.mktype(attrs={AttrId.charge_size: 2}).id)
         container = ModuleHigh(
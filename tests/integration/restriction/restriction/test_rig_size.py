@@ -55,6 +55,25 @@ class TestRigSize(RestrictionTestCase):
         self.assert_solsys_buffers_empty(self.fit.solar_system)
         self.assert_log_entries(0)
 
+    def test_fail_ship_replaced_after_validation(self):
+        # Check that ship replacement after validation is accounted for
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.rig_size: 10}).id)
+        item = Rig(self.mktype(
+            attrs={AttrId.rig_size: 10},
+            effects=[self.effect]).id)
+        self.fit.rigs.add(item)
+        self.assertIsNone(self.get_error(item, Restriction.rig_size))
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.rig_size: 6}).id)
+        # Action
+        error = self.get_error(item, Restriction.rig_size)
+        # Verification
+        self.assertIsNotNone(error)
+        self.assertEqual(error.size, 10)
+        self.assertEqual(error.allowed_size, 6)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
     def test_pass_ship_absent(self):
         # When no ship is assigned, no restriction should be applied to ships
         item = Rig(self.mktype(
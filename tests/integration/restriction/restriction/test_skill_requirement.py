@@ -19,6 +19,7 @@
 # ==============================================================================
 
 
+from eos import CharacterProfile
 from eos import ModuleHigh
 from eos import Restriction
 from eos import Rig
@@ -130,6 +131,43 @@ class TestSkillRequirement(RestrictionTestCase):
         self.assert_solsys_buffers_empty(self.fit.solar_system)
         self.assert_log_entries(0)
 
+    def test_pass_satisfied_profile(self):
+        # Check that skills of character profile satisfy requirements
+        item = ModuleHigh(self.mktype(attrs={
+            AttrId.required_skill_2: 50,
+            AttrId.required_skill_2_level: 3}).id)
+        self.fit.modules.high.append(item)
+        profile = CharacterProfile()
+        profile.skills.add(Skill(self.mktype(type_id=50).id, level=3))
+        self.fit.character_profile = profile
+        # Action
+        error = self.get_error(item, Restriction.skill_requirement)
+        # Verification
+        self.assertIsNone(error)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fail_profile_overridden(self):
+        # Check that skill on fit has priority over skill of character profile
+        item = ModuleHigh(self.mktype(attrs={
+            AttrId.required_skill_2: 50,
+            AttrId.required_skill_2_level: 3}).id)
+        self.fit.modules.high.append(item)
+        skill_type = self.mktype(type_id=50)
+        profile = CharacterProfile()
+        profile.skills.add(Skill(skill_type.id, level=5))
+        self.fit.character_profile = profile
+        self.fit.skills.add(Skill(skill_type.id, level=1))
+        # Action
+        error = self.get_error(item, Restriction.skill_requirement)
+        # Verification
+        self.assertIsNotNone(error)
+        self.assertCountEqual(error, ((50, 1, 3),))
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
     def test_pass_item_exception_rig(self):
         # Check that skillreqs on rigs are not checked
         item = Rig(self.mktype(attrs={
@@ -154,3 +192,44 @@ class TestSkillRequirement(RestrictionTestCase):
         # Cleanup
         self.assert_solsys_buffers_empty(self.fit.solar_system)
         self.assert_log_entries(0)
+
+    def test_fail_level_changed_after_validation(self):
+        # Check that skill level change after validation is accounted for
+        item = ModuleHigh(self.mktype(attrs={
+            AttrId.required_skill_1: 50,
+            AttrId.required_skill_1_level: 3}).id)
+        self.fit.modules.high.append(item)
+        skill = Skill(self.mktype(type_id=50).id, level=3)
+        self.fit.skills.add(skill)
+        self.assertIsNone(self.get_error(item, Restriction.skill_requirement))
+        skill.level = 2
+        # Action
+        error = self.get_error(item, Restriction.skill_requirement)
+        # Verification
+        self.assertIsNotNone(error)
+        self.assertCountEqual(error, ((50, 2, 3),))
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fail_profile_level_changed_after_validation(self):
+        # Check that level change of character profile skill after validation
+        # is accounted for
+        item = ModuleHigh(self.mktype(attrs={
+            AttrId.required_skill_1: 50,
+            AttrId.required_skill_1_level: 3}).id)
+        self.fit.modules.high.append(item)
+        skill = Skill(self.mktype(type_id=50).id, level=3)
+        profile = CharacterProfile()
+        profile.skills.add(skill)
+        self.fit.character_profile = profile
+        self.assertIsNone(self.get_error(item, Restriction.skill_requirement))
+        skill.level = 2
+        # Action
+        error = self.get_error(item, Restriction.skill_requirement)
+        # Verification
+        self.assertIsNotNone(error)
+        self.assertCountEqual(error, ((50, 2, 3),))
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
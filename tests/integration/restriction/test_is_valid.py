@@ -0,0 +1,91 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import ModuleHigh
+from eos import Restriction
+from eos import Ship
+from eos.const.eve import AttrId
+from tests.integration.restriction.testcase import RestrictionTestCase
+
+
+class TestIsValid(RestrictionTestCase):
+    """Check fast fit validity check."""
+
+    def setUp(self):
+        RestrictionTestCase.setUp(self)
+        self.mkattr(attr_id=AttrId.hi_slots)
+        # Items are created from types which do not pass item class check, so
+        # check only restrictions which are tested here
+        self.skip_checks = set(Restriction).difference((
+            Restriction.high_slot, Restriction.skill_requirement))
+
+    def test_pass(self):
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.hi_slots: 1}).id)
+        self.fit.modules.high.append(ModuleHigh(self.mktype().id))
+        # Verification
+        self.assertIs(self.fit.is_valid(self.skip_checks), True)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_fail_multiple(self):
+        # Check that failure is reported when multiple restrictions fail
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.hi_slots: 0}).id)
+        self.fit.modules.high.append(ModuleHigh(self.mktype(attrs={
+            AttrId.required_skill_1: 50,
+            AttrId.required_skill_1_level: 3}).id))
+        # Verification
+        self.assertIs(self.fit.is_valid(self.skip_checks), False)
+        self.assertIs(self.fit.is_valid(
+            self.skip_checks | {Restriction.high_slot}), False)
+        self.assertIs(self.fit.is_valid(
+            self.skip_checks | {Restriction.skill_requirement}), False)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_pass_skipped(self):
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.hi_slots: 0}).id)
+        self.fit.modules.high.append(ModuleHigh(self.mktype(attrs={
+            AttrId.required_skill_1: 50,
+            AttrId.required_skill_1_level: 3}).id))
+        # Verification
+        self.assertIs(self.fit.is_valid(self.skip_checks | {
+            Restriction.high_slot, Restriction.skill_requirement}), True)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_pass_negative_output_no_users(self):
+        # Resource output below zero fails neither validation nor fast check
+        # when there are no items which use the resource
+        self.mkattr(attr_id=AttrId.cpu_output)
+        self.mkattr(attr_id=AttrId.cpu)
+        self.fit.ship = Ship(self.mktype(attrs={AttrId.cpu_output: -10}).id)
+        skip_checks = set(Restriction).difference((Restriction.cpu,))
+        # Verification
+        self.assertGreater(
+            self.fit.stats.cpu.used, self.fit.stats.cpu.output)
+        self.fit.validate(skip_checks)
+        self.assertIs(self.fit.is_valid(skip_checks), True)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
@@ -52,6 +52,7 @@ class RestrictionTestCase(IntegrationTestCase):
         try:
             self.fit.validate(skip_checks)
         except ValidationError as e:
+            self.assertIs(self.fit.is_valid(skip_checks), False)
             error_data = e.args[0]
             if item not in error_data:
                 return None
@@ -60,6 +61,7 @@ class RestrictionTestCase(IntegrationTestCase):
                 return None
             return item_error[restriction]
         else:
+            self.assertIs(self.fit.is_valid(skip_checks), True)
             return None
 
     def get_log(self, name='eos.restriction*'):
@@ -0,0 +1,151 @@
+# ==============================================================================
+# Copyright (C) 2011 Diego Duclos
+# Copyright (C) 2011-2018 Anton Vorobyov
+#
+# This file is part of Eos.
+#
+# Eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Eos. If not, see <http://www.gnu.org/licenses/>.
+# ==============================================================================
+
+
+from eos import DmgProfile
+from eos import Fit
+from eos import ModuleLow
+from eos import Ship
+from eos import State
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModTgtFilter
+from eos.const.eve import EffectCategoryId
+from eos.sim import ReactiveArmorHardenerSimulator
+from tests.integration.sim.rah.testcase import RahSimTestCase
+
+
+class TestRahMemo(RahSimTestCase):
+
+    def setUp(self):
+        RahSimTestCase.setUp(self)
+        self.memo = ReactiveArmorHardenerSimulator.memo
+        self.ship_type = self.make_ship_type((0.5, 0.65, 0.75, 0.9))
+        self.rah_type = self.make_rah_type((0.85, 0.85, 0.85, 0.85), 6, 1000)
+
+    def make_fit(self):
+        fit = Fit(self.fit.solar_system)
+        fit.ship = Ship(self.ship_type.id)
+        rah = ModuleLow(self.rah_type.id, state=State.active)
+        fit.modules.low.equip(rah)
+        return fit, rah
+
+    def assert_rah_resos(self, rah, resos):
+        self.assertAlmostEqual(rah.attrs[self.armor_em.id], resos[0])
+        self.assertAlmostEqual(rah.attrs[self.armor_therm.id], resos[1])
+        self.assertAlmostEqual(rah.attrs[self.armor_kin.id], resos[2])
+        self.assertAlmostEqual(rah.attrs[self.armor_expl.id], resos[3])
+
+    def test_hit(self):
+        fit1, rah1 = self.make_fit()
+        fit2, rah2 = self.make_fit()
+        # Verification
+        self.assert_rah_resos(rah1, (1, 0.925, 0.82, 0.655))
+        self.assertEqual(self.memo.stats.hits, 0)
+        self.assertEqual(self.memo.stats.misses, 1)
+        self.assert_rah_resos(rah2, (1, 0.925, 0.82, 0.655))
+        self.assertEqual(self.memo.stats.hits, 1)
+        self.assertEqual(self.memo.stats.misses, 1)
+        self.assertAlmostEqual(self.memo.stats.hit_rate, 0.5)
+        self.assertEqual(len(self.memo), 1)
+        self.assertAlmostEqual(fit2.ship.attrs[self.armor_em.id], 0.5)
+        self.assertAlmostEqual(fit2.ship.attrs[self.armor_therm.id], 0.60125)
+        self.assertAlmostEqual(fit2.ship.attrs[self.armor_kin.id], 0.615)
+        self.assertAlmostEqual(fit2.ship.attrs[self.armor_expl.id], 0.5895)
+        # Cleanup
+        fit1.solar_system = None
+        fit2.solar_system = None
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_hit_after_change_revert(self):
+        fit, rah = self.make_fit()
+        self.assert_rah_resos(rah, (1, 0.925, 0.82, 0.655))
+        # Action
+        fit.rah_incoming_dmg = DmgProfile(1, 0, 0, 0)
+        # Verification
+        self.assert_rah_resos(rah, (0.4, 1, 1, 1))
+        self.assertEqual(self.memo.stats.hits, 0)
+        self.assertEqual(self.memo.stats.misses, 2)
+        # Action
+        fit.rah_incoming_dmg = None
+        # Verification
+        self.assert_rah_resos(rah, (1, 0.925, 0.82, 0.655))
+        self.assertEqual(self.memo.stats.hits, 1)
+        self.assertEqual(self.memo.stats.misses, 2)
+        # Cleanup
+        fit.solar_system = None
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_miss_ship_modification(self):
+        fit1, rah1 = self.make_fit()
+        fit2, rah2 = self.make_fit()
+        resmod_src_attr = self.mkattr()
+        resmod_mods = [
+            self.mkmod(
+                tgt_filter=ModTgtFilter.item,
+                tgt_domain=ModDomain.ship,
+                tgt_attr_id=attr.id,
+                operator=ModOperator.pre_mul,
+                src_attr_id=resmod_src_attr.id)
+            for attr in (
+                self.armor_em, self.armor_therm,
+                self.armor_kin, self.armor_expl)]
+        resmod_effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=resmod_mods)
+        fit2.modules.low.append(ModuleLow(self.mktype(
+            attrs={resmod_src_attr.id: 0.85},
+            effects=[resmod_effect]).id))
+        # Verification
+        self.assert_rah_resos(rah1, (1, 0.925, 0.82, 0.655))
+        self.assert_rah_resos(rah2, (1, 0.925, 0.82, 0.655))
+        self.assertEqual(self.memo.stats.hits, 0)
+        self.assertEqual(self.memo.stats.misses, 2)
+        self.assertAlmostEqual(fit2.ship.attrs[self.armor_em.id], 0.425, 3)
+        # Cleanup
+        fit1.solar_system = None
+        fit2.solar_system = None
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_eviction(self):
+        self.memo.max_size = 1
+        try:
+            fit1, rah1 = self.make_fit()
+            fit2, rah2 = self.make_fit()
+            fit2.rah_incoming_dmg = DmgProfile(1, 0, 0, 0)
+            fit3, rah3 = self.make_fit()
+            # Verification
+            self.assert_rah_resos(rah1, (1, 0.925, 0.82, 0.655))
+            self.assert_rah_resos(rah2, (0.4, 1, 1, 1))
+            self.assert_rah_resos(rah3, (1, 0.925, 0.82, 0.655))
+            self.assertEqual(self.memo.stats.hits, 0)
+            self.assertEqual(self.memo.stats.misses, 3)
+            self.assertEqual(len(self.memo), 1)
+        finally:
+            self.memo.max_size = 1000
+        # Cleanup
+        fit1.solar_system = None
+        fit2.solar_system = None
+        fit3.solar_system = None
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
@@ -90,3 +90,42 @@ class TestRahStacking(RahSimTestCase):
         # Cleanup
         self.assert_solsys_buffers_empty(self.fit.solar_system)
         self.assert_log_entries(0)
+
+    def test_ship_mods_non_multiplicative(self):
+        # Setup
+        ship = Ship(self.make_ship_type((0.5, 0.65, 0.75, 0.9)).id)
+        self.fit.ship = ship
+        rah = ModuleLow(
+            self.make_rah_type((0.85, 0.85, 0.85, 0.85), 6, 1000).id,
+            state=State.active)
+        self.fit.modules.low.equip(rah)
+        resmod_src_attr = self.mkattr()
+        resmod_mods = [
+            self.mkmod(
+                tgt_filter=ModTgtFilter.item,
+                tgt_domain=ModDomain.ship,
+                tgt_attr_id=attr.id,
+                operator=ModOperator.mod_add,
+                src_attr_id=resmod_src_attr.id)
+            for attr in (
+                self.armor_em, self.armor_therm,
+                self.armor_kin, self.armor_expl)]
+        resmod_effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=resmod_mods)
+        resmod = ModuleLow(self.mktype(
+            attrs={resmod_src_attr.id: -0.1},
+            effects=[resmod_effect]).id)
+        self.fit.modules.low.append(resmod)
+        # Verification
+        self.assertAlmostEqual(rah.attrs[self.armor_em.id], 1)
+        self.assertAlmostEqual(rah.attrs[self.armor_therm.id], 0.925)
+        self.assertAlmostEqual(rah.attrs[self.armor_kin.id], 0.82)
+        self.assertAlmostEqual(rah.attrs[self.armor_expl.id], 0.655)
+        self.assertAlmostEqual(ship.attrs[self.armor_em.id], 0.4)
+        self.assertAlmostEqual(ship.attrs[self.armor_therm.id], 0.50125)
+        self.assertAlmostEqual(ship.attrs[self.armor_kin.id], 0.515)
+        self.assertAlmostEqual(ship.attrs[self.armor_expl.id], 0.4895)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
@@ -26,6 +26,7 @@ from eos.const.eos import ModTgtFilter
 from eos.const.eve import AttrId
 from eos.const.eve import EffectCategoryId
 from eos.const.eve import EffectId
+from eos.sim import ReactiveArmorHardenerSimulator
 from tests.integration.testcase import IntegrationTestCase
 
 
@@ -48,6 +49,9 @@ class RahSimTestCase(IntegrationTestCase):
 
     def setUp(self):
         IntegrationTestCase.setUp(self)
+        # Do not let results memoized by other tests affect tests
+        ReactiveArmorHardenerSimulator.memo.clear()
+        ReactiveArmorHardenerSimulator.memo.reset_stats()
         # Attribute setup
         self.max_attr = self.mkattr(
             default_value=1.0,
@@ -22,6 +22,10 @@
 from eos import EffectMode
 from eos import Rig
 from eos import Ship
+from eos import Skill
+from eos.const.eos import ModDomain
+from eos.const.eos import ModOperator
+from eos.const.eos import ModTgtFilter
 from eos.const.eve import AttrId
 from eos.const.eve import EffectCategoryId
 from eos.const.eve import EffectId
@@ -137,3 +141,41 @@ class TestCalibration(StatsTestCase):
         # Cleanup
         self.assert_solsys_buffers_empty(self.fit.solar_system)
         self.assert_log_entries(0)
+
+    def test_use_full_after_changes(self):
+        # Float error should not accumulate when rigs with inexact costs are
+        # added and removed
+        src_attr = self.mkattr()
+        modifier = self.mkmod(
+            tgt_filter=ModTgtFilter.domain,
+            tgt_domain=ModDomain.ship,
+            tgt_attr_id=AttrId.upgrade_cost,
+            operator=ModOperator.post_percent,
+            src_attr_id=src_attr.id)
+        skill_effect = self.mkeffect(
+            category_id=EffectCategoryId.passive, modifiers=[modifier])
+        self.fit.skills.add(Skill(self.mktype(
+            attrs={src_attr.id: -10}, effects=[skill_effect]).id))
+        self.fit.ship = Ship(self.mktype(
+            attrs={AttrId.upgrade_capacity: 45.9}).id)
+        self.fit.rigs.add(Rig(self.mktype(
+            attrs={AttrId.upgrade_cost: 1},
+            effects=[self.effect]).id))
+        self.fit.rigs.add(Rig(self.mktype(
+            attrs={AttrId.upgrade_cost: 50},
+            effects=[self.effect]).id))
+        self.assertAlmostEqual(self.fit.stats.calibration.used, 45.9)
+        item = Rig(self.mktype(
+            attrs={AttrId.upgrade_cost: 50},
+            effects=[self.effect]).id)
+        self.fit.rigs.add(item)
+        self.assertAlmostEqual(self.fit.stats.calibration.used, 90.9)
+        # Action
+        self.fit.rigs.remove(item)
+        # Verification
+        self.assertLessEqual(
+            self.fit.stats.calibration.used,
+            self.fit.stats.calibration.output)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
@@ -21,6 +21,7 @@
 
 from eos import EffectMode
 from eos import ModuleHigh
+from eos import Rig
 from eos import Ship
 from eos import State
 from eos.const.eos import ModDomain
@@ -179,6 +180,67 @@ class TestCpu(StatsTestCase):
         self.assert_solsys_buffers_empty(self.fit.solar_system)
         self.assert_log_entries(0)
 
+    def test_use_modified_after_access(self):
+        # Check that used amount is updated when resource use of already
+        # counted item changes
+        src_attr = self.mkattr()
+        modifier = self.mkmod(
+            tgt_filter=ModTgtFilter.domain,
+            tgt_domain=ModDomain.ship,
+            tgt_attr_id=AttrId.cpu,
+            operator=ModOperator.post_mul,
+            src_attr_id=src_attr.id)
+        mod_effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=[modifier])
+        rig = Rig(self.mktype(
+            attrs={src_attr.id: 0.5}, effects=[mod_effect]).id)
+        self.fit.modules.high.append(ModuleHigh(
+            self.mktype(attrs={AttrId.cpu: 50}, effects=[self.effect]).id,
+            state=State.online))
+        self.fit.modules.high.append(ModuleHigh(
+            self.mktype(attrs={AttrId.cpu: 30}, effects=[self.effect]).id,
+            state=State.online))
+        self.assertAlmostEqual(self.fit.stats.cpu.used, 80)
+        # Action
+        self.fit.rigs.add(rig)
+        # Verification
+        self.assertAlmostEqual(self.fit.stats.cpu.used, 40)
+        # Action
+        self.fit.rigs.remove(rig)
+        # Verification
+        self.assertAlmostEqual(self.fit.stats.cpu.used, 80)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_use_item_switch_after_access(self):
+        item1 = ModuleHigh(
+            self.mktype(attrs={AttrId.cpu: 50}, effects=[self.effect]).id,
+            state=State.online)
+        item2 = ModuleHigh(
+            self.mktype(attrs={AttrId.cpu: 30.1}, effects=[self.effect]).id,
+            state=State.online)
+        self.fit.modules.high.append(item1)
+        self.fit.modules.high.append(item2)
+        self.assertAlmostEqual(self.fit.stats.cpu.used, 80.1)
+        # Action
+        item2.state = State.offline
+        # Verification
+        self.assertAlmostEqual(self.fit.stats.cpu.used, 50)
+        # Action
+        item2.state = State.online
+        # Verification
+        self.assertAlmostEqual(self.fit.stats.cpu.used, 80.1)
+        # Action
+        self.fit.modules.high.remove(item1)
+        self.fit.modules.high.remove(item2)
+        # Verification
+        self.assertEqual(self.fit.stats.cpu.used, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
     def test_use_item_absent(self):
         # Verification
         self.assertAlmostEqual(self.fit.stats.cpu.used, 0)
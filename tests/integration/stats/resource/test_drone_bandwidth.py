@@ -20,6 +20,7 @@
 
 
 from eos import Drone
+from eos import EffectMode
 from eos import Ship
 from eos import State
 from eos.const.eos import ModDomain
@@ -118,6 +119,39 @@ class TestDroneBandwidth(StatsTestCase):
         self.assert_solsys_buffers_empty(self.fit.solar_system)
         self.assert_log_entries(0)
 
+    def test_use_modified_after_access(self):
+        src_attr = self.mkattr()
+        modifier = self.mkmod(
+            tgt_filter=ModTgtFilter.item,
+            tgt_domain=ModDomain.self,
+            tgt_attr_id=AttrId.drone_bandwidth_used,
+            operator=ModOperator.post_mul,
+            src_attr_id=src_attr.id)
+        mod_effect = self.mkeffect(
+            category_id=EffectCategoryId.passive,
+            modifiers=[modifier])
+        item = Drone(
+            self.mktype(
+                attrs={AttrId.drone_bandwidth_used: 50, src_attr.id: 2},
+                effects=[mod_effect]).id,
+            state=State.online)
+        self.fit.drones.add(item)
+        self.fit.drones.add(Drone(
+            self.mktype(attrs={AttrId.drone_bandwidth_used: 30}).id,
+            state=State.online))
+        self.assertAlmostEqual(self.fit.stats.drone_bandwidth.used, 130)
+        # Action
+        item.set_effect_mode(mod_effect.id, EffectMode.force_stop)
+        # Verification
+        self.assertAlmostEqual(self.fit.stats.drone_bandwidth.used, 80)
+        # Action
+        item.state = State.offline
+        # Verification
+        self.assertAlmostEqual(self.fit.stats.drone_bandwidth.used, 30)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
     def test_use_item_absent(self):
         # Verification
         self.assertAlmostEqual(self.fit.stats.drone_bandwidth.used, 0)
@@ -98,3 +98,61 @@ class TestEhp(StatsTestCase):
         # Cleanup
         self.assert_solsys_buffers_empty(self.fit.solar_system)
         self.assert_log_entries(0)
+
+    def test_many_relay(self):
+        self.fit.ship = Ship(self.mktype(attrs={
+            AttrId.hp: 10,
+            AttrId.em_dmg_resonance: 0.5,
+            AttrId.therm_dmg_resonance: 0.5,
+            AttrId.kin_dmg_resonance: 0.5,
+            AttrId.expl_dmg_resonance: 0.5,
+            AttrId.armor_hp: 15,
+            AttrId.armor_em_dmg_resonance: 0.5,
+            AttrId.armor_therm_dmg_resonance: 0.5,
+            AttrId.armor_kin_dmg_resonance: 0.5,
+            AttrId.armor_expl_dmg_resonance: 0.5,
+            AttrId.shield_capacity: 20,
+            AttrId.shield_em_dmg_resonance: 0.5,
+            AttrId.shield_therm_dmg_resonance: 0.5,
+            AttrId.shield_kin_dmg_resonance: 0.5,
+            AttrId.shield_expl_dmg_resonance: 0.5}).id)
+        # Action
+        ehp_stats = self.fit.stats.get_ehp_many((
+            DmgProfile(1, 1, 1, 1), (0, 3, 1, 0)))
+        # Verification
+        self.assertEqual(len(ehp_stats), 2)
+        for ehp_stat in ehp_stats:
+            self.assertAlmostEqual(ehp_stat.hull, 20)
+            self.assertAlmostEqual(ehp_stat.armor, 30)
+            self.assertAlmostEqual(ehp_stat.shield, 40)
+            self.assertAlmostEqual(ehp_stat.total, 90)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_many_ship_absent(self):
+        # Action
+        ehp_stats = self.fit.stats.get_ehp_many((
+            DmgProfile(1, 1, 1, 1), (0, 3, 1, 0)))
+        # Verification
+        self.assertEqual(len(ehp_stats), 2)
+        for ehp_stat in ehp_stats:
+            self.assertAlmostEqual(ehp_stat.hull, 0)
+            self.assertAlmostEqual(ehp_stat.armor, 0)
+            self.assertAlmostEqual(ehp_stat.shield, 0)
+            self.assertAlmostEqual(ehp_stat.total, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
+
+    def test_many_ship_absent_iterator(self):
+        # Action
+        ehp_stats = self.fit.stats.get_ehp_many(
+            row for row in ((1, 1, 1, 1), (0, 3, 1, 0)))
+        # Verification
+        self.assertEqual(len(ehp_stats), 2)
+        for ehp_stat in ehp_stats:
+            self.assertAlmostEqual(ehp_stat.total, 0)
+        # Cleanup
+        self.assert_solsys_buffers_empty(self.fit.solar_system)
+        self.assert_log_entries(0)
@@ -266,6 +266,8 @@ class IntegrationTestCase(EosTestCase):
                 ('Fit', '_Fit__incoming_dmg_default'),
                 # Allowed to always reside on fit
                 ('Fit', '_Fit__incoming_dmg_rah'),
+                # Profile is shared and verified separately
+                ('Fit', '_Fit__character_profile'),
                 # Restriction registers are always in subscribers
                 ('Fit', '_FitMsgBroker__subscribers'),
                 # Service is allowed to keep list of restrictions permanently
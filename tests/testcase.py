@@ -138,27 +138,31 @@ class EosTestCase(TestCase):
         # Fetch attributes of the passed instance and check all of them
         try:
             obj_vars = tuple(vars(obj).items())
-        # If we cannot get attributes of an instance, try just iterating over it
+        # If we cannot get attributes of an instance, try its slots, and then
+        # just iterating over it
         except TypeError:
-            # Anything iterable but string
-            if isinstance(obj, Iterable) and not isinstance(obj, str):
-                obj_vars = []
-                # Get list of values this object exposes through iteration
-                available_values = list(value for value in obj)
-                # Try to find names for them and put named attributes to the
-                # list
-                for attr_name in dir(obj):
-                    attr_value = getattr(obj, attr_name)
-                    if attr_value not in available_values:
-                        continue
-                    obj_vars.append((attr_name, attr_value))
-                    available_values.remove(attr_value)
-                # For values without names, use None as name
-                for remaining_value in available_values:
-                    obj_vars.append((None, remaining_value))
-            # Do nothing if we have no idea what to do with object attributes
-            else:
-                return entry_count
+            obj_vars = self._get_obj_slot_vars(obj)
+            if not obj_vars:
+                # Anything iterable but string
+                if isinstance(obj, Iterable) and not isinstance(obj, str):
+                    obj_vars = []
+                    # Get list of values this object exposes through iteration
+                    available_values = list(value for value in obj)
+                    # Try to find names for them and put named attributes to the
+                    # list
+                    for attr_name in dir(obj):
+                        attr_value = getattr(obj, attr_name)
+                        if attr_value not in available_values:
+                            continue
+                        obj_vars.append((attr_name, attr_value))
+                        available_values.remove(attr_value)
+                    # For values without names, use None as name
+                    for remaining_value in available_values:
+                        obj_vars.append((None, remaining_value))
+                # Do nothing if we have no idea what to do with object
+                # attributes
+                else:
+                    return entry_count
         # Get names of object class and of all its parent classes
         obj_classnames = set()
         for obj_class in type(obj).__mro__:
@@ -207,6 +211,25 @@ class EosTestCase(TestCase):
                     ignore_attrs=ignore_attrs, checked_objs=checked_objs)
         return entry_count
 
+    @staticmethod
+    def _get_obj_slot_vars(obj):
+        """Get names and values of slots defined for object's class."""
+        slot_vars = []
+        for obj_class in type(obj).__mro__:
+            slots = obj_class.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for slot_name in slots:
+                # Private slot names are mangled just like regular attributes
+                if slot_name.startswith('__') and not slot_name.endswith('__'):
+                    slot_name = '_{}{}'.format(
+                        obj_class.__name__.lstrip('_'), slot_name)
+                try:
+                    slot_vars.append((slot_name, getattr(obj, slot_name)))
+                except AttributeError:
+                    continue
+        return slot_vars
+
     def _setup_args_capture(self, mock_obj, arg_list):
         """Capture all arguments passed to mock into list.
 